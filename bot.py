@@ -1,28 +1,130 @@
 """
 Nuguri's Casino 봇 - 메인 실행 파일
 """
+import time
+_PROCESS_STARTED = time.perf_counter()  # 임포트 시간까지 시작 시간에 포함
+
 import discord
 from discord.ext import commands
 import asyncio
+import importlib
 import logging
+import sys
 from config import Config
 from utils.logger import setup_logger
-from database.db_manager import DatabaseManager
+from utils.timer_wheel import TimerWheel
+from utils.outbound import OutboundScheduler
+from utils.animation import AnimationTicker
+from utils.side_effects import SideEffectExecutor
+from utils.member_lookup import MemberLookup
+from utils.command_sync import CommandSyncer
+from utils.metrics import metrics
+from utils.startup_profiler import StartupProfiler
+from utils.authorization import Authorization, NotAdmin
+from database.maintenance import DatabaseMaintenance
+from database.backup import BackupService
 
 # 로거 설정
 setup_logger()
 logger = logging.getLogger(__name__)
 
+# 시작 단계별 소요 시간 (python bot.py --startup-check 로 예산 확인)
+startup = StartupProfiler(budget=Config.STARTUP_BUDGET_SECONDS, origin=_PROCESS_STARTED)
+startup.record('imports', _PROCESS_STARTED)
+STARTUP_CHECK = '--startup-check' in sys.argv
+
+# 확장 목록
+EXTENSIONS = [
+    'cogs.roulette',  # 러시안 룰렛 게임
+    'cogs.blackjack',  # 블랙잭 게임
+    'cogs.slot_machine', #슬롯머신 게임
+    'cogs.history',  # 게임 기록
+    'cogs.admin',  # 관리자 명령어
+    'cogs.season',  # 시즌 초기화/순위
+    'cogs.maintenance',  # 백그라운드 유지보수 작업
+]
+
+# 확장이 의존하는 무거운 모듈 (로그인 중에 별도 스레드에서 미리 임포트)
+EXTENSION_DEPENDENCIES = [
+    'sqlalchemy.ext.asyncio',
+    'aiosqlite',
+    'database.models',
+    'database.db_manager',
+    'database.archive',
+    'database.season',
+    'game.russian_roulette',
+    'game.blackjack',
+    'game.slot_machine',
+    'game.history',
+    'game.reaper',
+]
+
 # 봇 설정
-intents = discord.Intents.default()
-intents.message_content = True
-intents.guilds = True
-intents.members = True  # 멤버 정보 접근 권한
+if Config.LEAN_GATEWAY:
+    # 슬래시 명령어만 쓰므로 서버/채널/역할 정보만 받음
+    # (메시지 이벤트와 멤버 목록을 받지 않고, 멤버는 필요할 때만 조회)
+    intents = discord.Intents.none()
+    intents.guilds = True
+    member_cache_flags = discord.MemberCacheFlags.none()
+else:
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.guilds = True
+    intents.members = True  # 멤버 정보 접근 권한
+    member_cache_flags = discord.MemberCacheFlags.from_intents(intents)
 
 bot = commands.Bot(
-    command_prefix='!',
+    command_prefix=commands.when_mentioned if Config.LEAN_GATEWAY else '!',
     intents=intents,
-    description="Nuguri's casino에 오신것을 환영합니다."
+    member_cache_flags=member_cache_flags,
+    chunk_guilds_at_startup=not Config.LEAN_GATEWAY,
+    enable_debug_events=Config.GATEWAY_METRICS,
+    description="Nuguri's casino에 오신것을 환영합니다.",
+    max_ratelimit_timeout=Config.MAX_RATELIMIT_WAIT
+)
+
+# 명령어 트리가 바뀐 경우에만 슬래시 커맨드 동기화
+bot.command_syncer = CommandSyncer(bot.tree, Config.COMMAND_SYNC_STATE)
+
+# 관리자 명령어 권한 (소유자/팀 멤버/관리자 역할을 메모리에 보관)
+bot.authorization = Authorization(
+    bot,
+    admin_role_ids=Config.ADMIN_ROLE_IDS,
+    refresh_interval=Config.ADMIN_REFRESH_MINUTES * 60
+)
+
+# DB 체크포인트/통계 갱신/빈 페이지 반환 (한가한 시간에 실행)
+bot.db_maintenance = DatabaseMaintenance(tick=60)
+
+# 온라인 백업 스냅샷 (최신 스냅샷은 통계/보고용 읽기 전용 DB)
+bot.backups = BackupService()
+
+# 멘션 외에 멤버 객체가 필요할 때 쓰는 지연 조회 캐시
+bot.members = MemberLookup(maxsize=Config.MEMBER_LOOKUP_SIZE, ttl=Config.MEMBER_LOOKUP_TTL)
+
+# 게임 턴/대기실 타이머 (모든 게임이 공유)
+bot.timer_wheel = TimerWheel(tick=Config.TIMER_TICK_SECONDS)
+
+# 채널별 메시지 전송 대기열 (핸들러는 등록만 하고 반환)
+bot.outbound = OutboundScheduler(
+    rate=Config.OUTBOUND_CHANNEL_RATE,
+    per=Config.OUTBOUND_CHANNEL_PER,
+    max_queue=Config.OUTBOUND_MAX_QUEUE
+)
+
+# 연출 화면 → 결과 공개를 틱 단위로 모아 처리 (슬롯머신 등)
+bot.animation = AnimationTicker(
+    bot.outbound,
+    tick=Config.ANIMATION_TICK_SECONDS,
+    instant_threshold=Config.ANIMATION_INSTANT_THRESHOLD,
+    channel_backlog=Config.ANIMATION_CHANNEL_BACKLOG
+)
+
+# 응답 이후 실행하는 비필수 Discord 호출 (타임아웃 등)
+bot.side_effects = SideEffectExecutor(
+    maxsize=Config.SIDE_EFFECT_QUEUE_SIZE,
+    workers=Config.SIDE_EFFECT_WORKERS,
+    max_retries=Config.SIDE_EFFECT_MAX_RETRIES
 )
 
 
@@ -34,12 +136,32 @@ async def on_ready():
     logger.info(f'연결된 서버: {len(bot.guilds)}개')
     logger.info('------')
     
-    # 슬래시 커맨드 동기화
+    if getattr(bot, 'connect_started', None) is not None:
+        startup.record('gateway_connect', bot.connect_started)
+        bot.connect_started = None
+    startup.mark_ready()
+    if STARTUP_CHECK:
+        asyncio.create_task(bot.close())
+        return
+    
+    # 슬래시 커맨드 동기화는 프로세스당 한 번만, 준비 완료를 막지 않도록 백그라운드로
+    if getattr(bot, 'command_sync_task', None) is None:
+        bot.command_sync_task = asyncio.create_task(sync_commands())
+
+
+async def sync_commands():
+    """명령어 트리가 바뀐 경우에만 동기화 (DEV_GUILD_ID가 있으면 해당 서버에만)"""
+    guild = None
+    if Config.DEV_GUILD_ID:
+        guild = discord.Object(id=Config.DEV_GUILD_ID)
+        bot.tree.copy_global_to(guild=guild)
+    
     try:
-        synced = await bot.tree.sync()
-        logger.info(f"동기화된 슬래시 커맨드: {len(synced)}개")
-        for cmd in synced:
-            logger.info(f"  - {cmd.name}")
+        synced = await bot.command_syncer.sync(guild=guild, force=Config.FORCE_COMMAND_SYNC)
+        if synced is not None:
+            logger.info(f"동기화된 슬래시 커맨드: {len(synced)}개")
+            for cmd in synced:
+                logger.info(f"  - {cmd.name}")
     except Exception as e:
         logger.error(f"커맨드 동기화 실패: {e}")
 
@@ -56,27 +178,90 @@ async def on_command_error(ctx, error):
         await ctx.send(f"오류가 발생했습니다: {str(error)}")
 
 
+@bot.tree.error
+async def on_app_command_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
+    """슬래시 명령어 에러 핸들링 (권한 체크 실패는 안내만)"""
+    if isinstance(error, NotAdmin):
+        if not interaction.response.is_done():
+            await interaction.response.send_message(str(error), ephemeral=True)
+        return
+    command = interaction.command.qualified_name if interaction.command else 'unknown'
+    logger.error(f"슬래시 명령어 에러 ({command}): {error}", exc_info=error)
+
+
 @bot.event
 async def on_guild_remove(guild):
     """봇이 서버에서 추방되거나 서버가 삭제될 때"""
     logger.info(f"서버에서 제거됨: {guild.name} (ID: {guild.id})")
+    bot.side_effects.capabilities.invalidate(guild.id)
+
+
+# 역할/권한이 바뀌면 서버별 권한 캐시 무효화
+@bot.listen('on_guild_role_create')
+@bot.listen('on_guild_role_delete')
+async def invalidate_capabilities_on_role(role):
+    bot.side_effects.capabilities.invalidate(role.guild.id)
+
+
+@bot.listen('on_guild_role_update')
+async def invalidate_capabilities_on_role_update(before, after):
+    bot.side_effects.capabilities.invalidate(after.guild.id)
+
+
+@bot.listen('on_member_update')
+async def invalidate_capabilities_on_bot_roles(before, after):
+    """봇 자신의 역할이 바뀐 경우만 무효화 (봇 자신의 멤버 업데이트는 members 인텐트 없이도 수신)"""
+    if after.id == bot.user.id and before.roles != after.roles:
+        bot.side_effects.capabilities.invalidate(after.guild.id)
+        bot.members.invalidate(after.guild.id)
+
+
+@bot.listen('on_interaction')
+async def remember_interaction_member(interaction):
+    """상호작용에 담겨 온 멤버 정보를 지연 조회 캐시에 보관"""
+    bot.members.remember(interaction.user)
+
+
+# 게이트웨이 수신량 측정 (GATEWAY_METRICS=true일 때만 발생하는 디버그 이벤트)
+@bot.listen('on_socket_raw_receive')
+async def record_gateway_bytes(msg):
+    metrics.inc('gateway.received_bytes', len(msg))
+
+
+@bot.listen('on_socket_event_type')
+async def record_gateway_event(event_type):
+    metrics.inc('gateway.events', labels={'type': event_type})
+
+
+def preimport_modules(names):
+    """모듈 미리 임포트 (asyncio.to_thread로 이벤트 루프 밖에서 실행)"""
+    for name in names:
+        importlib.import_module(name)
+
+
+async def init_database():
+    """데이터베이스 초기화 (SQLAlchemy 임포트도 스레드에서 처리)"""
+    try:
+        db_module = await asyncio.to_thread(importlib.import_module, 'database.db_manager')
+        db_manager = db_module.DatabaseManager()
+        await db_manager.init_database()
+        logger.info("데이터베이스 초기화 완료")
+    except Exception as e:
+        logger.error(f"데이터베이스 초기화 실패: {e}")
+
+
+async def load_extension(ext):
+    """Cog 확장 하나 로드"""
+    try:
+        await startup.track(f'extension:{ext}', bot.load_extension(ext))
+        logger.info(f'✓ 로드 완료: {ext}')
+    except Exception as e:
+        logger.error(f'✗ 로드 실패 {ext}: {e}')
 
 
 async def load_extensions():
-    """Cog 확장 로드"""
-    extensions = [
-        'cogs.roulette',  # 러시안 룰렛 게임
-        'cogs.blackjack',  # 블랙잭 게임
-        'cogs.slot_machine', #슬롯머신 게임
-        'cogs.admin',  # 관리자 명령어
-    ]
-    
-    for ext in extensions:
-        try:
-            await bot.load_extension(ext)
-            logger.info(f'✓ 로드 완료: {ext}')
-        except Exception as e:
-            logger.error(f'✗ 로드 실패 {ext}: {e}')
+    """Cog 확장 로드 (서로 독립적이므로 동시에)"""
+    await asyncio.gather(*(load_extension(ext) for ext in EXTENSIONS))
 
 
 async def main():
@@ -87,27 +272,53 @@ async def main():
     except ValueError as e:
         logger.error(f"설정 오류: {e}")
         logger.error("'.env' 파일을 확인하세요.")
-        return
-    
-    # 데이터베이스 초기화
-    try:
-        db_manager = DatabaseManager()
-        await db_manager.init_database()
-        logger.info("데이터베이스 초기화 완료")
-    except Exception as e:
-        logger.error(f"데이터베이스 초기화 실패: {e}")
-
+        return 1
     
-    # Cog 로드 및 봇 실행
     async with bot:
-        await load_extensions()
-        await bot.start(Config.BOT_TOKEN)
+        bot.timer_wheel.start()
+        bot.animation.start()
+        bot.side_effects.start()
+        
+        # DB 준비와 무거운 모듈 임포트를 로그인과 겹쳐서 진행
+        db_ready = asyncio.create_task(startup.track('db_init', init_database()))
+        preload = asyncio.create_task(
+            startup.track('preimport', asyncio.to_thread(preimport_modules, EXTENSION_DEPENDENCIES))
+        )
+        await startup.track('login', bot.login(Config.BOT_TOKEN))
+        authorization_ready = asyncio.create_task(
+            startup.track('authorization', bot.authorization.refresh())
+        )
+        
+        try:
+            await preload
+        except Exception as e:
+            logger.warning(f"모듈 미리 임포트 실패 (확장 로드 시 다시 시도): {e}")
+        await startup.track('extensions', load_extensions())
+        
+        # 명령어/테이블이 준비된 뒤에 게이트웨이 연결 (상호작용이 빈 핸들러로 가지 않도록)
+        await db_ready
+        bot.db_maintenance.start()
+        bot.backups.start()
+        try:
+            await authorization_ready
+        except Exception as e:
+            logger.error(f"관리자 목록 불러오기 실패 (주기적 갱신에서 재시도): {e}")
+        bot.authorization.start()
+        bot.connect_started = time.perf_counter()
+        await bot.connect()
+    
+    if STARTUP_CHECK:
+        return 1 if startup.time_to_ready is None or startup.over_budget else 0
+    return 0
 
 
 if __name__ == '__main__':
+    exit_code = 0
     try:
-        asyncio.run(main())
+        exit_code = asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("봇 종료 중...")
     except Exception as e:
-        logger.error(f"봇 실행 오류: {e}")
\ No newline at end of file
+        logger.error(f"봇 실행 오류: {e}")
+        exit_code = 1
+    sys.exit(exit_code)
@@ -4,10 +4,24 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
+import asyncio
 import logging
+from typing import Optional
+from datetime import datetime, timedelta
 from sqlalchemy import select
+from config import Config
 from database.db_manager import DatabaseManager
 from database.models import User
+from database.archive import GameArchiver
+from database.backup import list_snapshots
+from database.export import ExportError, HistoryExporter, default_path
+from database.guild_stats import guild_report
+from database.user_search import UserSearch
+from game.bulk_coins import BulkCoinManager
+from utils.authorization import admin_only
+from utils.metrics import metrics
+from utils.outbound import PRIORITY_RESULT, PRIORITY_NORMAL
+from utils.responder import AdaptiveResponder
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +32,21 @@ class AdminCommands(commands.Cog):
     EMOJI_ADMIN = "👑"
     EMOJI_MONEY = "💰"
     
+    CASINO_GAMES = {'slot': "🎰 슬롯머신", 'blackjack': "🃏 블랙잭", 'roulette': "🔫 러시안 룰렛"}
+    
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
+        self.archiver = GameArchiver(self.db_manager)
+        self._bulk_tasks = {}  # 일괄 작업 ID → 실행 중인 태스크
     
-    async def is_bot_owner(self, interaction: discord.Interaction) -> bool:
-        """봇 소유자인지 확인"""
-        app_info = await self.bot.application_info()
-        return interaction.user.id == app_info.owner.id
+    async def cog_unload(self):
+        # 진행 중인 일괄 작업은 running 상태로 남아 재개할 수 있음
+        for task in self._bulk_tasks.values():
+            task.cancel()
     
     @app_commands.command(name="코인지급", description="[관리자 전용] 유저에게 코인을 지급합니다")
+    @admin_only()
     @app_commands.describe(
         유저="코인을 지급할 유저",
         금액="지급할 코인 양"
@@ -39,27 +58,22 @@ class AdminCommands(commands.Cog):
         금액: int
     ):
         """코인 지급"""
-        await interaction.response.defer()
-        
-        # 권한 확인
-        if not await self.is_bot_owner(interaction):
-            await interaction.followup.send("❌ 봇 소유자만 사용할 수 있는 명령어입니다!")
-            return
+        reply = AdaptiveResponder.start(interaction)
         
         if 금액 <= 0:
-            await interaction.followup.send("❌ 양수만 입력 가능합니다!")
+            await reply.send("❌ 양수만 입력 가능합니다!")
             return
         
         try:
             async with self.db_manager.session() as session:
                 # 유저 조회 또는 생성
-                stmt = select(User).where(User.discord_id == str(유저.id))
+                stmt = select(User).where(User.discord_id == 유저.id)
                 result = await session.execute(stmt)
                 user = result.scalar_one_or_none()
                 
                 if not user:
                     user = User(
-                        discord_id=str(유저.id),
+                        discord_id=유저.id,
                         username=유저.display_name,
                         coins=1000
                     )
@@ -96,13 +110,14 @@ class AdminCommands(commands.Cog):
                     inline=True
                 )
                 
-                await interaction.followup.send(embed=embed)
+                await reply.send(embed=embed)
                 
         except Exception as e:
             logger.error(f"코인 지급 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 코인 지급 중 오류가 발생했습니다.")
+            await reply.send("❌ 코인 지급 중 오류가 발생했습니다.")
     
     @app_commands.command(name="코인차감", description="[관리자 전용] 유저의 코인을 차감합니다")
+    @admin_only()
     @app_commands.describe(
         유저="코인을 차감할 유저",
         금액="차감할 코인 양"
@@ -114,26 +129,21 @@ class AdminCommands(commands.Cog):
         금액: int
     ):
         """코인 차감"""
-        await interaction.response.defer()
-        
-        # 권한 확인
-        if not await self.is_bot_owner(interaction):
-            await interaction.followup.send("❌ 봇 소유자만 사용할 수 있는 명령어입니다!")
-            return
+        reply = AdaptiveResponder.start(interaction)
         
         if 금액 <= 0:
-            await interaction.followup.send("❌ 양수만 입력 가능합니다!")
+            await reply.send("❌ 양수만 입력 가능합니다!")
             return
         
         try:
             async with self.db_manager.session() as session:
                 # 유저 조회
-                stmt = select(User).where(User.discord_id == str(유저.id))
+                stmt = select(User).where(User.discord_id == 유저.id)
                 result = await session.execute(stmt)
                 user = result.scalar_one_or_none()
                 
                 if not user:
-                    await interaction.followup.send("❌ 해당 유저의 기록이 없습니다!")
+                    await reply.send("❌ 해당 유저의 기록이 없습니다!")
                     return
                 
                 before_coins = user.coins
@@ -174,13 +184,14 @@ class AdminCommands(commands.Cog):
                         inline=False
                     )
                 
-                await interaction.followup.send(embed=embed)
+                await reply.send(embed=embed)
                 
         except Exception as e:
             logger.error(f"코인 차감 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 코인 차감 중 오류가 발생했습니다.")
+            await reply.send("❌ 코인 차감 중 오류가 발생했습니다.")
     
     @app_commands.command(name="코인설정", description="[관리자 전용] 유저의 코인을 특정 값으로 설정합니다")
+    @admin_only()
     @app_commands.describe(
         유저="코인을 설정할 유저",
         금액="설정할 코인 양"
@@ -192,27 +203,22 @@ class AdminCommands(commands.Cog):
         금액: int
     ):
         """코인 설정"""
-        await interaction.response.defer()
-        
-        # 권한 확인
-        if not await self.is_bot_owner(interaction):
-            await interaction.followup.send("❌ 봇 소유자만 사용할 수 있는 명령어입니다!")
-            return
+        reply = AdaptiveResponder.start(interaction)
         
         if 금액 < 0:
-            await interaction.followup.send("❌ 음수는 설정할 수 없습니다!")
+            await reply.send("❌ 음수는 설정할 수 없습니다!")
             return
         
         try:
             async with self.db_manager.session() as session:
                 # 유저 조회 또는 생성
-                stmt = select(User).where(User.discord_id == str(유저.id))
+                stmt = select(User).where(User.discord_id == 유저.id)
                 result = await session.execute(stmt)
                 user = result.scalar_one_or_none()
                 
                 if not user:
                     user = User(
-                        discord_id=str(유저.id),
+                        discord_id=유저.id,
                         username=유저.display_name,
                         coins=금액
                     )
@@ -250,31 +256,230 @@ class AdminCommands(commands.Cog):
                     inline=True
                 )
                 
-                await interaction.followup.send(embed=embed)
+                await reply.send(embed=embed)
                 
         except Exception as e:
             logger.error(f"코인 설정 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 코인 설정 중 오류가 발생했습니다.")
+            await reply.send("❌ 코인 설정 중 오류가 발생했습니다.")
+    
+    @app_commands.command(name="일괄지급", description="[관리자 전용] 역할 또는 서버 전체 멤버에게 코인을 지급합니다")
+    @admin_only()
+    @app_commands.describe(
+        금액="멤버마다 지급할 코인 양",
+        역할="지급 대상 역할 (비우면 서버 전체)"
+    )
+    async def bulk_give_coins(self, interaction: discord.Interaction, 금액: int, 역할: Optional[discord.Role] = None):
+        """일괄 코인 지급"""
+        await self._start_bulk_job(interaction, BulkCoinManager.MODE_GRANT, 금액, 역할)
+    
+    @app_commands.command(name="일괄차감", description="[관리자 전용] 역할 또는 서버 전체 멤버의 코인을 차감합니다")
+    @admin_only()
+    @app_commands.describe(
+        금액="멤버마다 차감할 코인 양",
+        역할="차감 대상 역할 (비우면 서버 전체)"
+    )
+    async def bulk_take_coins(self, interaction: discord.Interaction, 금액: int, 역할: Optional[discord.Role] = None):
+        """일괄 코인 차감"""
+        await self._start_bulk_job(interaction, BulkCoinManager.MODE_REVOKE, 금액, 역할)
+    
+    @app_commands.command(name="일괄작업재개", description="[관리자 전용] 중단된 일괄 지급/차감 작업을 이어서 실행합니다")
+    @admin_only()
+    @app_commands.describe(작업번호="이어서 실행할 작업 번호")
+    async def resume_bulk_job(self, interaction: discord.Interaction, 작업번호: int):
+        """일괄 작업 재개"""
+        reply = AdaptiveResponder.start(interaction)
+        
+        task = self._bulk_tasks.get(작업번호)
+        if task is not None and not task.done():
+            await reply.send(f"❌ 작업 #{작업번호}은(는) 이미 실행 중입니다.")
+            return
+        
+        try:
+            async with self.db_manager.session() as session:
+                job = await BulkCoinManager(session).get_job(작업번호)
+                if not job or job.guild_id != interaction.guild_id:
+                    await reply.send("❌ 해당 작업을 찾을 수 없습니다!")
+                    return
+                if job.status == 'done':
+                    await reply.send(f"❌ 작업 #{job.id}은(는) 이미 완료되었습니다.")
+                    return
+                
+                job.status = 'running'
+            
+            message = await reply.send(embed=self._build_bulk_embed(job, "재개"), wait=True)
+            if message is not None:
+                async with self.db_manager.session() as session:
+                    job = await BulkCoinManager(session).get_job(작업번호)
+                    job.channel_id = message.channel.id
+                    job.message_id = message.id
+            self._launch_bulk_job(작업번호)
+            
+        except Exception as e:
+            logger.error(f"일괄 작업 재개 오류: {e}", exc_info=True)
+            await reply.send("❌ 일괄 작업 재개 중 오류가 발생했습니다.")
+    
+    async def _start_bulk_job(self, interaction: discord.Interaction, mode: str, amount: int, role: Optional[discord.Role]):
+        """일괄 작업을 만들고 진행 상황 메시지를 보낸 뒤 백그라운드에서 실행"""
+        reply = AdaptiveResponder.start(interaction)
+        
+        if interaction.guild_id is None:
+            await reply.send("❌ 서버 안에서만 사용할 수 있습니다.")
+            return
+        
+        # @everyone 역할은 서버 전체와 같음
+        role_id = role.id if role is not None and role.id != interaction.guild_id else None
+        
+        try:
+            async with self.db_manager.session() as session:
+                job = await BulkCoinManager(session).create_job(
+                    guild_id=interaction.guild_id,
+                    role_id=role_id,
+                    mode=mode,
+                    amount=amount,
+                    requested_by=interaction.user.id,
+                    channel_id=interaction.channel_id
+                )
+            
+            message = await reply.send(embed=self._build_bulk_embed(job, "시작"), wait=True)
+            if message is not None:
+                async with self.db_manager.session() as session:
+                    job = await BulkCoinManager(session).get_job(job.id)
+                    job.message_id = message.id
+            self._launch_bulk_job(job.id)
+            
+        except ValueError as e:
+            await reply.send(f"❌ {str(e)}")
+        except Exception as e:
+            logger.error(f"일괄 작업 시작 오류: {e}", exc_info=True)
+            await reply.send("❌ 일괄 작업 시작 중 오류가 발생했습니다.")
+    
+    def _launch_bulk_job(self, job_id: int):
+        self._bulk_tasks[job_id] = asyncio.create_task(
+            self._run_bulk_job(job_id), name=f'bulk-coins-{job_id}'
+        )
+    
+    async def _run_bulk_job(self, job_id: int):
+        """
+        멤버 목록을 ID 순으로 페이지 단위로 받아 청크마다 짧은 트랜잭션으로 반영
+        
+        멤버 캐시 없이 REST 멤버 목록(1000명 단위)을 스트리밍하며, 청크 사이에
+        잠시 쉬어 다른 게임의 DB 쓰기가 오래 기다리지 않도록 합니다.
+        """
+        chunk_size = Config.BULK_COIN_CHUNK_SIZE
+        
+        async with self.db_manager.session() as session:
+            job = await BulkCoinManager(session).get_job(job_id)
+        guild_id = job.guild_id
+        after = job.cursor or 0
+        
+        try:
+            while True:
+                page = await self.bot.http.get_members(guild_id, 1000, after or None)
+                if not page:
+                    break
+                
+                for start in range(0, len(page), chunk_size):
+                    chunk = page[start:start + chunk_size]
+                    targets = [
+                        (int(m['user']['id']), self._raw_member_name(m))
+                        for m in chunk if self._is_bulk_target(m, job.role_id)
+                    ]
+                    
+                    async with self.db_manager.session() as session:
+                        bulk_manager = BulkCoinManager(session)
+                        job = await bulk_manager.get_job(job_id)
+                        await bulk_manager.apply_chunk(job, targets, int(chunk[-1]['user']['id']), len(chunk))
+                    
+                    metrics.inc('bulk_coins.applied', len(targets), labels={'mode': job.mode})
+                    self._update_bulk_message(job, "진행 중")
+                    await asyncio.sleep(Config.BULK_COIN_CHUNK_DELAY)
+                
+                after = int(page[-1]['user']['id'])
+                if len(page) < 1000:
+                    break
+            
+            async with self.db_manager.session() as session:
+                bulk_manager = BulkCoinManager(session)
+                job = await bulk_manager.get_job(job_id)
+                await bulk_manager.finish(job, 'done')
+            self._update_bulk_message(job, "완료", priority=PRIORITY_RESULT)
+            logger.info(f"일괄 작업 #{job_id} 완료: 확인 {job.scanned}명, 반영 {job.applied}명")
+            
+        except asyncio.CancelledError:
+            # 종료 중 - 상태를 running으로 두고 재개 가능하게
+            raise
+        except Exception as e:
+            logger.error(f"일괄 작업 #{job_id} 실패: {e}", exc_info=True)
+            async with self.db_manager.session() as session:
+                bulk_manager = BulkCoinManager(session)
+                job = await bulk_manager.get_job(job_id)
+                await bulk_manager.finish(job, 'failed')
+            hint = "멤버 목록 권한이 없습니다 (Server Members Intent 필요)" if isinstance(e, discord.Forbidden) else "오류 발생"
+            self._update_bulk_message(job, f"중단 - {hint}, `/일괄작업재개 {job_id}`로 이어서 실행", priority=PRIORITY_RESULT)
+        finally:
+            self._bulk_tasks.pop(job_id, None)
+    
+    @staticmethod
+    def _is_bulk_target(raw_member: dict, role_id: Optional[int]) -> bool:
+        """봇이 아니고 대상 역할을 가진 멤버인지 (REST 원본 데이터 기준 - 역할 ID가 문자열)"""
+        if raw_member['user'].get('bot'):
+            return False
+        return role_id is None or str(role_id) in raw_member.get('roles', ())
+    
+    @staticmethod
+    def _raw_member_name(raw_member: dict) -> str:
+        user = raw_member['user']
+        return raw_member.get('nick') or user.get('global_name') or user['username']
+    
+    def _update_bulk_message(self, job, state: str, priority: int = PRIORITY_NORMAL):
+        """진행 상황 메시지 편집 (대기 중인 편집은 전송 스케줄러가 합침)"""
+        if not job.message_id:
+            return
+        channel = self.bot.get_channel(job.channel_id)
+        if channel is None:
+            return
+        message = channel.get_partial_message(job.message_id)
+        self.bot.outbound.edit(message, priority=priority, embed=self._build_bulk_embed(job, state))
+    
+    def _build_bulk_embed(self, job, state: str) -> discord.Embed:
+        granting = job.mode == BulkCoinManager.MODE_GRANT
+        embed = discord.Embed(
+            title=f"{self.EMOJI_ADMIN} 일괄 코인 {'지급' if granting else '차감'} #{job.id}",
+            description=f"상태: **{state}**",
+            color=discord.Color.green() if granting else discord.Color.red()
+        )
+        embed.add_field(
+            name="대상",
+            value=f"<@&{job.role_id}>" if job.role_id else "서버 전체",
+            inline=True
+        )
+        embed.add_field(
+            name="금액",
+            value=f"{self.EMOJI_MONEY} {'+' if granting else '-'}{job.amount:,} 코인",
+            inline=True
+        )
+        embed.add_field(
+            name="진행",
+            value=f"확인 {job.scanned or 0:,}명 / 반영 {job.applied or 0:,}명",
+            inline=False
+        )
+        return embed
     
     @app_commands.command(name="유저정보", description="[관리자 전용] 유저의 상세 정보를 확인합니다")
+    @admin_only()
     @app_commands.describe(유저="정보를 확인할 유저")
     async def user_info(self, interaction: discord.Interaction, 유저: discord.Member):
         """유저 정보 조회"""
-        await interaction.response.defer()
-        
-        # 권한 확인
-        if not await self.is_bot_owner(interaction):
-            await interaction.followup.send("❌ 봇 소유자만 사용할 수 있는 명령어입니다!")
-            return
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
-                stmt = select(User).where(User.discord_id == str(유저.id))
+                stmt = select(User).where(User.discord_id == 유저.id)
                 result = await session.execute(stmt)
                 user = result.scalar_one_or_none()
                 
                 if not user:
-                    await interaction.followup.send("❌ 해당 유저의 기록이 없습니다!")
+                    await reply.send("❌ 해당 유저의 기록이 없습니다!")
                     return
                 
                 embed = discord.Embed(
@@ -323,11 +528,361 @@ class AdminCommands(commands.Cog):
                     inline=True
                 )
                 
-                await interaction.followup.send(embed=embed)
+                await reply.send(embed=embed)
                 
         except Exception as e:
             logger.error(f"유저 정보 조회 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 유저 정보 조회 중 오류가 발생했습니다.")
+            await reply.send("❌ 유저 정보 조회 중 오류가 발생했습니다.")
+
+    
+    @app_commands.command(name="유저검색", description="[관리자 전용] 이름(예전 이름 포함) 일부로 유저를 찾습니다")
+    @admin_only()
+    @app_commands.describe(
+        이름="찾을 이름의 일부",
+        페이지="결과 페이지 (10명씩)"
+    )
+    async def search_users(self, interaction: discord.Interaction, 이름: str, 페이지: int = 1):
+        """이름으로 유저 검색"""
+        reply = AdaptiveResponder.start(interaction)
+        page_size = 10
+        page = max(1, 페이지)
+        
+        try:
+            async with self.db_manager.session() as session:
+                # 다음 페이지 여부를 알기 위해 한 명 더 조회
+                rows = await UserSearch(session).search(이름, offset=(page - 1) * page_size, limit=page_size + 1)
+            
+            has_next = len(rows) > page_size
+            rows = rows[:page_size]
+            
+            embed = discord.Embed(
+                title=f"{self.EMOJI_ADMIN} 유저 검색: {이름}",
+                color=discord.Color.blue()
+            )
+            
+            if not rows:
+                embed.description = "일치하는 유저가 없습니다."
+            else:
+                for row in rows:
+                    current = row['current_name'] or "(이번 시즌 기록 없음)"
+                    coins = f"{row['coins']:,} 코인" if row['coins'] is not None else "-"
+                    embed.add_field(
+                        name=f"{current} ({row['discord_id']})",
+                        value=f"<@{row['discord_id']}> · {coins}\n일치한 이름: {row['matched_names']}"[:1024],
+                        inline=False
+                    )
+            
+            footer = f"{page}페이지"
+            if has_next:
+                footer += f" · 다음: /유저검색 이름:{이름} 페이지:{page + 1}"
+            embed.set_footer(text=footer)
+            
+            await reply.send(embed=embed)
+            
+        except Exception as e:
+            logger.error(f"유저 검색 오류: {e}", exc_info=True)
+            await reply.send("❌ 유저 검색 중 오류가 발생했습니다.")
+    
+    @app_commands.command(name="아카이브조회", description="[관리자 전용] 아카이브된 유저의 게임 기록을 조회합니다")
+    @admin_only()
+    @app_commands.describe(
+        유저="기록을 조회할 유저",
+        게임="조회할 게임 종류",
+        일수="최근 며칠간의 기록 (기본: 30일)"
+    )
+    @app_commands.choices(게임=[
+        app_commands.Choice(name="슬롯머신", value="slot_plays"),
+        app_commands.Choice(name="블랙잭", value="blackjack_games"),
+        app_commands.Choice(name="러시안 룰렛", value="roulette_games"),
+    ])
+    async def archive_history(
+        self,
+        interaction: discord.Interaction,
+        유저: discord.Member,
+        게임: app_commands.Choice[str],
+        일수: int = 30
+    ):
+        """아카이브 기록 조회"""
+        reply = AdaptiveResponder.start(interaction)
+        
+        try:
+            start = (datetime.utcnow() - timedelta(days=일수)).date()
+            records = await self.archiver.query_history(
+                게임.value,
+                start=start,
+                discord_id=유저.id,
+                limit=10
+            )
+            
+            if not records:
+                await reply.send("❌ 해당 기간에 아카이브된 기록이 없습니다!")
+                return
+            
+            embed = discord.Embed(
+                title=f"{self.EMOJI_ADMIN} 아카이브 기록 - {게임.name}",
+                description=f"{유저.mention}님의 최근 {일수}일 기록 (최대 10건)",
+                color=discord.Color.dark_grey()
+            )
+            
+            for record in records:
+                if 게임.value == GameArchiver.SLOT_TABLE:
+                    embed.add_field(
+                        name=record['played_at'][:16].replace('T', ' '),
+                        value=(
+                            f"{record['reel1']}{record['reel2']}{record['reel3']} "
+                            f"배팅 {record['bet_amount']:,} → 지급 {record['payout']:,}"
+                        ),
+                        inline=False
+                    )
+                else:
+                    game = record['game']
+                    player = next(
+                        p for p in record['players'] if str(p['discord_id']) == str(유저.id)
+                    )
+                    ended_at = (game['finished_at'] or game['created_at'])[:16].replace('T', ' ')
+                    if 게임.value == 'blackjack_games':
+                        detail = f"결과: {player['result'] or '-'} / 배팅 {player['bet_amount']:,} → 지급 {player['payout']:,}"
+                    else:
+                        detail = "승리" if player['is_winner'] else ("생존" if player['is_alive'] else "탈락")
+                    embed.add_field(
+                        name=f"게임 #{game['id']} ({ended_at}, {game['status']})",
+                        value=detail,
+                        inline=False
+                    )
+            
+            await reply.send(embed=embed)
+            
+        except Exception as e:
+            logger.error(f"아카이브 조회 오류: {e}", exc_info=True)
+            await reply.send("❌ 아카이브 조회 중 오류가 발생했습니다.")
+
+    
+    @app_commands.command(name="카지노통계", description="[관리자 전용] 이 서버의 게임별 플레이/배팅/하우스 수익을 확인합니다")
+    @admin_only()
+    @app_commands.describe(일수="최근 며칠간의 통계 (기본: 7일)")
+    async def casino_stats(self, interaction: discord.Interaction, 일수: int = 7):
+        """서버 카지노 통계 (서버별 일간 집계만 읽음)"""
+        reply = AdaptiveResponder.start(interaction)
+        
+        if interaction.guild is None:
+            await reply.send("❌ 서버 안에서만 사용할 수 있습니다.")
+            return
+        
+        try:
+            since = (datetime.utcnow() - timedelta(days=max(일수, 1) - 1)).date()
+            async with self.db_manager.session() as session:
+                report = await guild_report(session, interaction.guild.id, since)
+            
+            if not report['games']:
+                await reply.send("❌ 해당 기간의 게임 기록이 없습니다!")
+                return
+            
+            embed = discord.Embed(
+                title=f"{self.EMOJI_ADMIN} 카지노 통계",
+                description=f"**{interaction.guild.name}** 최근 {일수}일 · 활동 플레이어 {report['players']:,}명",
+                color=discord.Color.dark_gold()
+            )
+            
+            for game, name in self.CASINO_GAMES.items():
+                stats = report['games'].get(game)
+                if stats is None:
+                    continue
+                profit = stats['wagered'] - stats['paid_out']
+                unit = "스핀" if game == 'slot' else "게임"
+                embed.add_field(
+                    name=name,
+                    value=(
+                        f"{stats['rounds']:,}{unit} · 플레이어 {stats['players']:,}명\n"
+                        f"배팅 {stats['wagered']:,} / 지급 {stats['paid_out']:,}\n"
+                        f"하우스 수익 {'+' if profit >= 0 else ''}{profit:,}"
+                    ),
+                    inline=True
+                )
+            
+            spins = [f"`{day:%m-%d}` {rounds:,}" for day, game, rounds in report['daily'] if game == 'slot']
+            if spins:
+                embed.add_field(name="일별 스핀", value="\n".join(spins[-14:]), inline=False)
+            
+            embed.set_footer(text=f"집계 주기 {Config.GUILD_STATS_INTERVAL_MINUTES:g}분 · 날짜는 UTC 기준")
+            await reply.send(embed=embed)
+        
+        except Exception as e:
+            logger.error(f"카지노 통계 조회 오류: {e}", exc_info=True)
+            await reply.send("❌ 통계 조회 중 오류가 발생했습니다.")
+
+    
+    @app_commands.command(name="봇지표", description="[관리자 전용] 내부 지표를 확인합니다")
+    @admin_only()
+    @app_commands.describe(접두어="특정 이름으로 시작하는 지표만 표시 (예: timer_wheel)")
+    async def show_metrics(self, interaction: discord.Interaction, 접두어: str = ''):
+        """내부 지표 조회"""
+        reply = AdaptiveResponder.start(interaction)
+        
+        snapshot = metrics.snapshot(접두어)
+        
+        embed = discord.Embed(
+            title=f"{self.EMOJI_ADMIN} 봇 지표",
+            color=discord.Color.dark_teal()
+        )
+        
+        if snapshot['gauges']:
+            embed.add_field(
+                name="게이지",
+                value="\n".join(f"`{k}`: {v:,.2f}" for k, v in sorted(snapshot['gauges'].items()))[:1024],
+                inline=False
+            )
+        
+        if snapshot['counters']:
+            embed.add_field(
+                name="카운터",
+                value="\n".join(f"`{k}`: {v:,}" for k, v in sorted(snapshot['counters'].items()))[:1024],
+                inline=False
+            )
+        
+        if snapshot['histograms']:
+            embed.add_field(
+                name="히스토그램 (초)",
+                value="\n".join(
+                    f"`{k}`: n={h['count']:,} avg={h['avg']:.3f} p95≤{h['p95']:.3f} max={h['max']:.3f}"
+                    for k, h in sorted(snapshot['histograms'].items())
+                )[:1024],
+                inline=False
+            )
+        
+        if not embed.fields:
+            embed.description = "수집된 지표가 없습니다."
+        
+        await reply.send(embed=embed)
+
+    
+    @app_commands.command(name="백업", description="[관리자 전용] DB 스냅샷을 지금 만들고 최근 스냅샷을 확인합니다")
+    @admin_only()
+    async def backup_now(self, interaction: discord.Interaction):
+        """온라인 백업 실행 (새 스냅샷이 분석 DB가 됨)"""
+        reply = AdaptiveResponder.start(interaction)
+        
+        try:
+            await reply.defer()
+            result = await self.bot.backups.snapshot()
+            
+            embed = discord.Embed(
+                title=f"{self.EMOJI_ADMIN} DB 백업",
+                description=(
+                    f"✅ `{result['path'].name}` 생성 "
+                    f"({result['pages']:,}페이지, {result['seconds']:.1f}초, 재시작 {result['restarts']}회)"
+                ),
+                color=discord.Color.dark_teal()
+            )
+            
+            snapshots = list_snapshots(self.bot.backups.backup_dir)[-5:]
+            embed.add_field(
+                name=f"최근 스냅샷 (최대 {self.bot.backups.keep}개 보관)",
+                value="\n".join(
+                    f"`{path.name}` {path.stat().st_size / 1024 / 1024:,.1f}MB" for path in reversed(snapshots)
+                ),
+                inline=False
+            )
+            
+            await reply.send(embed=embed)
+        except Exception as e:
+            logger.error(f"DB 백업 오류: {e}", exc_info=True)
+            await reply.send("❌ DB 백업 중 오류가 발생했습니다.")
+
+    
+    @app_commands.command(name="기록내보내기", description="[관리자 전용] 게임 기록 원본을 CSV/Parquet 파일로 내보냅니다")
+    @admin_only()
+    @app_commands.describe(
+        테이블="내보낼 기록",
+        형식="파일 형식",
+        일수="최근 며칠간의 기록 (0이면 전체)",
+        이서버만="이 서버의 게임만"
+    )
+    @app_commands.choices(
+        테이블=[
+            app_commands.Choice(name="슬롯머신", value="slot_plays"),
+            app_commands.Choice(name="블랙잭 참가자", value="blackjack_players"),
+            app_commands.Choice(name="러시안 룰렛 참가자", value="roulette_players"),
+        ],
+        형식=[
+            app_commands.Choice(name="CSV", value="csv"),
+            app_commands.Choice(name="Parquet", value="parquet"),
+        ]
+    )
+    async def export_history(
+        self,
+        interaction: discord.Interaction,
+        테이블: app_commands.Choice[str],
+        형식: app_commands.Choice[str],
+        일수: int = 30,
+        이서버만: bool = False
+    ):
+        """분석용 원본 기록 내보내기 (백업 스냅샷에서 읽음)"""
+        reply = AdaptiveResponder.start(interaction)
+        
+        if 이서버만 and interaction.guild is None:
+            await reply.send("❌ 서버 안에서만 사용할 수 있습니다.")
+            return
+        
+        try:
+            await reply.defer()
+            # 스냅샷이 아직 없으면 먼저 만들어 원본 DB를 오래 읽지 않도록
+            if DatabaseManager.analytics_taken_at() is None:
+                await self.bot.backups.snapshot()
+            
+            start = (datetime.utcnow() - timedelta(days=일수)).date() if 일수 > 0 else None
+            stats = await HistoryExporter(self.db_manager).export(
+                테이블.value,
+                default_path(테이블.value, 형식.value),
+                fmt=형식.value,
+                start=start,
+                guild_id=interaction.guild.id if 이서버만 else None
+            )
+            
+            summary = (
+                f"✅ {테이블.name} {stats['rows']:,}행 내보내기 완료 "
+                f"({stats['bytes'] / 1024 / 1024:,.1f}MB, 기준 "
+                f"{DatabaseManager.analytics_taken_at():%Y-%m-%d %H:%M} UTC)"
+            )
+            limit = interaction.guild.filesize_limit if interaction.guild else discord.utils.DEFAULT_FILE_SIZE_LIMIT_BYTES
+            if stats['bytes'] <= limit:
+                await reply.send(summary, file=discord.File(stats['path']))
+            else:
+                await reply.send(f"{summary}\n파일이 커서 첨부하지 못했습니다: `{stats['path']}`")
+            
+        except ExportError as e:
+            await reply.send(f"❌ {e}")
+        except Exception as e:
+            logger.error(f"기록 내보내기 오류: {e}", exc_info=True)
+            await reply.send("❌ 기록 내보내기 중 오류가 발생했습니다.")
+
+    
+    @app_commands.command(name="명령어동기화", description="[관리자 전용] 슬래시 명령어를 강제로 동기화합니다")
+    @admin_only()
+    @app_commands.describe(범위="전역 또는 현재 서버에만 동기화")
+    @app_commands.choices(범위=[
+        app_commands.Choice(name="전역", value="global"),
+        app_commands.Choice(name="이 서버 (개발용)", value="guild"),
+    ])
+    async def sync_commands(self, interaction: discord.Interaction, 범위: str = "global"):
+        """명령어 트리 해시와 관계없이 동기화"""
+        reply = AdaptiveResponder.start(interaction)
+        
+        guild = None
+        if 범위 == "guild":
+            if interaction.guild is None:
+                await reply.send("❌ 서버 안에서만 사용할 수 있습니다.")
+                return
+            guild = interaction.guild
+            self.bot.tree.copy_global_to(guild=guild)
+        
+        try:
+            await reply.defer()
+            synced = await self.bot.command_syncer.sync(guild=guild, force=True)
+            target = f"서버 {guild.name}" if guild else "전역"
+            await reply.send(f"✅ {target}에 슬래시 커맨드 {len(synced)}개를 동기화했습니다.")
+        except Exception as e:
+            logger.error(f"명령어 동기화 오류: {e}", exc_info=True)
+            await reply.send("❌ 명령어 동기화 중 오류가 발생했습니다.")
 
 
 async def setup(bot: commands.Bot):
@@ -5,15 +5,73 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import logging
-from typing import Optional
+from typing import Optional, List
+from config import Config
 from database.db_manager import DatabaseManager
+from database.models import BlackjackGame, BlackjackPlayer
 from game.blackjack import BlackjackGameManager, Hand
+from utils.outbound import PRIORITY_RESULT, PRIORITY_NORMAL
+from utils.responder import AdaptiveResponder
 
 logger = logging.getLogger(__name__)
 
 
+class BlackjackActionButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r'bj:(?P<action>hit|stand|double|split|insurance):(?P<game_id>[0-9]+)'
+):
+    """
+    블랙잭 액션 버튼
+    
+    custom_id에 액션과 게임 ID를 담아 두므로 봇이 재시작되어도 동작하며,
+    채널 조회 없이 게임을 기본키로 바로 가져옵니다.
+    """
+    
+    ACTIONS = {
+        'hit': ('히트', '🃏', discord.ButtonStyle.primary),
+        'stand': ('스탠드', '✋', discord.ButtonStyle.success),
+        'double': ('더블다운', '💰', discord.ButtonStyle.secondary),
+        'split': ('스플릿', '✂️', discord.ButtonStyle.secondary),
+        'insurance': ('인슈어런스', '🛡️', discord.ButtonStyle.secondary),
+    }
+    
+    def __init__(self, action: str, game_id: int):
+        label, emoji, style = self.ACTIONS[action]
+        super().__init__(
+            discord.ui.Button(
+                label=label,
+                emoji=emoji,
+                style=style,
+                custom_id=f'bj:{action}:{game_id}'
+            )
+        )
+        self.action = action
+        self.game_id = game_id
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match['action'], int(match['game_id']))
+    
+    @classmethod
+    def view_for(cls, game_id: int) -> discord.ui.View:
+        """게임의 액션 버튼 뷰 생성"""
+        view = discord.ui.View(timeout=None)
+        for action in cls.ACTIONS:
+            view.add_item(cls(action, game_id))
+        return view
+    
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog('BlackjackCommands')
+        await cog.handle_action(interaction, self.action, self.game_id)
+
+
 class BlackjackCommands(commands.Cog):
-    """블랙잭 게임 명령어"""
+    """
+    블랙잭 게임 명령어
+    
+    게임마다 테이블 메시지 하나를 두고 상태가 바뀔 때마다 편집합니다.
+    행동한 플레이어에게는 본인에게만 보이는 확인 메시지를 보냅니다.
+    """
     
     EMOJI_SPADE = "♠️"
     EMOJI_HEART = "♥️"
@@ -24,6 +82,28 @@ class BlackjackCommands(commands.Cog):
     EMOJI_TROPHY = "🏆"
     EMOJI_BOOM = "💥"
     
+    RESULT_EMOJI = {
+        'blackjack': '🎊',
+        'win': '🏆',
+        'lose': '💔',
+        'push': '🤝',
+        'refund': '↩️',
+    }
+    
+    RESULT_TEXT = {
+        'blackjack': '블랙잭 승리!',
+        'win': '승리!',
+        'lose': '패배',
+        'push': '무승부',
+        'refund': '환불',
+    }
+    
+    STATUS_TEXT = {
+        'stand': '✋ 스탠드',
+        'bust': f'{EMOJI_BOOM} 버스트',
+        'blackjack': '🎊 블랙잭',
+    }
+    
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
@@ -31,7 +111,7 @@ class BlackjackCommands(commands.Cog):
     @app_commands.command(name="블랙잭시작", description="블랙잭 게임을 생성합니다")
     async def create_blackjack(self, interaction: discord.Interaction):
         """블랙잭 게임 생성"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
@@ -39,621 +119,503 @@ class BlackjackCommands(commands.Cog):
                 
                 game = await game_manager.create_game(
                     guild_id=interaction.guild_id,
-                    channel_id=interaction.channel_id,
+                    channel_id=reply.channel_id,
                     host_id=interaction.user.id,
                     host_name=interaction.user.display_name
                 )
                 
                 if not game:
-                    await interaction.followup.send("❌ 이미 진행 중인 게임이 있습니다!")
+                    await reply.send("❌ 이미 진행 중인 게임이 있습니다!")
                     return
                 
-                embed = discord.Embed(
-                    title=f"{self.EMOJI_CARDS} 블랙잭 게임 생성!",
-                    description=(
-                        f"**딜러:** {interaction.user.mention}\n"
-                        f"**최소 배팅:** {BlackjackGameManager.MIN_BET} 코인\n"
-                        f"**최대 인원:** {BlackjackGameManager.MAX_PLAYERS}명\n\n"
-                        f"참가하려면 `/블랙잭참가` 명령어를 사용하세요!\n"
-                        f"모두 참가했으면 `/딜카드` 명령어로 시작하세요!"
-                    ),
-                    color=discord.Color.green()
-                )
+                self._arm_timer(game)
                 
-                embed.add_field(
-                    name="📋 배당률",
-                    value=(
-                        f"블랙잭: **{BlackjackGameManager.BLACKJACK_PAYOUT}배** (1.5배)\n"
-                        f"일반 승리: **{BlackjackGameManager.WIN_PAYOUT}배** (1배)\n"
-                        f"무승부: 배팅 반환"
-                    ),
-                    inline=False
+                # 대기실 메시지 - 참가할 때마다 이 메시지를 편집
+                message = await self.bot.outbound.send(
+                    reply,
+                    channel_id=reply.channel_id,
+                    priority=PRIORITY_RESULT,
+                    embed=self._build_lobby_embed(game, []),
+                    wait=True
                 )
-                
-                await interaction.followup.send(embed=embed)
-                
+                if message:
+                    game.table_message_id = message.id
+        
         except Exception as e:
             logger.error(f"블랙잭 생성 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 게임 생성 중 오류가 발생했습니다.")
+            await reply.send("❌ 게임 생성 중 오류가 발생했습니다.")
     
     @app_commands.command(name="블랙잭참가", description="블랙잭 게임에 참가합니다")
     @app_commands.describe(배팅="배팅할 코인 (최소 10)")
     async def join_blackjack(self, interaction: discord.Interaction, 배팅: int):
         """블랙잭 게임 참가"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction, ephemeral=True)
         
         try:
             async with self.db_manager.session() as session:
                 game_manager = BlackjackGameManager(session)
                 
                 player = await game_manager.join_game(
-                    channel_id=interaction.channel_id,
+                    channel_id=reply.channel_id,
                     player_id=interaction.user.id,
                     player_name=interaction.user.display_name,
                     bet_amount=배팅
                 )
                 
                 if not player:
-                    await interaction.followup.send("❌ 참가할 수 있는 게임이 없습니다!")
+                    await reply.send("❌ 참가할 수 있는 게임이 없습니다!", ephemeral=True)
                     return
                 
-                game = await game_manager.get_current_game(interaction.channel_id)
+                game = await game_manager.get_game(player.game_id)
                 all_players = await game_manager.get_players(game.id)
-                
-                embed = discord.Embed(
-                    title=f"{self.EMOJI_CARDS} 게임 참가 완료!",
-                    description=f"{interaction.user.mention}님이 **{배팅:,}** 코인으로 참가했습니다!",
-                    color=discord.Color.blue()
-                )
-                
-                players_text = "\n".join([
-                    f"{self._get_number_emoji(p.join_order)} **{p.username}** - {p.bet_amount:,} 코인"
-                    for p in all_players
-                ])
-                
-                embed.add_field(
-                    name=f"📋 참가자 ({len(all_players)}/{BlackjackGameManager.MAX_PLAYERS}명)",
-                    value=players_text,
-                    inline=False
+                await self._update_table(game, embed=self._build_lobby_embed(game, all_players))
+                
+                self.bot.outbound.send(
+                    reply,
+                    channel_id=reply.channel_id,
+                    content=(
+                        f"{self.EMOJI_CARDS} **{배팅:,}** 코인으로 참가했습니다! "
+                        f"({len(all_players)}/{BlackjackGameManager.MAX_PLAYERS}명)"
+                    ),
+                    ephemeral=True
                 )
-                
-                if len(all_players) >= 1:
-                    embed.add_field(
-                        name="✅ 게임 시작 가능",
-                        value="딜러가 `/딜카드` 명령어로 게임을 시작할 수 있습니다!",
-                        inline=False
-                    )
-                
-                await interaction.followup.send(embed=embed)
-                
+        
         except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
+            await reply.send(f"❌ {str(e)}", ephemeral=True)
         except Exception as e:
             logger.error(f"블랙잭 참가 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 게임 참가 중 오류가 발생했습니다.")
+            await reply.send("❌ 게임 참가 중 오류가 발생했습니다.", ephemeral=True)
     
     @app_commands.command(name="딜카드", description="카드를 배분하고 게임을 시작합니다 (호스트 전용)")
     async def deal_cards(self, interaction: discord.Interaction):
         """카드 배분"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
                 game_manager = BlackjackGameManager(session)
                 
                 result = await game_manager.start_game(
-                    channel_id=interaction.channel_id,
+                    channel_id=reply.channel_id,
                     starter_id=interaction.user.id
                 )
                 
                 if not result:
-                    await interaction.followup.send("❌ 시작할 수 있는 게임이 없습니다!")
+                    await reply.send("❌ 시작할 수 있는 게임이 없습니다!")
                     return
                 
-                game = result['game']
-                players = result['players']
-                dealer_hand = result['dealer_hand']
+                game = await self._sync_timer(game_manager, result['game'])
                 
-                embed = discord.Embed(
-                    title=f"{self.EMOJI_CARDS} 블랙잭 게임 시작!",
-                    description="카드가 배분되었습니다!",
-                    color=discord.Color.gold()
+                # 테이블 메시지를 새로 올리고 이후 진행은 모두 이 메시지를 편집
+                message = await self.bot.outbound.send(
+                    reply,
+                    channel_id=reply.channel_id,
+                    priority=PRIORITY_RESULT,
+                    embed=self._build_table_embed(game, result['players'], "카드가 배분되었습니다!"),
+                    view=self._action_view(game),
+                    wait=True
                 )
-                
-                # 딜러 카드 (1장만 공개)
-                dealer_cards_str = f"{dealer_hand.cards[0]} 🎴"
-                embed.add_field(
-                    name="🎩 딜러",
-                    value=dealer_cards_str,
-                    inline=False
-                )
-                
-                # 플레이어들 카드
-                for player in players:
-                    hand = Hand.from_json(player.cards)
-                    hand_str = str(hand)
-                    value = hand.value()
-                    status = ""
-                    
-                    if hand.is_blackjack():
-                        status = " 🎊 **블랙잭!**"
-                    
-                    embed.add_field(
-                        name=f"👤 {player.username}",
-                        value=f"{hand_str} (합: {value}){status}",
-                        inline=True
-                    )
-                
-                # 첫 번째 플레이어 턴
-                first_player = players[0]
-                if first_player.status != 'blackjack':
-                    first_member = interaction.guild.get_member(int(first_player.discord_id))
-                    first_mention = first_member.mention if first_member else f"**{first_player.username}**"
-                    
-                    embed.add_field(
-                        name="🎯 첫 번째 차례",
-                        value=f"{first_mention}님의 차례입니다!",
-                        inline=False
-                    )
-                
-                await interaction.followup.send(embed=embed)
-                
+                if message:
+                    game.table_message_id = message.id
+        
         except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
+            await reply.send(f"❌ {str(e)}")
         except Exception as e:
             logger.error(f"카드 배분 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 카드 배분 중 오류가 발생했습니다.")
+            await reply.send("❌ 카드 배분 중 오류가 발생했습니다.")
     
-    def _get_number_emoji(self, number: int) -> str:
-        """숫자 이모지"""
-        emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
-        return emojis[number - 1] if 1 <= number <= 10 else str(number)
+    # === 테이블 메시지 ===
     
-    @app_commands.command(name="히트", description="카드를 한 장 더 받습니다")
-    async def hit(self, interaction: discord.Interaction):
-        """히트"""
-        await interaction.response.defer()
+    def _build_lobby_embed(self, game: BlackjackGame, players: List[BlackjackPlayer]) -> discord.Embed:
+        """대기실 임베드"""
+        embed = discord.Embed(
+            title=f"{self.EMOJI_CARDS} 블랙잭 게임 생성!",
+            description=(
+                f"**딜러:** <@{game.host_id}>\n"
+                f"**최소 배팅:** {BlackjackGameManager.MIN_BET} 코인\n"
+                f"**최대 인원:** {BlackjackGameManager.MAX_PLAYERS}명\n\n"
+                f"참가하려면 `/블랙잭참가` 명령어를 사용하세요!\n"
+                f"모두 참가했으면 `/딜카드` 명령어로 시작하세요!\n"
+                f"{Config.LOBBY_TIMEOUT}초 후에는 자동으로 시작됩니다."
+            ),
+            color=discord.Color.green()
+        )
         
-        try:
-            async with self.db_manager.session() as session:
-                game_manager = BlackjackGameManager(session)
-                
-                result = await game_manager.hit(
-                    channel_id=interaction.channel_id,
-                    player_id=interaction.user.id
-                )
-                
-                card = result['card']
-                hand = result['hand']
-                bust = result['bust']
-                hand_number = result.get('hand_number', 1)
-                auto_switch = result.get('auto_switch', False)
-                
-                hand_text = f"핸드 {hand_number}" if result['player'].is_split else "핸드"
-                
-                embed = discord.Embed(
-                    title=f"{self.EMOJI_CARDS} 히트!",
-                    description=f"**{interaction.user.display_name}**님이 카드를 받았습니다",
-                    color=discord.Color.blue()
-                )
-                
-                embed.add_field(
-                    name=f"받은 카드 ({hand_text})",
-                    value=str(card),
-                    inline=True
-                )
-                
-                embed.add_field(
-                    name="현재 핸드",
-                    value=f"{hand} (합: {hand.value()})",
-                    inline=True
-                )
-                
-                if bust:
-                    embed.add_field(
-                        name=f"{self.EMOJI_BOOM} 버스트!",
-                        value=f"{hand_text}가 21을 초과했습니다! (합: {hand.value()})",
-                        inline=False
-                    )
-                    embed.color = discord.Color.red()
-                    
-                    if auto_switch:
-                        embed.add_field(
-                            name="➡️ 핸드 전환",
-                            value="두 번째 핸드로 자동 전환됩니다!",
-                            inline=False
-                        )
-                    else:
-                        # 다음 플레이어
-                        game = await game_manager.get_current_game(interaction.channel_id)
-                        if game.status == 'playing':
-                            next_player = await game_manager.get_current_turn_player(game.id)
-                            if next_player:
-                                next_member = interaction.guild.get_member(int(next_player.discord_id))
-                                next_mention = next_member.mention if next_member else f"**{next_player.username}**"
-                                embed.add_field(
-                                    name="🎯 다음 차례",
-                                    value=f"{next_mention}님의 차례입니다!",
-                                    inline=False
-                                )
-                        elif game.status == 'dealer_turn':
-                            embed.add_field(
-                                name="🎩 딜러 턴",
-                                value="모든 플레이어가 종료했습니다. 딜러가 카드를 공개합니다...",
-                                inline=False
-                            )
-                            # 딜러 자동 진행
-                            await self._play_dealer_and_show_results(interaction, game_manager, game.id)
-                            return
-                
-                await interaction.followup.send(embed=embed)
-                
-        except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
-        except Exception as e:
-            logger.error(f"히트 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 오류가 발생했습니다.")
-    
-    @app_commands.command(name="스탠드", description="더 이상 카드를 받지 않습니다")
-    async def stand(self, interaction: discord.Interaction):
-        """스탠드"""
-        await interaction.response.defer()
+        embed.add_field(
+            name="📋 배당률",
+            value=(
+                f"블랙잭: **{BlackjackGameManager.BLACKJACK_PAYOUT}배** (1.5배)\n"
+                f"일반 승리: **{BlackjackGameManager.WIN_PAYOUT}배** (1배)\n"
+                f"무승부: 배팅 반환"
+            ),
+            inline=False
+        )
         
-        try:
-            async with self.db_manager.session() as session:
-                game_manager = BlackjackGameManager(session)
-                
-                result = await game_manager.stand(
-                    channel_id=interaction.channel_id,
-                    player_id=interaction.user.id
-                )
-                
-                hand = result['hand']
-                hand_number = result.get('hand_number', 1)
-                switch_to_hand2 = result.get('switch_to_hand2', False)
-                
-                hand_text = f"핸드 {hand_number}" if result['player'].is_split else "핸드"
-                
-                embed = discord.Embed(
-                    title=f"✋ 스탠드!",
-                    description=f"**{interaction.user.display_name}**님이 {hand_text}를 스탠드했습니다",
-                    color=discord.Color.green()
-                )
-                
-                embed.add_field(
-                    name="최종 핸드",
-                    value=f"{hand} (합: {hand.value()})",
-                    inline=False
-                )
-                
-                if switch_to_hand2:
-                    embed.add_field(
-                        name="➡️ 핸드 전환",
-                        value="이제 두 번째 핸드를 플레이하세요!",
-                        inline=False
-                    )
-                else:
-                    # 다음 플레이어 또는 딜러 턴
-                    game = await game_manager.get_current_game(interaction.channel_id)
-                    if game.status == 'playing':
-                        next_player = await game_manager.get_current_turn_player(game.id)
-                        if next_player:
-                            next_member = interaction.guild.get_member(int(next_player.discord_id))
-                            next_mention = next_member.mention if next_member else f"**{next_player.username}**"
-                            embed.add_field(
-                                name="🎯 다음 차례",
-                                value=f"{next_mention}님의 차례입니다!",
-                                inline=False
-                            )
-                    elif game.status == 'dealer_turn':
-                        embed.add_field(
-                            name="🎩 딜러 턴",
-                            value="모든 플레이어가 종료했습니다. 딜러가 카드를 공개합니다...",
-                            inline=False
-                        )
-                        await interaction.followup.send(embed=embed)
-                        # 딜러 자동 진행
-                        await self._play_dealer_and_show_results(interaction, game_manager, game.id)
-                        return
-                
-                await interaction.followup.send(embed=embed)
-                
-        except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
-        except Exception as e:
-            logger.error(f"스탠드 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 오류가 발생했습니다.")
-    
-    @app_commands.command(name="더블다운", description="배팅을 2배로 올리고 카드 1장만 더 받습니다")
-    async def double_down(self, interaction: discord.Interaction):
-        """더블다운"""
-        await interaction.response.defer()
+        if players:
+            players_text = "\n".join([
+                f"{self._get_number_emoji(p.join_order)} **{p.username}** - {p.bet_amount:,} 코인"
+                for p in players
+            ])
+            embed.add_field(
+                name=f"📋 참가자 ({len(players)}/{BlackjackGameManager.MAX_PLAYERS}명)",
+                value=players_text,
+                inline=False
+            )
         
-        try:
-            async with self.db_manager.session() as session:
-                game_manager = BlackjackGameManager(session)
-                
-                result = await game_manager.double_down(
-                    channel_id=interaction.channel_id,
-                    player_id=interaction.user.id
-                )
-                
-                card = result['card']
-                hand = result['hand']
-                bust = result['bust']
-                player = result['player']
-                
-                embed = discord.Embed(
-                    title=f"{self.EMOJI_MONEY} 더블다운!",
-                    description=f"**{interaction.user.display_name}**님이 배팅을 2배로 올렸습니다!",
-                    color=discord.Color.purple()
-                )
-                
-                embed.add_field(
-                    name="배팅 금액",
-                    value=f"{player.bet_amount:,} 코인",
-                    inline=True
-                )
-                
-                embed.add_field(
-                    name="받은 카드",
-                    value=str(card),
-                    inline=True
-                )
-                
-                embed.add_field(
-                    name="최종 핸드",
-                    value=f"{hand} (합: {hand.value()})",
-                    inline=False
-                )
-                
-                if bust:
-                    embed.add_field(
-                        name=f"{self.EMOJI_BOOM} 버스트!",
-                        value=f"21을 초과했습니다!",
-                        inline=False
-                    )
-                    embed.color = discord.Color.red()
-                
-                # 다음 플레이어 또는 딜러 턴
-                game = await game_manager.get_current_game(interaction.channel_id)
-                if game.status == 'playing':
-                    next_player = await game_manager.get_current_turn_player(game.id)
-                    if next_player:
-                        next_member = interaction.guild.get_member(int(next_player.discord_id))
-                        next_mention = next_member.mention if next_member else f"**{next_player.username}**"
-                        embed.add_field(
-                            name="🎯 다음 차례",
-                            value=f"{next_mention}님의 차례입니다!",
-                            inline=False
-                        )
-                elif game.status == 'dealer_turn':
-                    embed.add_field(
-                        name="🎩 딜러 턴",
-                        value="모든 플레이어가 종료했습니다. 딜러가 카드를 공개합니다...",
-                        inline=False
-                    )
-                    await interaction.followup.send(embed=embed)
-                    # 딜러 자동 진행
-                    await self._play_dealer_and_show_results(interaction, game_manager, game.id)
-                    return
-                
-                await interaction.followup.send(embed=embed)
-                
-        except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
-        except Exception as e:
-            logger.error(f"더블다운 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 오류가 발생했습니다.")
+        if game.status == 'cancelled':
+            embed.title = f"{self.EMOJI_CARDS} 블랙잭 게임 취소"
+            embed.description = "⏱️ 참가자가 없어 블랙잭 게임이 취소되었습니다."
+            embed.color = discord.Color.dark_grey()
+        
+        embed.set_footer(text=f"게임 ID: {game.id}")
+        return embed
     
-    async def _play_dealer_and_show_results(self, interaction: discord.Interaction, game_manager, game_id: int):
-        """딜러 턴 진행 및 결과 표시"""
-        try:
-            # 딜러 플레이
-            dealer_result = await game_manager.play_dealer(game_id)
-            dealer_hand = dealer_result['dealer_hand']
-            drawn_cards = dealer_result['drawn_cards']
-            
-            # 결과 임베드
-            embed = discord.Embed(
-                title=f"🎩 딜러 카드 공개!",
-                description="게임이 종료되었습니다!",
-                color=discord.Color.gold()
-            )
-            
-            dealer_str = str(dealer_hand)
-            if drawn_cards:
-                dealer_str += f"\n(추가: {' '.join(str(c) for c in drawn_cards)})"
-            
+    def _build_table_embed(
+        self,
+        game: BlackjackGame,
+        players: List[BlackjackPlayer],
+        event: Optional[str] = None
+    ) -> discord.Embed:
+        """테이블 임베드 (딜러/플레이어 핸드, 현재 차례, 종료 시 결과)"""
+        finished = game.status == 'finished'
+        embed = discord.Embed(
+            title=f"{self.EMOJI_CARDS} 블랙잭 테이블" + (" - 게임 종료!" if finished else ""),
+            color=discord.Color.gold() if finished else discord.Color.dark_green()
+        )
+        
+        # 딜러 (종료 전에는 1장만 공개)
+        dealer_hand = Hand.from_json(game.dealer_cards)
+        if finished:
             dealer_status = ""
-            if dealer_result['dealer_bust']:
+            if dealer_hand.is_bust():
                 dealer_status = f" {self.EMOJI_BOOM} **버스트!**"
             elif dealer_hand.is_blackjack():
                 dealer_status = " 🎊 **블랙잭!**"
+            dealer_value = f"{dealer_hand}\n합: {dealer_hand.value()}{dealer_status}"
+        else:
+            dealer_value = f"{dealer_hand.cards[0]} 🎴"
+        
+        embed.add_field(name="🎩 딜러", value=dealer_value, inline=False)
+        
+        current_player = None
+        for player in players:
+            is_turn = game.status == 'playing' and player.join_order == game.current_turn
+            if is_turn:
+                current_player = player
             
             embed.add_field(
-                name="🎩 딜러",
-                value=f"{dealer_str}\n합: {dealer_hand.value()}{dealer_status}",
+                name=f"{'▶️' if is_turn else '👤'} {player.username}",
+                value=self._describe_player(player, dealer_hand, finished, is_turn),
+                inline=True
+            )
+        
+        if current_player:
+            embed.add_field(
+                name="🎯 현재 차례",
+                value=(
+                    f"<@{current_player.discord_id}>님의 차례입니다! "
+                    f"({Config.BLACKJACK_TURN_TIMEOUT}초 안에 행동하지 않으면 자동 스탠드)"
+                ),
                 inline=False
             )
+        
+        footer = f"게임 ID: {game.id}"
+        if event:
+            footer = f"{event}\n{footer}"
+        embed.set_footer(text=footer)
+        return embed
+    
+    def _describe_player(self, player: BlackjackPlayer, dealer_hand: Hand, finished: bool, is_turn: bool) -> str:
+        """플레이어 한 명의 핸드/배팅/결과 요약"""
+        hand = Hand.from_json(player.cards)
+        
+        if player.is_split and player.split_cards:
+            hand2 = Hand.from_json(player.split_cards)
+            marker1 = "▶ " if is_turn and player.current_hand == 1 else ""
+            marker2 = "▶ " if is_turn and player.current_hand == 2 else ""
+            lines = [
+                f"{marker1}핸드1: {hand} (합: {hand.value()})",
+                f"{marker2}핸드2: {hand2} (합: {hand2.value()})",
+            ]
+        else:
+            status = ""
+            if hand.is_blackjack():
+                status = " 🎊 **블랙잭!**"
+            elif hand.is_bust():
+                status = f" {self.EMOJI_BOOM}"
+            lines = [f"{hand} (합: {hand.value()}){status}"]
+        
+        if finished and player.result:
+            emoji = self.RESULT_EMOJI.get(player.result, '❓')
+            lines.append(f"{emoji} **{self.RESULT_TEXT.get(player.result, player.result)}**")
             
-            # 플레이어별 결과
-            players = await game_manager.get_players(game_id)
+            if player.payout > 0:
+                profit = player.payout - player.bet_amount
+                lines.append(f"💰 +{profit:,} 코인 (총 {player.payout:,})")
+            elif player.result == 'lose':
+                lines.append(f"💸 -{player.bet_amount:,} 코인")
+            else:
+                lines.append("💰 ±0 코인")
             
-            for player in players:
-                hand = Hand.from_json(player.cards)
-                result_emoji = {
-                    'blackjack': '🎊',
-                    'win': '🏆',
-                    'lose': '💔',
-                    'push': '🤝'
-                }
-                
-                emoji = result_emoji.get(player.result, '❓')
-                result_text = {
-                    'blackjack': '블랙잭 승리!',
-                    'win': '승리!',
-                    'lose': '패배',
-                    'push': '무승부'
-                }
-                
-                status_text = f"{emoji} **{result_text.get(player.result, player.result)}**"
-                
-                # 스플릿 처리
-                if player.is_split and player.split_cards:
-                    hand2 = Hand.from_json(player.split_cards)
-                    hand_display = (
-                        f"핸드1: {hand} (합: {hand.value()})\n"
-                        f"핸드2: {hand2} (합: {hand2.value()})"
-                    )
-                else:
-                    hand_display = f"{hand} (합: {hand.value()})"
-                
-                payout_text = ""
-                if player.payout > 0:
-                    profit = player.payout - player.bet_amount
-                    payout_text = f"\n💰 +{profit:,} 코인 (총 {player.payout:,})"
-                elif player.result == 'lose':
-                    payout_text = f"\n💸 -{player.bet_amount:,} 코인"
+            # 인슈어런스 표시
+            if player.has_insurance:
+                if dealer_hand.is_blackjack():
+                    lines.append(f"🛡️ 보험금: +{player.insurance_amount * 2:,} 코인")
                 else:
-                    payout_text = "\n💰 ±0 코인"
-                
-                # 인슈어런스 표시
-                insurance_text = ""
-                if player.has_insurance:
-                    if dealer_hand.is_blackjack():
-                        insurance_payout = player.insurance_amount * 2
-                        insurance_text = f"\n🛡️ 보험금: +{insurance_payout:,} 코인"
-                    else:
-                        insurance_text = f"\n🛡️ 보험금: -{player.insurance_amount:,} 코인"
-                
-                embed.add_field(
-                    name=f"👤 {player.username}",
-                    value=f"{hand_display}\n{status_text}{payout_text}{insurance_text}",
-                    inline=True
-                )
+                    lines.append(f"🛡️ 보험금: -{player.insurance_amount:,} 코인")
+        else:
+            bet_text = f"배팅 {player.bet_amount:,} 코인"
+            if player.has_insurance:
+                bet_text += " 🛡️"
+            if not player.is_split and player.status in self.STATUS_TEXT:
+                bet_text += f" · {self.STATUS_TEXT[player.status]}"
+            lines.append(bet_text)
+        
+        return "\n".join(lines)
+    
+    async def _update_table(self, game: BlackjackGame, **kwargs):
+        """
+        테이블 메시지 갱신
+        
+        메시지가 있으면 전송 대기열에 편집을 넣어 대기 중인 편집과 병합하고,
+        없으면 채널에 새로 올린 뒤 ID를 게임에 저장합니다.
+        게임이 끝난 뒤의 편집은 결과 메시지로 보고 우선 처리합니다.
+        """
+        channel = self.bot.get_channel(game.channel_id)
+        if channel is None:
+            return
+        
+        priority = PRIORITY_RESULT if game.status in ('finished', 'cancelled') else PRIORITY_NORMAL
+        
+        if game.table_message_id:
+            message = channel.get_partial_message(game.table_message_id)
+            self.bot.outbound.edit(message, priority=priority, **kwargs)
+            return
+        
+        if kwargs.get('view') is None:
+            kwargs.pop('view', None)
+        message = await self.bot.outbound.send(channel, priority=PRIORITY_RESULT, **kwargs)
+        if message:
+            game.table_message_id = message.id
+    
+    async def _refresh_table(self, game_manager: BlackjackGameManager, game: BlackjackGame, event: str):
+        """딜러 차례면 딜러를 진행한 뒤 테이블 메시지 갱신"""
+        if game.status == 'dealer_turn':
+            dealer_result = await game_manager.play_dealer(game.id)
+            dealer_hand = dealer_result['dealer_hand']
+            event += f"\n🎩 딜러 카드 공개 - 합: {dealer_hand.value()}"
+            if dealer_result['dealer_bust']:
+                event += f" {self.EMOJI_BOOM} 버스트!"
+        
+        players = await game_manager.get_players(game.id)
+        await self._update_table(
+            game,
+            embed=self._build_table_embed(game, players, event),
+            view=self._action_view(game) or None
+        )
+    
+    # === 턴 타이머 ===
+    
+    def _arm_timer(self, game, player=None):
+        """게임 상태에 맞춰 타이머 등록/해제"""
+        key = ('blackjack', game.id)
+        wheel = self.bot.timer_wheel
+        
+        if game.status == 'waiting':
+            wheel.arm(key, Config.LOBBY_TIMEOUT, self._on_lobby_timeout)
+        elif game.status == 'playing' and player:
+            turn = (game.current_turn, player.current_hand)
+            wheel.arm(key, Config.BLACKJACK_TURN_TIMEOUT, self._on_turn_timeout, turn)
+        else:
+            wheel.cancel(key)
+    
+    async def _sync_timer(self, game_manager: BlackjackGameManager, game_or_id) -> BlackjackGame:
+        """행동 후 현재 차례 기준으로 턴 타이머 재등록 (게임 반환)"""
+        game = game_or_id
+        if isinstance(game_or_id, int):
+            game = await game_manager.get_game(game_or_id)
+        player = None
+        if game.status == 'playing':
+            player = await game_manager.get_current_turn_player(game.id)
+        self._arm_timer(game, player)
+        return game
+    
+    async def _on_turn_timeout(self, key, turn):
+        """턴 시간 초과 - 자동 스탠드"""
+        game_id = key[1]
+        async with self.db_manager.session() as session:
+            game_manager = BlackjackGameManager(session)
             
-            await interaction.followup.send(embed=embed)
+            result = await game_manager.auto_stand(game_id, turn)
+            if result is None:
+                return
             
-        except Exception as e:
-            logger.error(f"딜러 턴 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 딜러 턴 진행 중 오류가 발생했습니다.")
+            game = await self._sync_timer(game_manager, game_id)
+            player = result['player']
+            hand_text = f"핸드 {result['hand_number']}" if player.is_split else "핸드"
+            event = f"⏱️ {player.username}님 시간 초과 - {hand_text} 자동 스탠드 (합: {result['hand'].value()})"
+            
+            await self._refresh_table(game_manager, game, event)
     
-    @app_commands.command(name="인슈어런스", description="딜러의 오픈 카드가 A일 때 보험을 구매합니다")
-    async def insurance(self, interaction: discord.Interaction):
-        """인슈어런스"""
-        await interaction.response.defer()
+    async def _on_lobby_timeout(self, key, _data):
+        """대기 시간 만료 - 참가자가 있으면 자동 시작, 없으면 취소"""
+        game_id = key[1]
+        async with self.db_manager.session() as session:
+            game_manager = BlackjackGameManager(session)
+            
+            game = await game_manager.get_game(game_id)
+            if not game or game.status != 'waiting':
+                return
+            
+            players = await game_manager.get_players(game.id)
+            if not players:
+                await game_manager.cancel_lobby(game.id)
+                await self._update_table(game, embed=self._build_lobby_embed(game, []))
+                return
+            
+            result = await game_manager.start_game(game.channel_id, game.host_id)
+            game = await self._sync_timer(game_manager, result['game'])
+            
+            # 대기실 메시지 대신 테이블 메시지를 새로 게시
+            game.table_message_id = None
+            await self._update_table(
+                game,
+                embed=self._build_table_embed(
+                    game, result['players'], "⏱️ 대기 시간이 끝나 카드가 자동으로 배분되었습니다!"
+                ),
+                view=self._action_view(game) or None
+            )
+    
+    # === 플레이어 행동 ===
+    
+    def _action_view(self, game: BlackjackGame):
+        """진행 중인 게임이면 액션 버튼 뷰, 아니면 MISSING"""
+        if game is None or game.status != 'playing':
+            return discord.utils.MISSING
+        return BlackjackActionButton.view_for(game.id)
+    
+    async def handle_action(self, interaction: discord.Interaction, action: str, game_id: int):
+        """버튼 액션을 게임 ID와 함께 처리"""
+        await self._run_action(interaction, action, game_id=game_id)
+    
+    async def _run_action(self, interaction: discord.Interaction, action: str, game_id: Optional[int] = None):
+        """
+        플레이어 행동 처리 (슬래시 커맨드/버튼 공용)
+        
+        테이블 메시지를 갱신하고 행동한 플레이어에게만 결과를 알립니다.
+        """
+        reply = AdaptiveResponder.start(interaction, ephemeral=True)
         
         try:
             async with self.db_manager.session() as session:
                 game_manager = BlackjackGameManager(session)
                 
-                result = await game_manager.insurance(
-                    channel_id=interaction.channel_id,
-                    player_id=interaction.user.id
-                )
-                
-                insurance_cost = result['insurance_cost']
-                dealer_blackjack = result['dealer_blackjack']
+                handler = {
+                    'hit': game_manager.hit,
+                    'stand': game_manager.stand,
+                    'double': game_manager.double_down,
+                    'split': game_manager.split,
+                    'insurance': game_manager.insurance,
+                }[action]
                 
-                embed = discord.Embed(
-                    title=f"🛡️ 인슈어런스!",
-                    description=f"**{interaction.user.display_name}**님이 보험을 구매했습니다",
-                    color=discord.Color.blue()
+                result = await handler(
+                    channel_id=reply.channel_id,
+                    player_id=interaction.user.id,
+                    game_id=game_id
                 )
                 
-                embed.add_field(
-                    name="보험료",
-                    value=f"{insurance_cost:,} 코인",
-                    inline=True
-                )
+                # 인슈어런스는 차례가 넘어가지 않으므로 턴 타이머 유지
+                if action == 'insurance':
+                    game = await game_manager.get_game(result['player'].game_id)
+                else:
+                    game = await self._sync_timer(game_manager, result['player'].game_id)
                 
-                embed.add_field(
-                    name="보험 내용",
-                    value="딜러가 블랙잭이면 2배 지급",
-                    inline=True
+                event = self._describe_action(action, result)
+                await self._refresh_table(game_manager, game, event)
+                self.bot.outbound.send(
+                    reply,
+                    channel_id=reply.channel_id,
+                    content=event,
+                    ephemeral=True
                 )
-                
-                if dealer_blackjack:
-                    payout = insurance_cost * 2
-                    embed.add_field(
-                        name="🎊 딜러 블랙잭!",
-                        value=f"보험금 {payout:,} 코인 지급!",
-                        inline=False
-                    )
-                    embed.color = discord.Color.green()
-                
-                await interaction.followup.send(embed=embed)
-                
+        
         except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
+            await reply.send(f"❌ {str(e)}", ephemeral=True)
         except Exception as e:
-            logger.error(f"인슈어런스 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 오류가 발생했습니다.")
+            logger.error(f"블랙잭 행동 오류 ({action}): {e}", exc_info=True)
+            await reply.send("❌ 오류가 발생했습니다.", ephemeral=True)
+    
+    def _describe_action(self, action: str, result: dict) -> str:
+        """행동 결과 한 줄 요약 (테이블 하단 및 확인 메시지용)"""
+        player = result['player']
+        hand_text = f"핸드 {result.get('hand_number', 1)}" if player.is_split else "핸드"
+        
+        if action == 'hit':
+            text = f"{self.EMOJI_CARDS} {player.username}님 히트 - {result['card']} ({hand_text} 합: {result['hand'].value()})"
+            if result['bust']:
+                text += f" {self.EMOJI_BOOM} 버스트!"
+                if result.get('auto_switch'):
+                    text += " ➡️ 두 번째 핸드로 전환"
+            return text
+        
+        if action == 'stand':
+            text = f"✋ {player.username}님 {hand_text} 스탠드 (합: {result['hand'].value()})"
+            if result.get('switch_to_hand2'):
+                text += " ➡️ 두 번째 핸드로 전환"
+            return text
+        
+        if action == 'double':
+            text = (
+                f"{self.EMOJI_MONEY} {player.username}님 더블다운 - {result['card']} "
+                f"(합: {result['hand'].value()}, 배팅 {player.bet_amount:,} 코인)"
+            )
+            if result['bust']:
+                text += f" {self.EMOJI_BOOM} 버스트!"
+            return text
+        
+        if action == 'split':
+            return (
+                f"✂️ {player.username}님 스플릿 - 핸드1: {result['hand1']} / 핸드2: {result['hand2']} "
+                f"(핸드당 {result['bet_per_hand']:,} 코인)"
+            )
+        
+        text = f"🛡️ {player.username}님 인슈어런스 구매 ({result['insurance_cost']:,} 코인)"
+        if result['dealer_blackjack']:
+            text += f" - 🎊 딜러 블랙잭! 보험금 {result['insurance_cost'] * 2:,} 코인 지급"
+        return text
+    
+    def _get_number_emoji(self, number: int) -> str:
+        """숫자 이모지"""
+        emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+        return emojis[number - 1] if 1 <= number <= 10 else str(number)
+    
+    @app_commands.command(name="히트", description="카드를 한 장 더 받습니다")
+    async def hit(self, interaction: discord.Interaction):
+        """히트"""
+        await self._run_action(interaction, 'hit')
+    
+    @app_commands.command(name="스탠드", description="더 이상 카드를 받지 않습니다")
+    async def stand(self, interaction: discord.Interaction):
+        """스탠드"""
+        await self._run_action(interaction, 'stand')
+    
+    @app_commands.command(name="더블다운", description="배팅을 2배로 올리고 카드 1장만 더 받습니다")
+    async def double_down(self, interaction: discord.Interaction):
+        """더블다운"""
+        await self._run_action(interaction, 'double')
+    
+    @app_commands.command(name="인슈어런스", description="딜러의 오픈 카드가 A일 때 보험을 구매합니다")
+    async def insurance(self, interaction: discord.Interaction):
+        """인슈어런스"""
+        await self._run_action(interaction, 'insurance')
     
     @app_commands.command(name="스플릿", description="같은 숫자 2장을 분리해서 2개의 핸드로 플레이합니다")
     async def split(self, interaction: discord.Interaction):
         """스플릿"""
-        await interaction.response.defer()
-        
-        try:
-            async with self.db_manager.session() as session:
-                game_manager = BlackjackGameManager(session)
-                
-                result = await game_manager.split(
-                    channel_id=interaction.channel_id,
-                    player_id=interaction.user.id
-                )
-                
-                hand1 = result['hand1']
-                hand2 = result['hand2']
-                player = result['player']
-                
-                embed = discord.Embed(
-                    title=f"✂️ 스플릿!",
-                    description=f"**{interaction.user.display_name}**님이 핸드를 분리했습니다",
-                    color=discord.Color.purple()
-                )
-                
-                embed.add_field(
-                    name="💰 추가 배팅",
-                    value=f"{player.bet_amount // 2:,} 코인",
-                    inline=True
-                )
-                
-                embed.add_field(
-                    name="📋 총 배팅",
-                    value=f"{player.bet_amount:,} 코인",
-                    inline=True
-                )
-                
-                embed.add_field(
-                    name="🃏 첫 번째 핸드",
-                    value=f"{hand1} (합: {hand1.value()})",
-                    inline=False
-                )
-                
-                embed.add_field(
-                    name="🃏 두 번째 핸드",
-                    value=f"{hand2} (합: {hand2.value()})",
-                    inline=False
-                )
-                
-                embed.add_field(
-                    name="ℹ️ 안내",
-                    value="첫 번째 핸드부터 플레이하세요!\n완료되면 자동으로 두 번째 핸드로 전환됩니다.",
-                    inline=False
-                )
-                
-                await interaction.followup.send(embed=embed)
-                
-        except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
-        except Exception as e:
-            logger.error(f"스플릿 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 오류가 발생했습니다.")
+        await self._run_action(interaction, 'split')
 
 
 async def setup(bot: commands.Bot):
     """Cog 설정"""
+    bot.add_dynamic_items(BlackjackActionButton)
     await bot.add_cog(BlackjackCommands(bot))
\ No newline at end of file
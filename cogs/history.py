@@ -0,0 +1,237 @@
+"""
+플레이 기록 Cog
+"""
+import discord
+from discord import app_commands
+from discord.ext import commands
+import logging
+from typing import Dict, List, Optional
+from database.db_manager import DatabaseManager
+from database.player_stats import get_player_stats
+from game.history import (
+    Cursor, PlayHistory, EPOCH, KIND_SLOT, KIND_ROULETTE, KIND_BLACKJACK, encode_cursor, decode_cursor
+)
+from utils.responder import AdaptiveResponder
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 10
+
+
+class HistoryPageButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r'hist:(?P<user_id>[0-9]+)(?::(?P<ts>[0-9]+):(?P<kind>[srb]):(?P<row_id>[0-9]+))?'
+):
+    """기록 페이지 버튼 (custom_id에 유저 ID와 페이지 커서를 담아 재시작 후에도 동작)"""
+
+    def __init__(self, user_id: int, cursor: Optional[Cursor] = None):
+        custom_id = f'hist:{user_id}'
+        if cursor is None:
+            label, emoji = "처음으로", "⏮️"
+        else:
+            label, emoji = "다음", "▶️"
+            custom_id += f':{encode_cursor(cursor)}'
+        super().__init__(
+            discord.ui.Button(
+                label=label,
+                emoji=emoji,
+                style=discord.ButtonStyle.secondary,
+                custom_id=custom_id
+            )
+        )
+        self.user_id = user_id
+        self.cursor = cursor
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        cursor = None
+        if match['ts'] is not None:
+            cursor = decode_cursor(match['ts'], match['kind'], match['row_id'])
+        return cls(int(match['user_id']), cursor)
+
+    @classmethod
+    def view_for(cls, user_id: int, next_cursor: Optional[Cursor], first_page: bool) -> Optional[discord.ui.View]:
+        """페이지 이동 버튼 뷰 생성 (버튼이 없으면 None)"""
+        view = discord.ui.View(timeout=None)
+        if not first_page:
+            view.add_item(cls(user_id))
+        if next_cursor is not None:
+            view.add_item(cls(user_id, next_cursor))
+        return view if view.children else None
+
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog('HistoryCommands')
+        await cog._turn_page(interaction, self.user_id, self.cursor)
+
+
+class HistoryCommands(commands.Cog):
+    """게임 기록 명령어"""
+
+    EMOJI_HISTORY = "📜"
+    EMOJI_SLOT = "🎰"
+    EMOJI_GUN = "🔫"
+    EMOJI_CARDS = "🃏"
+    EMOJI_STATS = "📊"
+
+    ROULETTE_RESULTS = {'win': "🏆 승리", 'alive': "생존", 'dead': "💀 탈락"}
+    BLACKJACK_RESULTS = {'blackjack': "블랙잭!", 'win': "승리", 'push': "무승부", 'lose': "패배"}
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.db_manager = DatabaseManager()
+
+    @app_commands.command(name="기록", description="나의 최근 게임 기록을 확인합니다")
+    async def history(self, interaction: discord.Interaction):
+        """슬롯/룰렛/블랙잭 기록 (최신순)"""
+        reply = AdaptiveResponder.start(interaction)
+
+        try:
+            async with self.db_manager.session() as session:
+                entries, next_cursor = await PlayHistory(session).page(interaction.user.id, limit=PAGE_SIZE)
+
+            if not entries:
+                await reply.send("❌ 게임 기록이 없습니다!")
+                return
+
+            await reply.send(
+                embed=self._build_embed(interaction.user, entries, first_page=True),
+                view=HistoryPageButton.view_for(interaction.user.id, next_cursor, first_page=True)
+            )
+
+        except Exception as e:
+            logger.error(f"기록 조회 오류: {e}", exc_info=True)
+            await reply.send("❌ 기록 조회 중 오류가 발생했습니다.")
+
+    @app_commands.command(name="전적", description="게임별 누적 전적을 확인합니다")
+    @app_commands.describe(유저="전적을 확인할 유저 (기본: 나)")
+    async def player_stats(self, interaction: discord.Interaction, 유저: Optional[discord.Member] = None):
+        """슬롯 RTP, 블랙잭 승/무/패, 룰렛 생존율 (누적 카운터만 읽음)"""
+        reply = AdaptiveResponder.start(interaction)
+        target = 유저 or interaction.user
+
+        try:
+            async with self.db_manager.session() as session:
+                stats = await get_player_stats(session, target.id)
+
+            if not stats:
+                await reply.send(f"❌ **{target.display_name}**님의 게임 기록이 없습니다!")
+                return
+
+            await reply.send(embed=self._build_stats_embed(target, stats))
+
+        except Exception as e:
+            logger.error(f"전적 조회 오류: {e}", exc_info=True)
+            await reply.send("❌ 전적 조회 중 오류가 발생했습니다.")
+
+    async def _turn_page(self, interaction: discord.Interaction, user_id: int, cursor: Optional[Cursor]):
+        """페이지 버튼 처리 - 같은 메시지를 다음/처음 페이지로 수정"""
+        if interaction.user.id != user_id:
+            await interaction.response.send_message("❌ 본인의 기록만 넘겨볼 수 있습니다.", ephemeral=True)
+            return
+
+        try:
+            async with self.db_manager.session() as session:
+                entries, next_cursor = await PlayHistory(session).page(user_id, after=cursor, limit=PAGE_SIZE)
+
+            first_page = cursor is None
+            await interaction.response.edit_message(
+                embed=self._build_embed(interaction.user, entries, first_page),
+                view=HistoryPageButton.view_for(user_id, next_cursor, first_page)
+            )
+
+        except Exception as e:
+            logger.error(f"기록 페이지 이동 오류: {e}", exc_info=True)
+            if not interaction.response.is_done():
+                await interaction.response.send_message("❌ 기록 조회 중 오류가 발생했습니다.", ephemeral=True)
+
+    def _build_embed(self, user: discord.abc.User, entries: List[Dict], first_page: bool) -> discord.Embed:
+        embed = discord.Embed(
+            title=f"{self.EMOJI_HISTORY} 게임 기록",
+            description=f"**{user.display_name}**님의 {'최근 ' if first_page else ''}기록",
+            color=discord.Color.blurple()
+        )
+        embed.add_field(
+            name="최신순",
+            value="\n".join(self._format_entry(entry) for entry in entries) or "더 이상 기록이 없습니다.",
+            inline=False
+        )
+        return embed
+
+    def _build_stats_embed(self, user: discord.abc.User, stats: Dict[str, Dict[str, int]]) -> discord.Embed:
+        embed = discord.Embed(
+            title=f"{self.EMOJI_STATS} 게임 전적",
+            description=f"**{user.display_name}**님의 누적 전적",
+            color=discord.Color.blurple()
+        )
+
+        slot = stats.get('slot')
+        if slot:
+            embed.add_field(
+                name=f"{self.EMOJI_SLOT} 슬롯머신",
+                value=(
+                    f"플레이 {slot['plays']:,}회 · 당첨 {slot['wins']:,}회 ({self._rate(slot['wins'], slot['plays'])})\n"
+                    f"배팅 {slot['wagered']:,} → 지급 {slot['paid_out']:,}\n"
+                    f"RTP {self._rate(slot['paid_out'], slot['wagered'])}"
+                ),
+                inline=False
+            )
+
+        blackjack = stats.get('blackjack')
+        if blackjack:
+            embed.add_field(
+                name=f"{self.EMOJI_CARDS} 블랙잭",
+                value=(
+                    f"{blackjack['plays']:,}게임 · {blackjack['wins']:,}승 {blackjack['pushes']:,}무 "
+                    f"{blackjack['losses']:,}패 (승률 {self._rate(blackjack['wins'], blackjack['plays'])})\n"
+                    f"블랙잭 {blackjack['blackjacks']:,}회\n"
+                    f"배팅 {blackjack['wagered']:,} → 지급 {blackjack['paid_out']:,}"
+                ),
+                inline=False
+            )
+
+        roulette = stats.get('roulette')
+        if roulette:
+            embed.add_field(
+                name=f"{self.EMOJI_GUN} 러시안 룰렛",
+                value=(
+                    f"{roulette['plays']:,}게임 · 생존 {roulette['wins']:,}회 "
+                    f"(생존율 {self._rate(roulette['wins'], roulette['plays'])})\n"
+                    f"획득 보상 {roulette['paid_out']:,}"
+                ),
+                inline=False
+            )
+
+        return embed
+
+    @staticmethod
+    def _rate(part: int, whole: int) -> str:
+        return f"{part / whole * 100:.1f}%" if whole else "-"
+
+    def _format_entry(self, entry: Dict) -> str:
+        when = f"<t:{int((entry['ts'] - EPOCH).total_seconds())}:R>"
+
+        if entry['kind'] == KIND_SLOT:
+            return (
+                f"{self.EMOJI_SLOT} {when} {entry['reels']} "
+                f"배팅 {entry['bet']:,} → 지급 {entry['payout']:,}"
+            )
+
+        if entry['status'] == 'cancelled':
+            result = "취소"
+        elif entry['kind'] == KIND_ROULETTE:
+            result = self.ROULETTE_RESULTS[entry['result']]
+        else:
+            result = self.BLACKJACK_RESULTS.get(entry['result'], "-")
+
+        if entry['kind'] == KIND_BLACKJACK:
+            return (
+                f"{self.EMOJI_CARDS} {when} 블랙잭 #{entry['game_id']} {result} "
+                f"(배팅 {entry['bet']:,} → 지급 {entry['payout']:,})"
+            )
+        return f"{self.EMOJI_GUN} {when} 룰렛 #{entry['game_id']} {result}"
+
+
+async def setup(bot: commands.Bot):
+    """Cog 설정"""
+    bot.add_dynamic_items(HistoryPageButton)
+    await bot.add_cog(HistoryCommands(bot))
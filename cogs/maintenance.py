@@ -0,0 +1,153 @@
+"""
+백그라운드 유지보수 작업 Cog
+"""
+import asyncio
+import logging
+from datetime import timedelta
+from discord.ext import commands, tasks
+from config import Config
+from database.db_manager import DatabaseManager
+from database.archive import GameArchiver
+from database.guild_stats import GuildStatsRollup
+from game.russian_roulette import RussianRouletteGame
+from game.reaper import StaleGameReaper
+from utils.metrics import metrics
+from utils.outbound import PRIORITY_RESULT
+
+logger = logging.getLogger(__name__)
+
+try:
+    import resource
+except ImportError:
+    # 유닉스 전용 모듈 - 없으면 메모리 지표만 건너뜀 (윈도우)
+    resource = None
+
+
+class MaintenanceTasks(commands.Cog):
+    """주기적으로 실행되는 데이터 정리 작업"""
+
+    REAP_MESSAGES = {
+        'cancel': "⏱️ 대기 시간이 초과되어 러시안 룰렛 게임이 취소되었습니다.",
+        'abandon': "⏱️ 오랫동안 진행이 없어 러시안 룰렛 게임이 종료되었습니다.",
+        'refund': "⏱️ 블랙잭 게임이 시간 초과로 취소되어 배팅 금액이 환불되었습니다.",
+        'settle': "⏱️ 블랙잭 게임이 시간 초과로 자동 스탠드 처리되어 딜러 진행 후 정산되었습니다.",
+    }
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.db_manager = DatabaseManager()
+        self.archiver = GameArchiver(self.db_manager)
+        self.guild_stats = GuildStatsRollup(self.db_manager, roulette_reward=RussianRouletteGame.WIN_REWARD)
+
+    async def cog_load(self):
+        self.reaper_loop.start()
+        self.archive_loop.start()
+        self.guild_stats_loop.start()
+        self.process_stats_loop.start()
+
+    async def cog_unload(self):
+        self.reaper_loop.cancel()
+        self.archive_loop.cancel()
+        self.guild_stats_loop.cancel()
+        self.process_stats_loop.cancel()
+
+    @tasks.loop(minutes=Config.REAPER_INTERVAL_MINUTES)
+    async def reaper_loop(self):
+        """방치된 게임 정리 (시작 시 즉시 1회 실행)"""
+        try:
+            reaped = await self.reap_stale_games()
+            if reaped:
+                logger.info(f"방치 게임 정리 완료: {len(reaped)}개")
+            await self._notify_reaped(reaped)
+        except Exception as e:
+            logger.error(f"방치 게임 정리 오류: {e}", exc_info=True)
+
+    async def reap_stale_games(self):
+        """만료된 게임을 배치 단위 트랜잭션으로 정리"""
+        lobby_timeout = timedelta(minutes=Config.LOBBY_EXPIRE_MINUTES)
+        game_timeout = timedelta(minutes=Config.GAME_EXPIRE_MINUTES)
+        batch_size = Config.REAPER_BATCH_SIZE
+        reaped = []
+
+        for game_type in ('roulette', 'blackjack'):
+            while True:
+                async with self.db_manager.session() as session:
+                    reaper = StaleGameReaper(session)
+                    if game_type == 'roulette':
+                        batch = await reaper.reap_roulette(lobby_timeout, game_timeout, batch_size)
+                    else:
+                        batch = await reaper.reap_blackjack(
+                            lobby_timeout, game_timeout, batch_size,
+                            mode=Config.REAPER_BLACKJACK_MODE
+                        )
+
+                for item in batch:
+                    item['game'] = game_type
+                reaped.extend(batch)
+
+                if len(batch) < batch_size:
+                    break
+                await asyncio.sleep(0)  # 배치 사이에 다른 작업에 양보
+
+        return reaped
+
+    async def _notify_reaped(self, reaped):
+        """정리된 게임의 채널에 안내 메시지 전송 (전송 대기열 사용)"""
+        for item in reaped:
+            channel = self.bot.get_channel(item['channel_id'])
+            if channel is None:
+                continue
+            self.bot.outbound.send(
+                channel,
+                priority=PRIORITY_RESULT,
+                content=self.REAP_MESSAGES[item['action']]
+            )
+
+    @tasks.loop(hours=Config.ARCHIVE_INTERVAL_HOURS)
+    async def archive_loop(self):
+        """종료된 게임 기록 아카이브 및 보존 기간 정리"""
+        try:
+            moved = await self.archiver.archive()
+            removed = await asyncio.to_thread(self.archiver.apply_retention)
+            logger.info(f"아카이브 작업 완료: 이동 {moved}, 만료 세그먼트 삭제 {removed}개")
+        except Exception as e:
+            logger.error(f"아카이브 작업 오류: {e}", exc_info=True)
+
+    @tasks.loop(minutes=Config.GUILD_STATS_INTERVAL_MINUTES)
+    async def guild_stats_loop(self):
+        """새 기록을 서버별 일간 집계에 반영 (아카이브보다 자주 실행되어 삭제 전에 반영)"""
+        try:
+            await self.guild_stats.run()
+        except Exception as e:
+            logger.error(f"서버별 집계 오류: {e}", exc_info=True)
+
+    @tasks.loop(minutes=1)
+    async def process_stats_loop(self):
+        """메모리 사용량과 게이트웨이 캐시 크기 기록 (게이트웨이 설정 전후 비교용)"""
+        if resource is not None:
+            metrics.set_gauge('process.rss_bytes', self._rss_bytes())
+            metrics.set_gauge('process.max_rss_bytes', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+        metrics.set_gauge('gateway.guilds', len(self.bot.guilds))
+        metrics.set_gauge('gateway.cached_users', len(self.bot.users))
+        metrics.set_gauge('gateway.cached_members', sum(len(g.members) for g in self.bot.guilds))
+
+    @staticmethod
+    def _rss_bytes() -> int:
+        """현재 상주 메모리 (리눅스가 아니면 최대 상주 메모리로 대체)"""
+        try:
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * resource.getpagesize()
+        except OSError:
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    @reaper_loop.before_loop
+    @archive_loop.before_loop
+    @guild_stats_loop.before_loop
+    @process_stats_loop.before_loop
+    async def before_loops(self):
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: commands.Bot):
+    """Cog 설정"""
+    await bot.add_cog(MaintenanceTasks(bot))
@@ -7,12 +7,48 @@ from discord.ext import commands
 import logging
 from typing import Optional
 from datetime import timedelta
+from config import Config
 from database.db_manager import DatabaseManager
 from game.russian_roulette import RussianRouletteGame
+from utils.outbound import PRIORITY_RESULT, PRIORITY_NORMAL
+from utils.responder import AdaptiveResponder
 
 logger = logging.getLogger(__name__)
 
 
+class RoulettePullButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r'rr:pull:(?P<game_id>[0-9]+)'
+):
+    """방아쇠 버튼 (custom_id에 게임 ID를 담아 재시작 후에도 동작)"""
+    
+    def __init__(self, game_id: int):
+        super().__init__(
+            discord.ui.Button(
+                label="당기기",
+                emoji="🔫",
+                style=discord.ButtonStyle.danger,
+                custom_id=f'rr:pull:{game_id}'
+            )
+        )
+        self.game_id = game_id
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(int(match['game_id']))
+    
+    @classmethod
+    def view_for(cls, game_id: int) -> discord.ui.View:
+        """게임의 방아쇠 버튼 뷰 생성"""
+        view = discord.ui.View(timeout=None)
+        view.add_item(cls(game_id))
+        return view
+    
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog('RouletteCommands')
+        await cog._pull_trigger(interaction, game_id=self.game_id)
+
+
 class RouletteCommands(commands.Cog):
     """러시안 룰렛 게임 명령어"""
     
@@ -36,12 +72,12 @@ class RouletteCommands(commands.Cog):
         최대인원: Optional[int] = 6
     ):
         """러시안 룰렛 게임 생성"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             # 입력값 검증
             if 최대인원 < 2 or 최대인원 > 10:
-                await interaction.followup.send("❌ 최대 인원은 2~10명 사이여야 합니다.")
+                await reply.send("❌ 최대 인원은 2~10명 사이여야 합니다.")
                 return
             
             async with self.db_manager.session() as session:
@@ -49,16 +85,18 @@ class RouletteCommands(commands.Cog):
                 
                 game = await game_manager.create_game(
                     guild_id=interaction.guild_id,
-                    channel_id=interaction.channel_id,
+                    channel_id=reply.channel_id,
                     host_id=interaction.user.id,
                     host_name=interaction.user.display_name,
                     max_players=최대인원
                 )
                 
                 if not game:
-                    await interaction.followup.send("❌ 이미 진행 중인 게임이 있습니다!")
+                    await reply.send("❌ 이미 진행 중인 게임이 있습니다!")
                     return
                 
+                self._arm_timer(game)
+                
                 # 게임 생성 임베드
                 embed = discord.Embed(
                     title=f"{self.EMOJI_GUN} 러시안 룰렛 게임 생성!",
@@ -67,7 +105,8 @@ class RouletteCommands(commands.Cog):
                         f"**최대 인원:** {최대인원}명\n"
                         f"**승리 보상:** {RussianRouletteGame.WIN_REWARD} 코인 {self.EMOJI_MONEY}\n\n"
                         f"참가하려면 `/룰렛참가` 명령어를 사용하세요!\n"
-                        f"게임을 시작하려면 `/룰렛시작` 명령어를 사용하세요!"
+                        f"게임을 시작하려면 `/룰렛시작` 명령어를 사용하세요!\n"
+                        f"{Config.LOBBY_TIMEOUT}초 후에는 2명 이상이면 자동으로 시작됩니다."
                     ),
                     color=discord.Color.red()
                 )
@@ -78,18 +117,18 @@ class RouletteCommands(commands.Cog):
                 )
                 embed.set_footer(text="⚠️ 게임 ID: " + str(game.id))
                 
-                await interaction.followup.send(embed=embed)
+                self._enqueue_reply(reply, embed=embed)
                 
         except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
+            await reply.send(f"❌ {str(e)}")
         except Exception as e:
             logger.error(f"게임 생성 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 게임 생성 중 오류가 발생했습니다.")
+            await reply.send("❌ 게임 생성 중 오류가 발생했습니다.")
     
     @app_commands.command(name="룰렛참가", description="러시안 룰렛 게임에 참가합니다")
     async def join_roulette(self, interaction: discord.Interaction):
         """러시안 룰렛 게임 참가"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
@@ -98,16 +137,16 @@ class RouletteCommands(commands.Cog):
                 # 현재 게임 확인
                 game = await game_manager.get_current_game(interaction.channel_id)
                 if not game:
-                    await interaction.followup.send("❌ 참가할 수 있는 게임이 없습니다!")
+                    await reply.send("❌ 참가할 수 있는 게임이 없습니다!")
                     return
                 
                 if game.status != 'waiting':
-                    await interaction.followup.send("❌ 이미 시작된 게임에는 참가할 수 없습니다!")
+                    await reply.send("❌ 이미 시작된 게임에는 참가할 수 없습니다!")
                     return
                 
                 # 게임 참가
                 player = await game_manager.join_game(
-                    channel_id=interaction.channel_id,
+                    channel_id=reply.channel_id,
                     player_id=interaction.user.id,
                     player_name=interaction.user.display_name
                 )
@@ -124,7 +163,7 @@ class RouletteCommands(commands.Cog):
                 
                 # 참가자 목록 표시
                 players_text = "\n".join([
-                    f"{self._get_number_emoji(p.join_order)} {self._get_user_mention(p.discord_id, p.username)}"
+                    f"{self._get_number_emoji(p.join_order)} <@{p.discord_id}>"
                     for p in all_players
                 ])
                 
@@ -141,32 +180,34 @@ class RouletteCommands(commands.Cog):
                         inline=False
                     )
                 
-                await interaction.followup.send(embed=embed)
+                self._enqueue_reply(reply, embed=embed)
                 
         except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
+            await reply.send(f"❌ {str(e)}")
         except Exception as e:
             logger.error(f"게임 참가 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 게임 참가 중 오류가 발생했습니다.")
+            await reply.send("❌ 게임 참가 중 오류가 발생했습니다.")
     
     @app_commands.command(name="룰렛시작", description="러시안 룰렛 게임을 시작합니다 (호스트 전용)")
     async def start_roulette(self, interaction: discord.Interaction):
         """러시안 룰렛 게임 시작"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
                 game_manager = RussianRouletteGame(session)
                 
                 game = await game_manager.start_game(
-                    channel_id=interaction.channel_id,
+                    channel_id=reply.channel_id,
                     starter_id=interaction.user.id
                 )
                 
                 if not game:
-                    await interaction.followup.send("❌ 시작할 수 있는 게임이 없습니다!")
+                    await reply.send("❌ 시작할 수 있는 게임이 없습니다!")
                     return
                 
+                self._arm_timer(game)
+                
                 # 참가자 목록
                 players = await game_manager.get_players(game.id)
                 
@@ -187,7 +228,7 @@ class RouletteCommands(commands.Cog):
                 
                 # 플레이어 순서
                 players_text = "\n".join([
-                    f"{self._get_number_emoji(p.join_order)} {self._get_user_mention(p.discord_id, p.username)}"
+                    f"{self._get_number_emoji(p.join_order)} <@{p.discord_id}>"
                     for p in players
                 ])
                 
@@ -199,32 +240,42 @@ class RouletteCommands(commands.Cog):
                 
                 embed.add_field(
                     name="🎯 첫 번째 차례",
-                    value=f"{players[0].username}님, `/당겨` 명령어를 사용하세요!",
+                    value=f"{players[0].username}님, `/당겨` 명령어나 아래 버튼을 사용하세요!",
                     inline=False
                 )
                 
-                await interaction.followup.send(embed=embed)
+                self._enqueue_reply(reply, embed=embed, view=RoulettePullButton.view_for(game.id))
                 
         except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
+            await reply.send(f"❌ {str(e)}")
         except Exception as e:
             logger.error(f"게임 시작 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 게임 시작 중 오류가 발생했습니다.")
+            await reply.send("❌ 게임 시작 중 오류가 발생했습니다.")
     
     @app_commands.command(name="당겨", description="방아쇠를 당깁니다")
     async def pull_trigger(self, interaction: discord.Interaction):
         """방아쇠 당기기"""
-        await interaction.response.defer()
+        await self._pull_trigger(interaction)
+    
+    async def _pull_trigger(self, interaction: discord.Interaction, game_id: Optional[int] = None):
+        """방아쇠 당기기 처리 (슬래시 커맨드/버튼 공용)"""
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
                 game_manager = RussianRouletteGame(session)
                 
                 result = await game_manager.shoot(
-                    channel_id=interaction.channel_id,
-                    shooter_id=interaction.user.id
+                    channel_id=reply.channel_id,
+                    shooter_id=interaction.user.id,
+                    game_id=game_id
                 )
                 
+                if result['game_over']:
+                    self.bot.timer_wheel.cancel(('roulette', result['loser'].game_id))
+                elif result['next_player']:
+                    self._arm_timer(await game_manager.get_game(result['next_player'].game_id))
+                
                 if result['hit']:
                     # 총알 맞음 - 게임 즉시 종료!
                     embed = discord.Embed(
@@ -233,18 +284,15 @@ class RouletteCommands(commands.Cog):
                         color=discord.Color.dark_red()
                     )
                     
-                    # 타임아웃 적용
-                    try:
-                        await interaction.user.timeout(
-                            timedelta(seconds=60),
-                            reason="러시안 룰렛 패배"
-                        )
+                    # 타임아웃은 결과 메시지가 전송된 뒤 부수 작업으로 적용
+                    can_timeout = self._can_timeout(interaction.user)
+                    if can_timeout:
                         embed.add_field(
                             name="⏱️ 타임아웃 1분",
                             value="조빱은 채팅을 칠 수 없습니다 ㅋ",
                             inline=False
                         )
-                    except discord.Forbidden:
+                    else:
                         embed.add_field(
                             name="⚠️ 권한 없음",
                             value="타임아웃을 적용할 권한이 없습니다.",
@@ -254,7 +302,7 @@ class RouletteCommands(commands.Cog):
                     # 게임 종료 - 승자들 표시
                     if result['game_over']:
                         winners_text = "\n".join([
-                            f"{self._get_number_emoji(w.join_order)} {self._get_user_mention(w.discord_id, w.username)}"
+                            f"{self._get_number_emoji(w.join_order)} <@{w.discord_id}>"
                             for w in result['winners']
                         ])
                         
@@ -269,7 +317,12 @@ class RouletteCommands(commands.Cog):
                         )
                         embed.color = discord.Color.gold()
                     
-                    await interaction.followup.send(embed=embed)
+                    sent = self._enqueue_reply(reply, priority=PRIORITY_RESULT, embed=embed)
+                    if can_timeout:
+                        self._queue_timeout(
+                            interaction.guild, interaction.user.id,
+                            "러시안 룰렛 패배", after=sent, member=interaction.user
+                        )
                     
                 else:
                     # 빈 탄창 - 다음 차례로
@@ -277,8 +330,7 @@ class RouletteCommands(commands.Cog):
                     
                     if next_player:
                         # 다음 차례 플레이어 멘션
-                        next_user = self.bot.get_user(int(next_player.discord_id))
-                        next_mention = next_user.mention if next_user else f"**{next_player.username}**"
+                        next_mention = f"<@{next_player.discord_id}>"
                         
                         embed = discord.Embed(
                             title=f"{self.EMOJI_GUN} 찰칵... 빈 탄창!",
@@ -299,7 +351,8 @@ class RouletteCommands(commands.Cog):
                         )
                     
                     # 현재 게임 정보
-                    game = await game_manager.get_current_game(interaction.channel_id)
+                    game = await game_manager.get_game(next_player.game_id) if next_player \
+                        else await game_manager.get_current_game(interaction.channel_id)
                     alive_players = await game_manager.get_alive_players(game.id)
                     
                     embed.add_field(
@@ -308,45 +361,53 @@ class RouletteCommands(commands.Cog):
                         inline=False
                     )
                     
-                    await interaction.followup.send(embed=embed)
+                    self._enqueue_reply(
+                        reply,
+                        priority=PRIORITY_RESULT,
+                        embed=embed,
+                        view=RoulettePullButton.view_for(game.id)
+                    )
                 
         except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
+            ephemeral = interaction.type == discord.InteractionType.component
+            await reply.send(f"❌ {str(e)}", ephemeral=ephemeral)
         except Exception as e:
             logger.error(f"방아쇠 당기기 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 오류가 발생했습니다.")
+            await reply.send("❌ 오류가 발생했습니다.")
     
     @app_commands.command(name="룰렛취소", description="대기 중인 게임을 취소합니다 (호스트 전용)")
     async def cancel_roulette(self, interaction: discord.Interaction):
         """게임 취소"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
                 game_manager = RussianRouletteGame(session)
                 
+                game = await game_manager.get_current_game(interaction.channel_id)
                 success = await game_manager.cancel_game(
-                    channel_id=interaction.channel_id,
+                    channel_id=reply.channel_id,
                     canceller_id=interaction.user.id
                 )
                 
                 if success:
-                    await interaction.followup.send(
+                    self.bot.timer_wheel.cancel(('roulette', game.id))
+                    await reply.send(
                         f"게임이 취소되었습니다."
                     )
                 else:
-                    await interaction.followup.send("❌ 취소할 수 있는 게임이 없습니다!")
+                    await reply.send("❌ 취소할 수 있는 게임이 없습니다!")
                     
         except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
+            await reply.send(f"❌ {str(e)}")
         except Exception as e:
             logger.error(f"게임 취소 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 게임 취소 중 오류가 발생했습니다.")
+            await reply.send("❌ 게임 취소 중 오류가 발생했습니다.")
     
     @app_commands.command(name="룰렛정보", description="현재 게임 정보를 확인합니다")
     async def roulette_info(self, interaction: discord.Interaction):
         """게임 정보 확인"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
@@ -355,7 +416,7 @@ class RouletteCommands(commands.Cog):
                 game = await game_manager.get_current_game(interaction.channel_id)
                 
                 if not game:
-                    await interaction.followup.send("❌ 진행 중인 게임이 없습니다!")
+                    await reply.send("❌ 진행 중인 게임이 없습니다!")
                     return
                 
                 players = await game_manager.get_players(game.id)
@@ -395,7 +456,7 @@ class RouletteCommands(commands.Cog):
                 # 전체 플레이어 목록
                 if game.status == 'waiting':
                     players_text = "\n".join([
-                        f"{self._get_number_emoji(p.join_order)} {self._get_user_mention(p.discord_id, p.username)}"
+                        f"{self._get_number_emoji(p.join_order)} <@{p.discord_id}>"
                         for p in players
                     ])
                     embed.add_field(
@@ -410,19 +471,19 @@ class RouletteCommands(commands.Cog):
                     if current_turn_player:
                         embed.add_field(
                             name="🎯 현재 차례",
-                            value=f"{self._get_user_mention(current_turn_player.discord_id, current_turn_player.username)}",
+                            value=f"<@{current_turn_player.discord_id}>",
                             inline=False
                         )
                     
                     # 생존자와 탈락자 구분
                     alive_text = "\n".join([
-                        f"{self._get_number_emoji(p.join_order)} {self._get_user_mention(p.discord_id, p.username)}"
+                        f"{self._get_number_emoji(p.join_order)} <@{p.discord_id}>"
                         for p in alive_players
                     ])
                     
                     dead_players = [p for p in players if not p.is_alive]
                     dead_text = "\n".join([
-                        f"~~{self._get_number_emoji(p.join_order)} {self._get_user_mention(p.discord_id, p.username)}~~"
+                        f"~~{self._get_number_emoji(p.join_order)} <@{p.discord_id}>~~"
                         for p in dead_players
                     ]) if dead_players else "없음"
                     
@@ -440,28 +501,28 @@ class RouletteCommands(commands.Cog):
                 
                 embed.set_footer(text=f"게임 ID: {game.id}")
                 
-                await interaction.followup.send(embed=embed)
+                self._enqueue_reply(reply, embed=embed)
                 
         except Exception as e:
             logger.error(f"게임 정보 조회 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 게임 정보 조회 중 오류가 발생했습니다.")
+            await reply.send("❌ 게임 정보 조회 중 오류가 발생했습니다.")
     
     @app_commands.command(name="내코인", description="보유 코인을 확인합니다")
     async def my_coins(self, interaction: discord.Interaction):
         """보유 코인 확인"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
                 from sqlalchemy import select
                 from database.models import User
                 
-                stmt = select(User).where(User.discord_id == str(interaction.user.id))
+                stmt = select(User).where(User.discord_id == interaction.user.id)
                 result = await session.execute(stmt)
                 user = result.scalar_one_or_none()
                 
                 if not user:
-                    await interaction.followup.send(
+                    await reply.send(
                         f"{self.EMOJI_MONEY} 아직 게임에 참여한 적이 없습니다. 기본 1,000 코인을 받으려면 게임에 참가하세요!"
                     )
                     return
@@ -490,23 +551,188 @@ class RouletteCommands(commands.Cog):
                 
                 embed.set_thumbnail(url=interaction.user.display_avatar.url)
                 
-                await interaction.followup.send(embed=embed)
+                self._enqueue_reply(reply, embed=embed)
                 
         except Exception as e:
             logger.error(f"코인 조회 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 코인 조회 중 오류가 발생했습니다.")
+            await reply.send("❌ 코인 조회 중 오류가 발생했습니다.")
+    
+    # === 턴 타이머 ===
+    
+    def _arm_timer(self, game):
+        """게임 상태에 맞춰 타이머 등록/해제"""
+        key = ('roulette', game.id)
+        wheel = self.bot.timer_wheel
+        
+        if game.status == 'waiting':
+            wheel.arm(key, Config.LOBBY_TIMEOUT, self._on_lobby_timeout)
+        elif game.status == 'playing':
+            wheel.arm(key, Config.ROULETTE_TURN_TIMEOUT, self._on_turn_timeout, game.current_turn)
+        else:
+            wheel.cancel(key)
+    
+    async def _on_turn_timeout(self, key, turn):
+        """턴 시간 초과 - 현재 차례 플레이어 대신 자동으로 방아쇠 당기기"""
+        game_id = key[1]
+        async with self.db_manager.session() as session:
+            game_manager = RussianRouletteGame(session)
+            
+            result = await game_manager.auto_pull(game_id, turn)
+            if result is None:
+                return
+            
+            game = await game_manager.get_game(game_id)
+            self._arm_timer(game)
+            
+            channel = self.bot.get_channel(game.channel_id)
+            if channel is None:
+                return
+            
+            shooter = result['shooter']
+            if result['hit']:
+                embed = discord.Embed(
+                    title=f"⏱️ 시간 초과 - 자동 발사! {self.EMOJI_SKULL} 빵!",
+                    description=f"<@{shooter.discord_id}>님이 시간 안에 쏘지 않아 자동으로 방아쇠가 당겨졌고, 총알에 맞았습니다...",
+                    color=discord.Color.gold()
+                )
+                
+                winners_text = "\n".join([
+                    f"{self._get_number_emoji(w.join_order)} <@{w.discord_id}>"
+                    for w in result['winners']
+                ])
+                embed.add_field(
+                    name=f"{self.EMOJI_TROPHY} 게임 종료!",
+                    value=(
+                        f"**승자들:** ({len(result['winners'])}명)\n"
+                        f"{winners_text}\n\n"
+                        f"**각자 보상:** {result['reward']} 코인 {self.EMOJI_MONEY}"
+                    ),
+                    inline=False
+                )
+            else:
+                embed = discord.Embed(
+                    title=f"⏱️ 시간 초과 - 자동 발사! {self.EMOJI_GUN} 찰칵... 빈 탄창!",
+                    description=f"<@{shooter.discord_id}>님 대신 방아쇠를 당겼습니다. 살아남았습니다!",
+                    color=discord.Color.orange()
+                )
+                next_player = result.get('next_player')
+                if next_player:
+                    embed.add_field(
+                        name="🎯 다음 차례",
+                        value=f"<@{next_player.discord_id}>님, {Config.ROULETTE_TURN_TIMEOUT}초 안에 `/당겨` 명령어를 사용하세요!",
+                        inline=False
+                    )
+            
+            view = RoulettePullButton.view_for(game.id) if game.status == 'playing' else discord.utils.MISSING
+            sent = self.bot.outbound.send(channel, priority=PRIORITY_RESULT, embed=embed, view=view)
+            
+            if result['hit']:
+                # 멤버 캐시가 없으므로 대상 멤버는 부수 작업 안에서 지연 조회
+                self._queue_timeout(
+                    channel.guild, shooter.discord_id,
+                    "러시안 룰렛 패배 (시간 초과)", after=sent
+                )
+    
+    async def _on_lobby_timeout(self, key, _data):
+        """대기 시간 만료 - 2명 이상이면 자동 시작, 아니면 취소"""
+        game_id = key[1]
+        async with self.db_manager.session() as session:
+            game_manager = RussianRouletteGame(session)
+            
+            game = await game_manager.get_game(game_id)
+            if not game or game.status != 'waiting':
+                return
+            channel = self.bot.get_channel(game.channel_id)
+            
+            players = await game_manager.get_players(game.id)
+            if len(players) < 2:
+                await game_manager.cancel_game(game.channel_id, game.host_id)
+                self._arm_timer(game)
+                if channel:
+                    self.bot.outbound.send(
+                        channel,
+                        content="⏱️ 참가자가 부족하여 러시안 룰렛 게임이 취소되었습니다."
+                    )
+                return
+            
+            game = await game_manager.start_game(game.channel_id, game.host_id)
+            self._arm_timer(game)
+            if channel is None:
+                return
+            
+            players_text = "\n".join([
+                f"{self._get_number_emoji(p.join_order)} <@{p.discord_id}>"
+                for p in players
+            ])
+            embed = discord.Embed(
+                title=f"{self.EMOJI_GUN} 러시안 룰렛 게임 자동 시작!",
+                description=f"대기 시간이 끝나 게임이 시작되었습니다!\n\n{players_text}",
+                color=discord.Color.red()
+            )
+            embed.add_field(
+                name="🎯 첫 번째 차례",
+                value=f"<@{players[0].discord_id}>님, {Config.ROULETTE_TURN_TIMEOUT}초 안에 `/당겨` 명령어를 사용하세요!",
+                inline=False
+            )
+            self.bot.outbound.send(channel, embed=embed, view=RoulettePullButton.view_for(game.id))
+    
+    def _can_timeout(self, member) -> bool:
+        """
+        타임아웃을 적용할 수 있는지 (HTTP 호출 없이 판단)
+        
+        봇 권한/역할 순서로 확실히 실패할 대상과, 이 서버에서 이미 Forbidden을
+        받아 권한 캐시에 기록된 경우를 걸러냅니다.
+        """
+        if not isinstance(member, discord.Member):
+            return False
+        
+        guild = member.guild
+        me = guild.me
+        if me is None or not me.guild_permissions.moderate_members:
+            return False
+        if member == guild.owner or member.guild_permissions.administrator or member.top_role >= me.top_role:
+            return False
+        return self.bot.side_effects.capabilities.allowed(guild.id, 'moderate_members')
+    
+    def _queue_timeout(self, guild: discord.Guild, user_id: int, reason: str, after=None, member=None):
+        """
+        패배자 타임아웃을 응답 이후 부수 작업으로 등록
+        
+        member가 없으면 실행 시점에 지연 조회 캐시에서 가져온 뒤 적용 가능 여부를 확인합니다.
+        """
+        async def apply_timeout():
+            target = member or await self.bot.members.get(guild, user_id)
+            if not self._can_timeout(target):
+                return
+            await target.timeout(
+                timedelta(seconds=RussianRouletteGame.TIMEOUT_DURATION),
+                reason=reason
+            )
+        
+        self.bot.side_effects.submit(
+            'timeout',
+            apply_timeout,
+            guild_id=guild.id,
+            capability='moderate_members',
+            after=after
+        )
+    
+    def _enqueue_reply(self, reply: AdaptiveResponder, priority: int = PRIORITY_NORMAL, **kwargs):
+        """응답을 채널 전송 대기열에 등록 (HTTP 대기 없이 반환)"""
+        return self.bot.outbound.send(
+            reply,
+            channel_id=reply.channel_id,
+            priority=priority,
+            **kwargs
+        )
     
     def _get_number_emoji(self, number: int) -> str:
         """숫자를 이모지로 변환"""
         emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
         return emojis[number - 1] if 1 <= number <= 10 else str(number)
-    
-    def _get_user_mention(self, discord_id: str, username: str) -> str:
-        """유저 멘션 또는 이름 반환 (안전)"""
-        user = self.bot.get_user(int(discord_id))
-        return user.mention if user else f"**{username}**"
 
 
 async def setup(bot: commands.Bot):
     """Cog 설정"""
+    bot.add_dynamic_items(RoulettePullButton)
     await bot.add_cog(RouletteCommands(bot))
\ No newline at end of file
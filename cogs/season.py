@@ -0,0 +1,119 @@
+"""
+시즌 Cog
+"""
+import discord
+from discord import app_commands
+from discord.ext import commands
+import logging
+from typing import Optional
+from database.db_manager import DatabaseManager
+from database.season import SeasonManager
+from utils.authorization import admin_only
+from utils.responder import AdaptiveResponder
+
+logger = logging.getLogger(__name__)
+
+
+class SeasonCommands(commands.Cog):
+    """시즌 초기화와 지난 시즌 순위 명령어"""
+
+    EMOJI_ADMIN = "👑"
+    EMOJI_TROPHY = "🏆"
+    PAGE_SIZE = 10
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.db_manager = DatabaseManager()
+        self.seasons = SeasonManager(self.db_manager)
+
+    @app_commands.command(name="시즌종료", description="[관리자 전용] 현재 시즌을 종료하고 모든 잔액/전적을 초기화합니다")
+    @admin_only()
+    @app_commands.describe(이름="종료할 시즌 이름 (순위표에 표시)")
+    async def end_season(self, interaction: discord.Interaction, 이름: str):
+        """시즌 종료 및 초기화"""
+        reply = AdaptiveResponder.start(interaction)
+        await reply.defer()
+
+        try:
+            season = await self.seasons.rollover(이름)
+
+            embed = discord.Embed(
+                title=f"{self.EMOJI_ADMIN} 시즌 종료: {season['name']}",
+                description=f"시즌 #{season['id']} 순위표가 보관되었고 새 시즌이 시작되었습니다.",
+                color=discord.Color.purple()
+            )
+            embed.add_field(name="참가자", value=f"{season['players']:,}명", inline=True)
+            embed.add_field(name="총 코인", value=f"{season['total_coins']:,} 코인", inline=True)
+            embed.add_field(name="교체 잠금 시간", value=f"{season['switch_seconds'] * 1000:.1f}ms", inline=True)
+
+            await reply.send(embed=embed)
+
+        except Exception as e:
+            logger.error(f"시즌 종료 오류: {e}", exc_info=True)
+            await reply.send("❌ 시즌 종료 중 오류가 발생했습니다.")
+
+    @app_commands.command(name="시즌순위", description="지난 시즌 순위를 확인합니다")
+    @app_commands.describe(
+        시즌="시즌 번호 (비우면 가장 최근 시즌)",
+        페이지="순위 페이지 (10명씩)"
+    )
+    async def season_standings(
+        self,
+        interaction: discord.Interaction,
+        시즌: Optional[int] = None,
+        페이지: int = 1
+    ):
+        """지난 시즌 순위 조회"""
+        reply = AdaptiveResponder.start(interaction)
+
+        try:
+            if 시즌 is None:
+                seasons = await self.seasons.list_seasons()
+                season = seasons[0] if seasons else None
+            else:
+                season = await self.seasons.get_season(시즌)
+
+            if not season or season.status != 'archived':
+                await reply.send("❌ 조회할 수 있는 시즌이 없습니다!")
+                return
+
+            page = max(1, 페이지)
+            rows = await self.seasons.get_standings(season, offset=(page - 1) * self.PAGE_SIZE, limit=self.PAGE_SIZE)
+            me = await self.seasons.get_player(season, interaction.user.id)
+
+            embed = discord.Embed(
+                title=f"{self.EMOJI_TROPHY} 시즌 #{season.id} {season.name} 순위",
+                description=f"종료: {season.ended_at.strftime('%Y-%m-%d')} · 참가자 {season.players:,}명",
+                color=discord.Color.gold()
+            )
+
+            if rows:
+                embed.add_field(
+                    name=f"{page}페이지",
+                    value="\n".join(
+                        f"**{row['rank']}.** <@{row['discord_id']}> - {row['coins']:,} 코인 "
+                        f"({row['games_won']}승 {row['games_lost']}패)"
+                        for row in rows
+                    ),
+                    inline=False
+                )
+            else:
+                embed.add_field(name=f"{page}페이지", value="기록이 없습니다.", inline=False)
+
+            if me:
+                embed.add_field(
+                    name="내 순위",
+                    value=f"**{me['rank']}위** - {me['coins']:,} 코인",
+                    inline=False
+                )
+
+            await reply.send(embed=embed)
+
+        except Exception as e:
+            logger.error(f"시즌 순위 조회 오류: {e}", exc_info=True)
+            await reply.send("❌ 시즌 순위 조회 중 오류가 발생했습니다.")
+
+
+async def setup(bot: commands.Bot):
+    """Cog 설정"""
+    await bot.add_cog(SeasonCommands(bot))
@@ -4,10 +4,11 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import asyncio
 import logging
+from datetime import timezone
 from database.db_manager import DatabaseManager
 from game.slot_machine import SlotMachineManager
+from utils.responder import AdaptiveResponder
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,7 @@ class SlotMachineCommands(commands.Cog):
     @app_commands.describe(배팅="배팅할 코인 (최소 10)")
     async def slot(self, interaction: discord.Interaction, 배팅: int):
         """슬롯머신 플레이"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
             async with self.db_manager.session() as session:
@@ -37,7 +38,8 @@ class SlotMachineCommands(commands.Cog):
                 result = await slot_manager.play(
                     player_id=interaction.user.id,
                     player_name=interaction.user.display_name,
-                    bet_amount=배팅
+                    bet_amount=배팅,
+                    guild_id=interaction.guild_id
                 )
                 
                 # 릴 애니메이션 효과
@@ -59,11 +61,6 @@ class SlotMachineCommands(commands.Cog):
                     inline=False
                 )
                 
-                msg = await interaction.followup.send(embed=embed)
-                
-                # 짧은 딜레이
-                await asyncio.sleep(1)
-                
                 # 결과 표시
                 result_embed = discord.Embed(
                     title=f"{self.EMOJI_SLOT} 슬롯머신 결과",
@@ -128,27 +125,35 @@ class SlotMachineCommands(commands.Cog):
                     inline=True
                 )
                 
-                await msg.edit(embed=result_embed)
+                # 스핀 화면 → 결과 공개는 공용 틱커가 모아서 처리 (부하가 높으면 결과만 전송)
+                self.bot.animation.play(
+                    reply,
+                    channel_id=reply.channel_id,
+                    guild_id=interaction.guild_id,
+                    frame={'embed': embed},
+                    result={'embed': result_embed}
+                )
                 
         except ValueError as e:
-            await interaction.followup.send(f"❌ {str(e)}")
+            await reply.send(f"❌ {str(e)}")
         except Exception as e:
             logger.error(f"슬롯머신 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 슬롯머신 플레이 중 오류가 발생했습니다.")
+            await reply.send("❌ 슬롯머신 플레이 중 오류가 발생했습니다.")
     
     @app_commands.command(name="슬롯통계", description="나의 슬롯머신 플레이 통계를 확인합니다")
     async def slot_stats(self, interaction: discord.Interaction):
         """슬롯머신 통계"""
-        await interaction.response.defer()
+        reply = AdaptiveResponder.start(interaction)
         
         try:
-            async with self.db_manager.session() as session:
+            # 무거운 집계는 최신 백업 스냅샷에서 (게임 쓰기와 경쟁하지 않음)
+            async with self.db_manager.analytics_session() as session:
                 slot_manager = SlotMachineManager(session)
                 
                 stats = await slot_manager.get_stats(interaction.user.id)
                 
                 if not stats:
-                    await interaction.followup.send("❌ 슬롯머신 플레이 기록이 없습니다!")
+                    await reply.send("❌ 슬롯머신 플레이 기록이 없습니다!")
                     return
                 
                 embed = discord.Embed(
@@ -202,11 +207,16 @@ class SlotMachineCommands(commands.Cog):
                         inline=False
                     )
                 
-                await interaction.followup.send(embed=embed)
+                taken_at = self.db_manager.analytics_taken_at()
+                if taken_at is not None:
+                    embed.set_footer(text="집계 기준")
+                    embed.timestamp = taken_at.replace(tzinfo=timezone.utc)
+                
+                await reply.send(embed=embed)
                 
         except Exception as e:
             logger.error(f"슬롯통계 오류: {e}", exc_info=True)
-            await interaction.followup.send("❌ 통계 조회 중 오류가 발생했습니다.")
+            await reply.send("❌ 통계 조회 중 오류가 발생했습니다.")
     
     def _get_result_color(self, result: dict) -> discord.Color:
         """결과에 따른 색상"""
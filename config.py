@@ -16,6 +16,98 @@ class Config:
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_DIR = 'data/logs'
     
+    # ===== 아카이브 (콜드 스토리지) =====
+    ARCHIVE_DIR = os.getenv('ARCHIVE_DIR', 'data/archive')
+    ARCHIVE_AFTER_DAYS = int(os.getenv('ARCHIVE_AFTER_DAYS', '7'))  # 종료 후 N일 지난 기록 이동
+    ARCHIVE_RETENTION_DAYS = int(os.getenv('ARCHIVE_RETENTION_DAYS', '365'))  # 0이면 영구 보관
+    ARCHIVE_BATCH_SIZE = int(os.getenv('ARCHIVE_BATCH_SIZE', '500'))
+    ARCHIVE_INTERVAL_HOURS = float(os.getenv('ARCHIVE_INTERVAL_HOURS', '6'))
+    SLOT_ROLLUP_BATCH_SIZE = int(os.getenv('SLOT_ROLLUP_BATCH_SIZE', '500'))  # 슬롯 기록 요약/삭제 시작 배치 크기 (잠금 시간에 맞춰 조절)
+    SLOT_ROLLUP_MAX_LOCK_MS = float(os.getenv('SLOT_ROLLUP_MAX_LOCK_MS', '5'))  # 배치 하나가 쓰기 잠금을 잡는 목표 상한 (밀리초)
+    SLOT_ROLLUP_PAUSE = float(os.getenv('SLOT_ROLLUP_PAUSE', '0.02'))  # 배치 사이 대기 (초)
+    
+    # ===== DB 유지보수 =====
+    DB_WAL = os.getenv('DB_WAL', 'true').lower() == 'true'  # WAL 저널 모드 (읽기가 쓰기를 기다리지 않음)
+    DB_IDLE_COMMANDS_PER_MINUTE = float(os.getenv('DB_IDLE_COMMANDS_PER_MINUTE', '5'))  # 분당 명령어가 이 이하면 무거운 작업 실행
+    DB_CHECKPOINT_MINUTES = float(os.getenv('DB_CHECKPOINT_MINUTES', '5'))  # PASSIVE 체크포인트 주기
+    DB_OPTIMIZE_HOURS = float(os.getenv('DB_OPTIMIZE_HOURS', '6'))  # 플래너 통계 갱신 주기
+    DB_VACUUM_HOURS = float(os.getenv('DB_VACUUM_HOURS', '1'))  # incremental_vacuum 주기
+    DB_TRUNCATE_HOURS = float(os.getenv('DB_TRUNCATE_HOURS', '24'))  # WAL 파일을 비우는 TRUNCATE 체크포인트 주기
+    VACUUM_STEP_PAGES = int(os.getenv('VACUUM_STEP_PAGES', '256'))  # incremental_vacuum 한 번에 반환할 페이지 수
+    
+    # ===== 백업 / 분석 DB =====
+    BACKUP_DIR = os.getenv('BACKUP_DIR', 'data/backups')
+    BACKUP_INTERVAL_MINUTES = float(os.getenv('BACKUP_INTERVAL_MINUTES', '30'))  # 스냅샷 주기 (최신 스냅샷이 분석 DB)
+    BACKUP_KEEP = int(os.getenv('BACKUP_KEEP', '48'))  # 남겨 둘 스냅샷 수
+    BACKUP_STEP_PAGES = int(os.getenv('BACKUP_STEP_PAGES', '256'))  # 백업 한 단계에 복사할 페이지 수
+    BACKUP_PAUSE = float(os.getenv('BACKUP_PAUSE', '0.01'))  # 단계 사이 대기 (초)
+    EXPORT_DIR = os.getenv('EXPORT_DIR', 'data/exports')  # 기록 내보내기 파일 위치
+    EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '5000'))  # 내보내기 때 한 번에 읽어 쓸 행 수
+    
+    # ===== 서버별 집계 =====
+    GUILD_STATS_INTERVAL_MINUTES = float(os.getenv('GUILD_STATS_INTERVAL_MINUTES', '10'))  # 새 기록을 서버별 일간 집계에 반영하는 주기
+    GUILD_STATS_BATCH_SIZE = int(os.getenv('GUILD_STATS_BATCH_SIZE', '5000'))  # 한 트랜잭션에 반영할 원본 ID 범위
+    
+    # ===== 방치 게임 정리 =====
+    REAPER_INTERVAL_MINUTES = float(os.getenv('REAPER_INTERVAL_MINUTES', '5'))
+    LOBBY_EXPIRE_MINUTES = int(os.getenv('LOBBY_EXPIRE_MINUTES', '30'))  # 대기 중 게임 만료
+    GAME_EXPIRE_MINUTES = int(os.getenv('GAME_EXPIRE_MINUTES', '30'))  # 진행 중 게임 무응답 만료
+    REAPER_BATCH_SIZE = int(os.getenv('REAPER_BATCH_SIZE', '50'))
+    REAPER_BLACKJACK_MODE = os.getenv('REAPER_BLACKJACK_MODE', 'settle')  # settle 또는 refund
+    
+    # ===== 턴 타이머 =====
+    TIMER_TICK_SECONDS = float(os.getenv('TIMER_TICK_SECONDS', '0.5'))
+    LOBBY_TIMEOUT = int(os.getenv('LOBBY_TIMEOUT', '300'))  # 대기실 자동 시작/취소 (초)
+    BLACKJACK_TURN_TIMEOUT = int(os.getenv('BLACKJACK_TURN_TIMEOUT', '60'))  # 자동 스탠드 (초)
+    ROULETTE_TURN_TIMEOUT = int(os.getenv('ROULETTE_TURN_TIMEOUT', '60'))  # 자동 발사 (초)
+    
+    # ===== 메시지 전송 스케줄러 =====
+    OUTBOUND_CHANNEL_RATE = int(os.getenv('OUTBOUND_CHANNEL_RATE', '5'))  # 채널당 OUTBOUND_CHANNEL_PER초 동안 최대 요청 수
+    OUTBOUND_CHANNEL_PER = float(os.getenv('OUTBOUND_CHANNEL_PER', '5.0'))
+    OUTBOUND_MAX_QUEUE = int(os.getenv('OUTBOUND_MAX_QUEUE', '100'))  # 채널별 대기열 한도 (넘으면 연출 메시지부터 버림)
+    MAX_RATELIMIT_WAIT = float(os.getenv('MAX_RATELIMIT_WAIT', '30'))  # 이보다 긴 429 대기는 스케줄러가 재시도 (최소 30초)
+    
+    # ===== 애니메이션 =====
+    ANIMATION_TICK_SECONDS = float(os.getenv('ANIMATION_TICK_SECONDS', '1.0'))  # 연출 화면 → 결과 공개 틱
+    ANIMATION_INSTANT_THRESHOLD = int(os.getenv('ANIMATION_INSTANT_THRESHOLD', '5'))  # 서버당 대기 연출이 이 수 이상이면 즉시 모드
+    ANIMATION_CHANNEL_BACKLOG = int(os.getenv('ANIMATION_CHANNEL_BACKLOG', '5'))  # 채널 전송 대기열이 이 수 이상이면 연출 생략
+    
+    # ===== 명령어 응답 =====
+    RESPONSE_BUDGET_SECONDS = float(os.getenv('RESPONSE_BUDGET_SECONDS', '1.5'))  # 이 안에 끝나면 defer 없이 바로 응답
+    
+    # ===== 부수 작업 (타임아웃 등) =====
+    SIDE_EFFECT_QUEUE_SIZE = int(os.getenv('SIDE_EFFECT_QUEUE_SIZE', '500'))
+    SIDE_EFFECT_WORKERS = int(os.getenv('SIDE_EFFECT_WORKERS', '2'))
+    SIDE_EFFECT_MAX_RETRIES = int(os.getenv('SIDE_EFFECT_MAX_RETRIES', '3'))
+    
+    # ===== 게이트웨이 =====
+    # guilds 인텐트만 사용, 멤버 캐시/청킹 끔 (메시지를 받지 않으므로 ! 접두어 명령어는 동작하지 않음)
+    # 이번 릴리스는 기존 동작을 유지하도록 false가 기본값이며, 다음 릴리스에서 true로 바뀜
+    LEAN_GATEWAY = os.getenv('LEAN_GATEWAY', 'false').lower() == 'true'
+    GATEWAY_METRICS = os.getenv('GATEWAY_METRICS', 'false').lower() == 'true'  # 수신 바이트/이벤트 수 기록 (디버그 이벤트 활성화)
+    MEMBER_LOOKUP_SIZE = int(os.getenv('MEMBER_LOOKUP_SIZE', '1024'))  # 지연 조회한 멤버 LRU 캐시 크기
+    MEMBER_LOOKUP_TTL = float(os.getenv('MEMBER_LOOKUP_TTL', '600'))  # 캐시된 멤버 유효 시간 (초)
+    
+    # ===== 슬래시 명령어 동기화 =====
+    COMMAND_SYNC_STATE = os.getenv('COMMAND_SYNC_STATE', 'data/command_sync.json')  # 마지막 동기화 해시 저장 위치
+    DEV_GUILD_ID = int(os.getenv('DEV_GUILD_ID', '0')) or None  # 지정하면 전역 대신 이 서버에만 동기화 (개발용)
+    FORCE_COMMAND_SYNC = os.getenv('FORCE_COMMAND_SYNC', 'false').lower() == 'true'  # 시작 시 해시와 관계없이 동기화
+    
+    # ===== 관리자 권한 =====
+    ADMIN_ROLE_IDS = [int(x) for x in os.getenv('ADMIN_ROLE_IDS', '').split(',') if x.strip()]  # 쉼표로 구분한 관리자 역할 ID
+    ADMIN_REFRESH_MINUTES = float(os.getenv('ADMIN_REFRESH_MINUTES', '30'))  # 소유자/팀 멤버 목록 갱신 주기
+    
+    # ===== 일괄 코인 작업 =====
+    BULK_COIN_CHUNK_SIZE = int(os.getenv('BULK_COIN_CHUNK_SIZE', '200'))  # 한 트랜잭션에 반영할 멤버 수
+    BULK_COIN_CHUNK_DELAY = float(os.getenv('BULK_COIN_CHUNK_DELAY', '0.2'))  # 청크 사이 대기 (다른 게임에 DB 양보)
+    
+    # ===== 시즌 =====
+    SEASON_DIR = os.getenv('SEASON_DIR', 'data/seasons')  # 지난 시즌 순위표 아카이브 위치
+    SEASON_START_COINS = int(os.getenv('SEASON_START_COINS', '1000'))  # 새 시즌 시작 코인
+    
+    # ===== 시작 시간 =====
+    STARTUP_BUDGET_SECONDS = float(os.getenv('STARTUP_BUDGET_SECONDS', '10'))  # 프로세스 시작 → 준비 완료 허용 시간
+    
     @classmethod
     def validate(cls) -> bool:
         """필수 설정값 검증"""
@@ -32,6 +124,8 @@ class Config:
         print(f"  봇 토큰: {'✅ 설정됨' if cls.BOT_TOKEN else '❌ 없음'}")
         print(f"  로그 레벨: {cls.LOG_LEVEL}")
         print(f"  데이터베이스: {cls.DATABASE_URL}")
+        print(f"  아카이브: {cls.ARCHIVE_DIR} ({cls.ARCHIVE_AFTER_DAYS}일 경과 후 이동)")
+        print(f"  게이트웨이: {'경량 (슬래시 명령어 전용)' if cls.LEAN_GATEWAY else '기본 (! 접두어 명령어 사용 가능, 다음 릴리스부터 경량이 기본값)'}")
         print("=" * 60)
 
 
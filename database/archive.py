@@ -0,0 +1,308 @@
+"""
+게임 기록 아카이브 (콜드 스토리지)
+
+종료/취소된 게임과 오래된 슬롯 기록을 핫 테이블에서 빼내
+날짜별로 나뉜 gzip JSONL 세그먼트 파일로 옮깁니다.
+
+세그먼트 구조:
+    data/archive/<테이블>/<YYYY>/<YYYY-MM-DD>.jsonl.gz
+
+게임 세그먼트의 각 줄은 {"game": {...}, "players": [...]} 형태이고,
+슬롯 세그먼트의 각 줄은 slot_plays 한 행입니다. 슬롯 기록은 핫 테이블에서
+삭제할 때 유저별 일간 요약(slot_daily_summary)에 더해 통계가 유지됩니다.
+"""
+import asyncio
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Iterator
+from sqlalchemy import select, delete, and_, func
+from config import Config
+from database.models import (
+    RouletteGame, RoulettePlayer,
+    BlackjackGame, BlackjackPlayer,
+    SlotPlay,
+)
+from database.slot_rollup import SlotRollup
+
+logger = logging.getLogger(__name__)
+
+
+def row_to_dict(row) -> Dict:
+    """ORM 객체를 JSON 직렬화 가능한 딕셔너리로 변환"""
+    data = {}
+    for column in row.__table__.columns:
+        value = getattr(row, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        data[column.name] = value
+    return data
+
+
+class GameArchiver:
+    """종료된 게임 기록을 압축 세그먼트로 이동하고 조회하는 클래스"""
+
+    FINISHED_STATUSES = ('finished', 'cancelled')
+
+    # 아카이브 대상: 세그먼트 이름 → (게임 모델, 플레이어 모델)
+    GAME_TABLES = {
+        'roulette_games': (RouletteGame, RoulettePlayer),
+        'blackjack_games': (BlackjackGame, BlackjackPlayer),
+    }
+    SLOT_TABLE = 'slot_plays'
+
+    def __init__(self, db_manager, archive_dir: str = None, batch_size: int = None):
+        self.db_manager = db_manager
+        self.archive_dir = Path(archive_dir or Config.ARCHIVE_DIR)
+        self.batch_size = batch_size or Config.ARCHIVE_BATCH_SIZE
+        self.rollup = SlotRollup(db_manager)
+
+    # === 아카이브 ===
+
+    async def archive(self, older_than_days: int = None) -> Dict[str, int]:
+        """
+        기준일보다 오래된 종료 기록을 세그먼트로 이동
+
+        Args:
+            older_than_days: 종료 후 경과 일수 (기본: Config.ARCHIVE_AFTER_DAYS)
+
+        Returns:
+            테이블별 이동한 행 수
+        """
+        if older_than_days is None:
+            older_than_days = Config.ARCHIVE_AFTER_DAYS
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+
+        moved = {}
+        for table, (game_model, player_model) in self.GAME_TABLES.items():
+            moved[table] = await self._archive_games(table, game_model, player_model, cutoff)
+        moved[self.SLOT_TABLE] = await self._archive_slot_plays(cutoff)
+
+        logger.info(f"아카이브 완료 (기준: {cutoff:%Y-%m-%d}): {moved}")
+        return moved
+
+    async def _archive_games(self, table: str, game_model, player_model, cutoff: datetime) -> int:
+        """게임 + 참가자 행을 배치 단위로 이동"""
+        ended_at = func.coalesce(game_model.finished_at, game_model.created_at)
+        total = 0
+
+        while True:
+            async with self.db_manager.session() as session:
+                stmt = select(game_model).where(
+                    and_(
+                        game_model.status.in_(self.FINISHED_STATUSES),
+                        ended_at < cutoff
+                    )
+                ).order_by(game_model.id).limit(self.batch_size)
+                result = await session.execute(stmt)
+                games = result.scalars().all()
+
+                if not games:
+                    break
+
+                game_ids = [g.id for g in games]
+                stmt = select(player_model).where(player_model.game_id.in_(game_ids))
+                result = await session.execute(stmt)
+                players_by_game = {}
+                for player in result.scalars().all():
+                    players_by_game.setdefault(player.game_id, []).append(row_to_dict(player))
+
+                # 종료일 기준으로 파티션
+                partitions = {}
+                for game in games:
+                    day = (game.finished_at or game.created_at).date()
+                    partitions.setdefault(day, []).append({
+                        'game': row_to_dict(game),
+                        'players': players_by_game.get(game.id, [])
+                    })
+
+                # 세그먼트에 먼저 기록한 뒤 핫 테이블에서 삭제
+                await asyncio.to_thread(self._write_partitions, table, partitions)
+
+                await session.execute(delete(player_model).where(player_model.game_id.in_(game_ids)))
+                await session.execute(delete(game_model).where(game_model.id.in_(game_ids)))
+
+            total += len(game_ids)
+            if len(game_ids) < self.batch_size:
+                break
+            await asyncio.sleep(0)  # 배치 사이에 다른 작업에 양보
+
+        return total
+
+    async def _archive_slot_plays(self, cutoff: datetime) -> int:
+        """
+        오래된 슬롯 플레이 기록을 세그먼트에 기록한 뒤 일간 요약으로 압축
+
+        원본 삭제는 요약과 같은 트랜잭션에서 짧은 배치로 처리합니다 (SlotRollup).
+        """
+        last_id = 0
+
+        while True:
+            async with self.db_manager.session() as session:
+                stmt = select(SlotPlay).where(
+                    and_(SlotPlay.played_at < cutoff, SlotPlay.id > last_id)
+                ).order_by(SlotPlay.id).limit(self.batch_size)
+                result = await session.execute(stmt)
+                plays = result.scalars().all()
+
+            if not plays:
+                break
+
+            partitions = {}
+            for play in plays:
+                partitions.setdefault(play.played_at.date(), []).append(row_to_dict(play))
+
+            await asyncio.to_thread(self._write_partitions, self.SLOT_TABLE, partitions)
+
+            last_id = plays[-1].id
+            if len(plays) < self.batch_size:
+                break
+            await asyncio.sleep(0)
+
+        if not last_id:
+            return 0
+
+        # 세그먼트에 기록한 범위까지만 요약 후 삭제 (중단되면 다음 실행에서 다시 기록, 조회 시 중복 제거)
+        stats = await self.rollup.compact(cutoff, max_id=last_id)
+        return stats['compacted']
+
+    def _segment_path(self, table: str, day: date) -> Path:
+        """날짜별 세그먼트 파일 경로"""
+        return self.archive_dir / table / f"{day:%Y}" / f"{day:%Y-%m-%d}.jsonl.gz"
+
+    def _write_partitions(self, table: str, partitions: Dict[date, List[Dict]]):
+        """파티션별로 세그먼트에 추가 기록 (gzip 멤버 이어붙이기)"""
+        for day, records in partitions.items():
+            path = self._segment_path(table, day)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(path, 'ab') as raw:
+                with gzip.GzipFile(fileobj=raw, mode='ab') as gz:
+                    for record in records:
+                        gz.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+                        gz.write(b'\n')
+                raw.flush()
+                os.fsync(raw.fileno())
+
+    # === 보존 정책 ===
+
+    def apply_retention(self, retention_days: int = None) -> int:
+        """
+        보존 기간이 지난 세그먼트 파일 삭제
+
+        Returns:
+            삭제한 세그먼트 수 (retention_days가 0이면 삭제하지 않음)
+        """
+        if retention_days is None:
+            retention_days = Config.ARCHIVE_RETENTION_DAYS
+        if retention_days <= 0:
+            return 0
+
+        oldest_kept = (datetime.utcnow() - timedelta(days=retention_days)).date()
+        removed = 0
+
+        for path in self.archive_dir.glob('*/*/*.jsonl.gz'):
+            day = self._segment_day(path)
+            if day and day < oldest_kept:
+                path.unlink()
+                removed += 1
+
+        if removed:
+            logger.info(f"보존 기간 만료 세그먼트 {removed}개 삭제")
+        return removed
+
+    # === 조회 ===
+
+    async def query_history(
+        self,
+        table: str,
+        start: date = None,
+        end: date = None,
+        discord_id: int = None,
+        guild_id: int = None,
+        limit: int = 100
+    ) -> List[Dict]:
+        """
+        아카이브된 기록 조회 (최신 날짜부터)
+
+        Args:
+            table: 'roulette_games', 'blackjack_games', 'slot_plays'
+            start: 조회 시작일 (포함)
+            end: 조회 종료일 (포함)
+            discord_id: 특정 유저의 기록만
+            guild_id: 특정 서버의 게임만 (게임 테이블 전용)
+            limit: 최대 반환 개수
+        """
+        if table not in self.GAME_TABLES and table != self.SLOT_TABLE:
+            raise ValueError(f"알 수 없는 아카이브 테이블입니다: {table}")
+
+        return await asyncio.to_thread(
+            self._collect, table, start, end, discord_id, guild_id, limit
+        )
+
+    def _collect(self, table, start, end, discord_id, guild_id, limit) -> List[Dict]:
+        """세그먼트를 최신순으로 읽으며 조건에 맞는 기록 수집"""
+        records = []
+        seen = set()
+
+        for path in self._segments(table, start, end):
+            day_records = []
+            for record in self._read_segment(path):
+                row = record['game'] if table in self.GAME_TABLES else record
+
+                # 기록 후 삭제 전에 중단된 배치는 중복 기록될 수 있음
+                if row['id'] in seen:
+                    continue
+                seen.add(row['id'])
+
+                if guild_id is not None and str(row.get('guild_id')) != str(guild_id):
+                    continue
+                if discord_id is not None and not self._involves(table, record, discord_id):
+                    continue
+                day_records.append(record)
+
+            # 세그먼트 안에서는 오래된 순으로 쌓이므로 뒤집어서 최신순 유지
+            records.extend(reversed(day_records))
+            if len(records) >= limit:
+                break
+
+        return records[:limit]
+
+    def _involves(self, table: str, record: Dict, discord_id: int) -> bool:
+        """기록에 해당 유저가 포함되어 있는지"""
+        if table in self.GAME_TABLES:
+            return any(str(p['discord_id']) == str(discord_id) for p in record['players'])
+        return str(record['discord_id']) == str(discord_id)
+
+    def _segments(self, table: str, start: Optional[date], end: Optional[date]) -> List[Path]:
+        """기간에 해당하는 세그먼트 목록 (최신순)"""
+        paths = []
+        for path in (self.archive_dir / table).glob('*/*.jsonl.gz'):
+            day = self._segment_day(path)
+            if day is None:
+                continue
+            if start and day < start:
+                continue
+            if end and day > end:
+                continue
+            paths.append((day, path))
+        return [path for _, path in sorted(paths, reverse=True)]
+
+    @staticmethod
+    def _segment_day(path: Path) -> Optional[date]:
+        """세그먼트 파일 이름에서 날짜 추출"""
+        try:
+            return datetime.strptime(path.name[:10], '%Y-%m-%d').date()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _read_segment(path: Path) -> Iterator[Dict]:
+        """세그먼트 파일을 한 줄씩 읽기"""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
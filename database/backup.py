@@ -0,0 +1,207 @@
+"""
+온라인 백업과 분석용 스냅샷
+
+실행 중인 DB를 SQLite 온라인 백업 API로 작은 페이지 단위씩 복사해
+시각이 붙은 스냅샷 파일로 남기고, 오래된 스냅샷은 개수 기준으로
+지웁니다. 가장 최근 스냅샷은 읽기 전용 분석 DB로 등록되어 통계와
+관리자 보고용 무거운 읽기가 게임 쓰기와 경쟁하지 않습니다.
+
+스냅샷 구조:
+    data/backups/snapshot-<YYYYMMDD>-<HHMMSS>.db
+
+복사 중에 다른 연결이 DB에 쓰면 SQLite가 복사를 처음부터 다시 시작합니다.
+재시작이 계속되면 나머지를 한 번에 복사합니다 (WAL 모드에서는 읽기
+트랜잭션 하나로 끝나므로 쓰기를 막지 않음).
+
+사용 예시:
+    bot.backups = BackupService()
+    bot.backups.start()
+
+    async with db_manager.analytics_session() as session:
+        ...
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from config import Config
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PREFIX = 'snapshot-'
+SNAPSHOT_TIME_FORMAT = '%Y%m%d-%H%M%S'
+
+
+class BackupRestarted(Exception):
+    """복사 중 원본이 바뀌어 백업이 너무 자주 다시 시작됨"""
+
+
+def snapshot_time(path: Path) -> Optional[datetime]:
+    """스냅샷 파일 이름의 생성 시각 (UTC)"""
+    try:
+        return datetime.strptime(path.stem[len(SNAPSHOT_PREFIX):], SNAPSHOT_TIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def list_snapshots(backup_dir: str = None) -> List[Path]:
+    """스냅샷 파일 목록 (오래된 순)"""
+    backup_dir = Path(backup_dir or Config.BACKUP_DIR)
+    return sorted(
+        (path for path in backup_dir.glob(f'{SNAPSHOT_PREFIX}*.db') if snapshot_time(path) is not None),
+        key=snapshot_time
+    )
+
+
+class BackupService:
+    """주기적인 온라인 백업, 스냅샷 순환, 분석 DB 등록"""
+
+    MAX_RESTARTS = 3
+
+    def __init__(self, db_path: str = None, backup_dir: str = None, interval: float = None, keep: int = None,
+                 step_pages: int = None, pause: float = None):
+        """
+        Args:
+            db_path: 원본 SQLite 파일 경로 (기본: Config.DATABASE_URL)
+            backup_dir: 스냅샷 저장 위치
+            interval: 백업 주기 (초)
+            keep: 남겨 둘 스냅샷 수
+            step_pages: 백업 한 단계에 복사할 페이지 수
+            pause: 단계 사이 대기 (초)
+        """
+        # DatabaseManager.sqlite_path()와 같은 변환 (SQLAlchemy 임포트 없이 봇 시작 시 생성)
+        self.db_path = db_path or Config.DATABASE_URL.replace('sqlite:///', '')
+        self.backup_dir = Path(backup_dir or Config.BACKUP_DIR)
+        self.interval = Config.BACKUP_INTERVAL_MINUTES * 60 if interval is None else interval
+        self.keep = keep or Config.BACKUP_KEEP
+        self.step_pages = step_pages or Config.BACKUP_STEP_PAGES
+        self.pause = Config.BACKUP_PAUSE if pause is None else pause
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    # === 실행 ===
+
+    def start(self):
+        """주기적 백업 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name='db-backup')
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        # 재시작 전에 만든 스냅샷이 아직 충분히 최근이면 그것부터 분석 DB로 사용
+        latest = self.latest()
+        if latest is not None:
+            self.publish(latest)
+            age = (datetime.utcnow() - snapshot_time(latest)).total_seconds()
+            await asyncio.sleep(max(0.0, self.interval - age))
+
+        while True:
+            try:
+                await self.snapshot()
+            except Exception as e:
+                metrics.inc('backup.failed')
+                logger.error(f"DB 백업 오류: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    def latest(self) -> Optional[Path]:
+        snapshots = list_snapshots(self.backup_dir)
+        return snapshots[-1] if snapshots else None
+
+    async def snapshot(self) -> Dict:
+        """
+        스냅샷 하나 생성 → 분석 DB로 등록 → 오래된 스냅샷 삭제
+
+        Returns:
+            {'path', 'pages', 'steps', 'restarts', 'seconds'}
+        """
+        async with self._lock:
+            result = await asyncio.to_thread(self._snapshot)
+            self.publish(result['path'])
+            result['removed'] = await asyncio.to_thread(self._rotate)
+
+        metrics.inc('backup.snapshots')
+        metrics.observe('backup.seconds', result['seconds'])
+        logger.info(
+            f"DB 백업 완료: {result['path'].name} ({result['pages']}페이지, 단계 {result['steps']}개, "
+            f"재시작 {result['restarts']}회, {result['seconds']:.1f}초, 삭제 {result['removed']}개)"
+        )
+        return result
+
+    # === 백업 ===
+
+    def _snapshot(self) -> Dict:
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        taken_at = datetime.utcnow()
+        path = self.backup_dir / f'{SNAPSHOT_PREFIX}{taken_at.strftime(SNAPSHOT_TIME_FORMAT)}.db'
+        partial = path.with_suffix('.db.partial')
+        partial.unlink(missing_ok=True)
+
+        started = time.perf_counter()
+        source = sqlite3.connect(self.db_path, timeout=30)
+        target = sqlite3.connect(partial)
+        try:
+            progress = {'steps': 0, 'restarts': 0, 'remaining': None}
+            try:
+                source.backup(target, pages=self.step_pages, progress=self._progress(progress), sleep=self.pause)
+            except BackupRestarted:
+                logger.info(f"백업이 {progress['restarts']}회 다시 시작되어 나머지를 한 번에 복사합니다.")
+                source.backup(target, pages=-1)
+                progress['steps'] += 1
+
+            # 복사본은 원본의 WAL 설정을 물려받음 - 읽기 전용으로 열 수 있도록 롤백 저널로
+            target.execute('PRAGMA journal_mode = DELETE')
+            pages = target.execute('PRAGMA page_count').fetchone()[0]
+        finally:
+            target.close()
+            source.close()
+
+        partial.replace(path)
+        return {
+            'path': path,
+            'pages': pages,
+            'steps': progress['steps'],
+            'restarts': progress['restarts'],
+            'seconds': time.perf_counter() - started,
+        }
+
+    def _progress(self, progress: Dict):
+        """단계마다 호출 - 남은 페이지 수가 늘어나면 원본이 바뀌어 처음부터 다시 시작한 것"""
+        def callback(status, remaining, total):
+            progress['steps'] += 1
+            if progress['remaining'] is not None and remaining > progress['remaining']:
+                progress['restarts'] += 1
+                metrics.inc('backup.restarts')
+                if progress['restarts'] >= self.MAX_RESTARTS:
+                    raise BackupRestarted()
+            progress['remaining'] = remaining
+            # backup()의 sleep 인자는 잠금 대기에만 쓰이므로 단계 사이 간격은 여기서
+            if remaining:
+                time.sleep(self.pause)
+        return callback
+
+    def _rotate(self) -> int:
+        """최근 keep개를 남기고 삭제"""
+        snapshots = list_snapshots(self.backup_dir)
+        expired = snapshots[:-self.keep] if len(snapshots) > self.keep else []
+        for path in expired:
+            # 분석 세션이 아직 열어 둔 파일도 삭제 가능 (닫힐 때 해제됨)
+            path.unlink(missing_ok=True)
+        return len(expired)
+
+    @staticmethod
+    def publish(path: Path):
+        """스냅샷을 읽기 전용 분석 DB로 등록 (SQLAlchemy는 이때 처음 임포트)"""
+        from database.db_manager import DatabaseManager
+        DatabaseManager.use_analytics_snapshot(str(path), snapshot_time(path))
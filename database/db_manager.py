@@ -3,12 +3,16 @@
 """
 import logging
 from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
+from sqlalchemy import Integer, inspect, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
 from config import Config
 from database.models import Base
+from database.player_stats import backfill_player_stats
+from database.user_search import ensure_search_schema
 
 logger = logging.getLogger(__name__)
 
@@ -16,39 +20,171 @@ logger = logging.getLogger(__name__)
 class DatabaseManager:
     """데이터베이스 연결 및 세션 관리"""
     
+    # URL별로 엔진과 세션 팩토리를 하나만 만들어 모든 Cog가 공유
+    _shared = {}
+    
+    # 읽기 전용 분석 DB (최신 백업 스냅샷) - database.backup이 등록
+    _analytics = None
+    
     def __init__(self):
         # SQLite URL 변환 (sqlite:/// → sqlite+aiosqlite:///)
         db_url = Config.DATABASE_URL
         if db_url.startswith('sqlite:///'):
             db_url = db_url.replace('sqlite:///', 'sqlite+aiosqlite:///')
         
-        self.engine = create_async_engine(
-            db_url,
-            echo=False,  # SQL 쿼리 로깅 (개발 시 True)
-            poolclass=NullPool,  # SQLite는 연결 풀링 불필요
-        )
+        shared = self._shared.get(db_url)
+        if shared is None:
+            engine = create_async_engine(
+                db_url,
+                echo=False,  # SQL 쿼리 로깅 (개발 시 True)
+                poolclass=NullPool,  # SQLite는 연결 풀링 불필요
+            )
+            
+            session_factory = async_sessionmaker(
+                engine,
+                class_=AsyncSession,
+                expire_on_commit=False
+            )
+            
+            shared = self._shared[db_url] = (engine, session_factory)
+            logger.info(f"데이터베이스 연결 설정 완료: {db_url}")
         
-        self.async_session = async_sessionmaker(
-            self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
-        
-        logger.info(f"데이터베이스 연결 설정 완료: {db_url}")
+        self.db_url = db_url
+        self.engine, self.async_session = shared
+    
+    @staticmethod
+    def sqlite_path() -> str:
+        """SQLite 데이터베이스 파일 경로 (동기 sqlite3 작업용)"""
+        return Config.DATABASE_URL.replace('sqlite:///', '')
     
     async def init_database(self):
         """데이터베이스 초기화 (테이블 생성)"""
         # 데이터베이스 디렉토리 생성
-        db_path = Config.DATABASE_URL.replace('sqlite:///', '')
-        db_dir = Path(db_path).parent
+        db_dir = Path(self.sqlite_path()).parent
         db_dir.mkdir(parents=True, exist_ok=True)
         
         async with self.engine.begin() as conn:
+            # 삭제로 생긴 빈 페이지를 조금씩 반환할 수 있도록 (테이블이 없는 새 DB에만 적용됨)
+            await conn.exec_driver_sql('PRAGMA auto_vacuum = INCREMENTAL')
+            if Config.DB_WAL:
+                # DB 파일에 저장되는 설정 - 이후 모든 연결이 WAL 사용 (체크포인트는 database.maintenance)
+                await conn.exec_driver_sql('PRAGMA journal_mode = WAL')
             # 모든 테이블 생성
             await conn.run_sync(Base.metadata.create_all)
+            # 기존 테이블에 새 컬럼/인덱스 반영
+            await conn.run_sync(self._sync_schema)
+            # 유저 이름 검색 색인 (FTS5) 및 동기화 트리거
+            await conn.run_sync(ensure_search_schema)
+            # 유저별 게임 전적 (테이블이 비어 있을 때만 기존 기록으로 채움)
+            await conn.run_sync(backfill_player_stats)
         
         logger.info("✓ 데이터베이스 테이블 생성 완료")
     
+    @staticmethod
+    def _sync_schema(conn):
+        """
+        기존 테이블에 모델에 새로 추가된 컬럼과 인덱스 반영
+        
+        create_all은 이미 존재하는 테이블을 건드리지 않으므로,
+        누락된 컬럼은 ALTER TABLE로 추가하고 인덱스는 개별 생성합니다.
+        컬럼 info의 'backfill_from' 값으로 기존 행을 채울 수 있습니다.
+        """
+        inspector = inspect(conn)
+        
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            
+            existing = {c['name']: c for c in inspector.get_columns(table.name)}
+            existing_types = {name: c['type'] for name, c in existing.items()}
+            existing_columns = set(existing_types)
+            
+            # 타입 변경/컬럼 삭제/NOT NULL 해제/AUTOINCREMENT는 ALTER TABLE로 할 수 없음 - 온라인 마이그레이션 스크립트로 재구성
+            legacy = [
+                c.name for c in table.columns
+                if c.name in existing_types
+                and isinstance(c.type, Integer) and not isinstance(existing_types[c.name], Integer)
+            ]
+            dropped = sorted(existing_columns - {c.name for c in table.columns})
+            relaxed = [c.name for c in table.columns if c.nullable and c.name in existing and not existing[c.name]['nullable']]
+            autoincrement = table.dialect_options['sqlite']['autoincrement'] and 'AUTOINCREMENT' not in conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {'name': table.name}
+            ).scalar().upper()
+            if legacy or dropped or relaxed or autoincrement:
+                logger.warning(
+                    f"{table.name} 스키마가 모델과 다릅니다 "
+                    f"(정수 변환: {legacy or '-'}, 삭제: {dropped or '-'}, NOT NULL 해제: {relaxed or '-'}, "
+                    f"AUTOINCREMENT: {'추가' if autoincrement else '-'}). "
+                    f"`python -m database.migrate_schema`로 마이그레이션하세요."
+                )
+            
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                
+                column_type = column.type.compile(dialect=conn.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                
+                backfill = column.info.get('backfill_from')
+                if backfill is not None:
+                    conn.execute(text(f'UPDATE {table.name} SET {column.name} = {backfill}'))
+                
+                logger.info(f"컬럼 추가: {table.name}.{column.name}")
+            
+            existing_indexes = {i['name'] for i in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(conn)
+                    logger.info(f"인덱스 생성: {index.name}")
+            
+            # 모델에서 빠진 인덱스 삭제 (다른 인덱스로 대체된 경우 등, 모델 명명 규칙의 것만)
+            model_indexes = {index.name for index in table.indexes}
+            for name in existing_indexes - model_indexes:
+                if name.startswith(f'ix_{table.name}_'):
+                    conn.execute(text(f'DROP INDEX {name}'))
+                    logger.info(f"인덱스 삭제: {name}")
+    
+    @classmethod
+    def use_analytics_snapshot(cls, path: str, taken_at: datetime):
+        """백업 스냅샷을 읽기 전용 분석 DB로 등록 (이전 스냅샷 엔진은 정리)"""
+        previous = cls._analytics
+        engine = create_async_engine(
+            f'sqlite+aiosqlite:///file:{path}?mode=ro&uri=true',
+            echo=False,
+            poolclass=NullPool,
+        )
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        cls._analytics = {'path': path, 'taken_at': taken_at, 'engine': engine, 'session_factory': session_factory}
+        
+        # NullPool이라 열린 세션은 각자 연결을 닫을 때까지 그대로 동작
+        if previous is not None:
+            previous['engine'].sync_engine.dispose()
+        logger.info(f"분석 DB 스냅샷 등록: {path}")
+    
+    @classmethod
+    def analytics_taken_at(cls) -> Optional[datetime]:
+        """분석 DB 스냅샷 생성 시각 (UTC, 스냅샷이 없으면 None)"""
+        return cls._analytics['taken_at'] if cls._analytics else None
+    
+    @asynccontextmanager
+    async def analytics_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        통계/보고용 읽기 전용 세션
+        
+        최신 백업 스냅샷에서 읽어 게임 쓰기와 경쟁하지 않습니다.
+        스냅샷이 아직 없으면 원본 DB 세션을 사용합니다.
+        """
+        if self._analytics is None:
+            async with self.session() as session:
+                yield session
+            return
+        
+        async with self._analytics['session_factory']() as session:
+            try:
+                yield session
+            finally:
+                await session.close()
+    
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
         """
@@ -70,6 +206,7 @@ class DatabaseManager:
                 await session.close()
     
     async def close(self):
-        """데이터베이스 연결 종료"""
+        """데이터베이스 연결 종료 (공유 엔진이므로 모든 사용처에 적용)"""
+        self._shared.pop(self.db_url, None)
         await self.engine.dispose()
         logger.info("데이터베이스 연결 종료")
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+게임 기록 내보내기 (CSV / Parquet)
+
+slot_plays, blackjack_players, roulette_players 원본 행을 분석용 파일로
+내보냅니다. 행은 서버 측 커서(yield_per)로 일정 개수씩 읽어 바로 파일에
+쓰므로 테이블 크기와 관계없이 메모리 사용량이 일정합니다. 읽기는 백업
+스냅샷(분석 DB)에서 하므로 게임 쓰기를 막지 않습니다.
+
+플레이어 테이블은 게임 테이블의 서버 ID와 게임 상태를 붙여 내보냅니다.
+Parquet은 선택 의존성인 pyarrow가 필요하며, 읽어 온 묶음마다 행 그룹
+하나로 씁니다.
+
+실행:
+    python -m database.export slot_plays --format parquet --since 2026-01-01 --until 2026-02-01
+    python -m database.export blackjack_players --guild 1234 --use-latest
+"""
+import argparse
+import asyncio
+import csv
+import logging
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Integer, select
+from config import Config
+from database.backup import BackupService
+from database.db_manager import DatabaseManager
+from database.models import BlackjackGame, BlackjackPlayer, RouletteGame, RoulettePlayer, SlotPlay
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('csv', 'parquet')
+
+
+class ExportError(Exception):
+    """내보내기 조건이 잘못되었거나 필요한 모듈이 없음"""
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, columns):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([column.name for column in columns])
+
+    def write(self, rows):
+        self.writer.writerows(
+            [value.isoformat() if isinstance(value, (datetime, date)) else value for value in row]
+            for row in rows
+        )
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path, columns):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ExportError("Parquet 내보내기에는 pyarrow가 필요합니다. (pip install pyarrow)")
+
+        self.pa = pa
+        self.schema = pa.schema([(column.name, self._arrow_type(pa, column.type)) for column in columns])
+        self.writer = pq.ParquetWriter(path, self.schema, compression='zstd')
+
+    @staticmethod
+    def _arrow_type(pa, column_type):
+        if isinstance(column_type, Boolean):
+            return pa.bool_()
+        if isinstance(column_type, (Integer, BigInteger)):
+            return pa.int64()
+        if isinstance(column_type, DateTime):
+            return pa.timestamp('us')
+        if isinstance(column_type, Date):
+            return pa.date32()
+        return pa.string()
+
+    def write(self, rows):
+        # 묶음 하나 = 행 그룹 하나 (열 단위로 바꿔 씀)
+        columns = list(zip(*rows))
+        self.writer.write_table(self.pa.Table.from_arrays(
+            [self.pa.array(values, type=field.type) for values, field in zip(columns, self.schema)],
+            schema=self.schema
+        ))
+
+    def close(self):
+        self.writer.close()
+
+
+class HistoryExporter:
+    """게임 기록 테이블을 파일로 스트리밍"""
+
+    # 테이블 → (모델, 게임 모델, 날짜 필터 컬럼)
+    TABLES = {
+        'slot_plays': (SlotPlay, None, SlotPlay.played_at),
+        'blackjack_players': (BlackjackPlayer, BlackjackGame, BlackjackPlayer.joined_at),
+        'roulette_players': (RoulettePlayer, RouletteGame, RoulettePlayer.joined_at),
+    }
+
+    def __init__(self, db_manager: DatabaseManager, chunk_size: int = None):
+        self.db_manager = db_manager
+        self.chunk_size = chunk_size or Config.EXPORT_CHUNK_SIZE
+
+    def statement(self, table: str, start: Optional[date] = None, end: Optional[date] = None,
+                  guild_id: Optional[int] = None):
+        """
+        내보낼 행 조회문 (ID 순)
+
+        Args:
+            table: 내보낼 테이블
+            start: 이 날짜부터 (포함)
+            end: 이 날짜 전까지 (미포함)
+            guild_id: 이 서버의 기록만
+        """
+        if table not in self.TABLES:
+            raise ExportError(f"내보낼 수 없는 테이블입니다: {table}")
+        model, game_model, ts_column = self.TABLES[table]
+
+        if game_model is None:
+            # 슬롯 기록은 행마다 서버 ID가 있음 (기록 전 행은 None이라 필터에서 빠짐)
+            stmt = select(*model.__table__.columns)
+            if guild_id is not None:
+                stmt = stmt.where(model.guild_id == guild_id)
+        else:
+            stmt = select(
+                *model.__table__.columns,
+                game_model.guild_id.label('guild_id'),
+                game_model.status.label('game_status')
+            ).join(game_model, game_model.id == model.game_id)
+            if guild_id is not None:
+                stmt = stmt.where(game_model.guild_id == guild_id)
+
+        if start is not None:
+            stmt = stmt.where(ts_column >= datetime.combine(start, datetime.min.time()))
+        if end is not None:
+            stmt = stmt.where(ts_column < datetime.combine(end, datetime.min.time()))
+        return stmt.order_by(model.id)
+
+    async def export(self, table: str, path: Path, fmt: str = 'csv', start: Optional[date] = None,
+                     end: Optional[date] = None, guild_id: Optional[int] = None) -> Dict:
+        """
+        조건에 맞는 행을 파일로 내보내기 (분석 DB 스냅샷에서 읽음)
+
+        Returns:
+            {'path', 'rows', 'chunks', 'bytes'}
+        """
+        if fmt not in FORMATS:
+            raise ExportError(f"지원하지 않는 형식입니다: {fmt}")
+        stmt = self.statement(table, start, end, guild_id)
+        columns: List = list(stmt.selected_columns)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + '.partial')
+        writer = _ParquetWriter(partial, columns) if fmt == 'parquet' else _CsvWriter(partial, columns)
+
+        rows = chunks = 0
+        try:
+            async with self.db_manager.analytics_session() as session:
+                result = await session.stream(stmt, execution_options={'yield_per': self.chunk_size})
+                async for chunk in result.partitions():
+                    # 파일 쓰기는 이벤트 루프 밖에서
+                    await asyncio.to_thread(writer.write, chunk)
+                    rows += len(chunk)
+                    chunks += 1
+        except BaseException:
+            writer.close()
+            partial.unlink(missing_ok=True)
+            raise
+        writer.close()
+
+        partial.replace(path)
+        logger.info(f"기록 내보내기: {table} {rows}행 → {path}")
+        return {'path': path, 'rows': rows, 'chunks': chunks, 'bytes': path.stat().st_size}
+
+
+def default_path(table: str, fmt: str) -> Path:
+    """data/exports/<테이블>-<시각>.<형식>"""
+    return Path(Config.EXPORT_DIR) / f"{table}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.{fmt}"
+
+
+async def _run(args):
+    exporter = HistoryExporter(DatabaseManager(), args.chunk_size)
+    # 조건 오류는 스냅샷을 만들기 전에
+    exporter.statement(args.table, args.since, args.until, args.guild)
+
+    backups = BackupService()
+    latest = backups.latest()
+    if args.use_latest and latest is not None:
+        backups.publish(latest)
+    else:
+        await backups.snapshot()
+    print(f"기준 스냅샷: {DatabaseManager.analytics_taken_at():%Y-%m-%d %H:%M:%S} UTC")
+
+    try:
+        stats = await exporter.export(
+            args.table,
+            Path(args.output) if args.output else default_path(args.table, args.format),
+            fmt=args.format,
+            start=args.since,
+            end=args.until,
+            guild_id=args.guild
+        )
+        print(f"{stats['path']}: {stats['rows']}행 (묶음 {stats['chunks']}개, {stats['bytes']:,}바이트)")
+    finally:
+        await DatabaseManager().close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 기록을 CSV/Parquet으로 내보내기")
+    parser.add_argument('table', choices=sorted(HistoryExporter.TABLES))
+    parser.add_argument('--format', choices=FORMATS, default='csv')
+    parser.add_argument('--since', type=date.fromisoformat, help="이 날짜부터 (YYYY-MM-DD, 포함)")
+    parser.add_argument('--until', type=date.fromisoformat, help="이 날짜 전까지 (YYYY-MM-DD, 미포함)")
+    parser.add_argument('--guild', type=int, help="이 서버의 기록만")
+    parser.add_argument('--output', help="출력 파일 (기본: data/exports/<테이블>-<시각>.<형식>)")
+    parser.add_argument('--chunk-size', type=int, help="한 번에 읽어 쓸 행 수")
+    parser.add_argument('--use-latest', action='store_true', help="새 스냅샷 대신 가장 최근 백업에서 읽음")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+    try:
+        asyncio.run(_run(args))
+    except ExportError as e:
+        parser.error(str(e))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+"""
+서버별 일간 카지노 집계
+
+슬롯 플레이와 끝난 블랙잭/룰렛 게임을 (서버, 날짜, 게임)별 합계
+(guild_daily_stats)와 활동 플레이어 목록(guild_daily_players)에 더합니다.
+원본마다 마지막으로 반영한 ID를 rollup_state에 기록하고, 집계와 위치
+갱신을 같은 트랜잭션에서 하므로 중단되어도 두 번 더해지지 않습니다.
+원본 테이블은 AUTOINCREMENT라 아카이브로 비워져도 ID를 재사용하지 않습니다
+(기존 테이블은 재구성할 때 순번을 집계 위치 이상으로 맞춤).
+
+    slot        slot_plays.id 순서대로 (서버 정보가 없는 행은 건너뜀)
+    blackjack   끝난 게임 ID 순서대로 - 아직 진행 중인 가장 오래된 게임 직전까지만
+    roulette    〃
+
+게임은 시작 순서와 끝나는 순서가 다르므로, 진행 중인 게임보다 뒤의
+ID는 그 게임이 끝날 때까지 기다립니다 (방치 게임은 정리 작업이 끝냄).
+취소된 게임은 집계하지 않고 위치만 넘깁니다.
+
+사용 예시:
+    rollup = GuildStatsRollup(db_manager, roulette_reward=RussianRouletteGame.WIN_REWARD)
+    await rollup.run()
+
+    async with db_manager.session() as session:
+        report = await guild_report(session, guild_id, since)
+"""
+import asyncio
+import logging
+import sqlite3
+from datetime import date
+from typing import Dict, List
+from sqlalchemy import select, func, distinct
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import Config
+from database.migrations import register_swap_hook
+from database.models import GuildDailyStats, GuildDailyPlayer
+
+logger = logging.getLogger(__name__)
+
+GAMES = ('slot', 'blackjack', 'roulette')
+
+STATS_UPSERT = (
+    "ON CONFLICT (guild_id, day, game) DO UPDATE SET "
+    "rounds = rounds + excluded.rounds, "
+    "entries = entries + excluded.entries, "
+    "wagered = wagered + excluded.wagered, "
+    "paid_out = paid_out + excluded.paid_out"
+)
+
+# 게임 날짜는 끝난 날 기준
+GAME_DAY = "date(COALESCE(g.finished_at, g.updated_at))"
+
+# 게임 → (통계 INSERT...SELECT, 플레이어 INSERT...SELECT)
+ROLLUP_SQL = {
+    'slot': (
+        "INSERT INTO guild_daily_stats (guild_id, day, game, rounds, entries, wagered, paid_out) "
+        "SELECT guild_id, date(played_at), 'slot', COUNT(*), COUNT(*), SUM(bet_amount), SUM(payout) "
+        "FROM slot_plays WHERE id > :low AND id <= :high AND guild_id IS NOT NULL "
+        "GROUP BY guild_id, date(played_at) " + STATS_UPSERT,
+        "INSERT OR IGNORE INTO guild_daily_players (guild_id, day, game, discord_id) "
+        "SELECT DISTINCT guild_id, date(played_at), 'slot', discord_id "
+        "FROM slot_plays WHERE id > :low AND id <= :high AND guild_id IS NOT NULL",
+    ),
+    'blackjack': (
+        "INSERT INTO guild_daily_stats (guild_id, day, game, rounds, entries, wagered, paid_out) "
+        "SELECT g.guild_id, " + GAME_DAY + ", 'blackjack', COUNT(DISTINCT g.id), COUNT(*), "
+        "SUM(p.bet_amount), SUM(p.payout) "
+        "FROM blackjack_games g JOIN blackjack_players p ON p.game_id = g.id "
+        "WHERE g.id > :low AND g.id <= :high AND g.status = 'finished' "
+        "GROUP BY g.guild_id, " + GAME_DAY + " " + STATS_UPSERT,
+        "INSERT OR IGNORE INTO guild_daily_players (guild_id, day, game, discord_id) "
+        "SELECT DISTINCT g.guild_id, " + GAME_DAY + ", 'blackjack', p.discord_id "
+        "FROM blackjack_games g JOIN blackjack_players p ON p.game_id = g.id "
+        "WHERE g.id > :low AND g.id <= :high AND g.status = 'finished'",
+    ),
+    'roulette': (
+        # 판돈은 참가자마다, 승리 보상은 생존자마다
+        "INSERT INTO guild_daily_stats (guild_id, day, game, rounds, entries, wagered, paid_out) "
+        "SELECT g.guild_id, " + GAME_DAY + ", 'roulette', COUNT(DISTINCT g.id), COUNT(*), "
+        "SUM(g.bet_amount), SUM(p.is_winner) * :reward "
+        "FROM roulette_games g JOIN roulette_players p ON p.game_id = g.id "
+        "WHERE g.id > :low AND g.id <= :high AND g.status = 'finished' "
+        "GROUP BY g.guild_id, " + GAME_DAY + " " + STATS_UPSERT,
+        "INSERT OR IGNORE INTO guild_daily_players (guild_id, day, game, discord_id) "
+        "SELECT DISTINCT g.guild_id, " + GAME_DAY + ", 'roulette', p.discord_id "
+        "FROM roulette_games g JOIN roulette_players p ON p.game_id = g.id "
+        "WHERE g.id > :low AND g.id <= :high AND g.status = 'finished'",
+    ),
+}
+
+# 게임 → 원본 테이블 (ID 위치 기준)
+SOURCE_TABLES = {'slot': 'slot_plays', 'blackjack': 'blackjack_games', 'roulette': 'roulette_games'}
+
+ENDED_STATUSES = ('finished', 'cancelled')
+
+
+def _has_autoincrement(conn: sqlite3.Connection, table: str) -> bool:
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    return row is not None and 'AUTOINCREMENT' in row[0].upper()
+
+
+def reserve_rollup_ids(conn: sqlite3.Connection, game: str):
+    """
+    원본 테이블의 AUTOINCREMENT 순번을 집계 위치 이상으로 (호출한 트랜잭션 안에서)
+
+    재구성으로 AUTOINCREMENT가 붙을 때 순번은 남은 행의 최대 ID에서 시작하므로,
+    아카이브로 비워진 테이블이면 새 행이 이미 반영한 ID를 다시 받습니다.
+    """
+    table = SOURCE_TABLES[game]
+    if not _has_autoincrement(conn, table):
+        return
+    try:
+        row = conn.execute('SELECT last_id FROM rollup_state WHERE name = ?', (game,)).fetchone()
+    except sqlite3.OperationalError:
+        return  # 집계 테이블이 생기기 전의 DB
+    if row is None:
+        return
+
+    seq = conn.execute('SELECT seq FROM sqlite_sequence WHERE name = ?', (table,)).fetchone()
+    if seq is None:
+        conn.execute('INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)', (table, row[0]))
+    elif seq[0] < row[0]:
+        conn.execute('UPDATE sqlite_sequence SET seq = ? WHERE name = ?', (row[0], table))
+
+
+# 재구성(migrate_schema)으로 원본 테이블이 교체될 때 순번 맞춤
+for _game, _table in SOURCE_TABLES.items():
+    register_swap_hook(_table, lambda conn, game=_game: reserve_rollup_ids(conn, game))
+
+
+class GuildStatsRollup:
+    """서버별 일간 집계를 마지막 위치부터 이어서 갱신"""
+
+    def __init__(self, db_manager, roulette_reward: int, batch_size: int = None):
+        self.db_manager = db_manager
+        self.roulette_reward = roulette_reward
+        self.batch_size = batch_size or Config.GUILD_STATS_BATCH_SIZE
+
+    async def run(self) -> Dict[str, int]:
+        """
+        모든 게임의 새 기록 반영
+
+        Returns:
+            게임별 반영한 원본 ID 범위 크기
+        """
+        return await asyncio.to_thread(self._run)
+
+    def _run(self) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            advanced = {game: self._rollup(conn, game) for game in GAMES}
+        finally:
+            conn.close()
+
+        if any(advanced.values()):
+            logger.info(
+                "서버별 집계 갱신: " + ", ".join(f"{game} {count}" for game, count in advanced.items())
+            )
+        return advanced
+
+    def _rollup(self, conn: sqlite3.Connection, game: str) -> int:
+        table = SOURCE_TABLES[game]
+        row = conn.execute('SELECT last_id FROM rollup_state WHERE name = ?', (game,)).fetchone()
+        start = low = row[0] if row else 0
+        self._check_reused_ids(conn, table, low)
+
+        while True:
+            high = self._frontier(conn, game, table)
+            if high is None or high <= low:
+                break
+            high = min(high, low + self.batch_size)
+
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                params = {'low': low, 'high': high, 'reward': self.roulette_reward}
+                stats_sql, players_sql = ROLLUP_SQL[game]
+                conn.execute(stats_sql, params)
+                conn.execute(players_sql, params)
+                conn.execute(
+                    "INSERT INTO rollup_state (name, last_id, updated_at) VALUES (?, ?, datetime('now')) "
+                    "ON CONFLICT (name) DO UPDATE SET last_id = excluded.last_id, updated_at = excluded.updated_at",
+                    (game, high)
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            low = high
+
+        return low - start
+
+    @staticmethod
+    def _check_reused_ids(conn: sqlite3.Connection, table: str, last_id: int):
+        """마이그레이션 전(AUTOINCREMENT 없음) 테이블이 비워져 ID가 위치 아래로 돌아갔는지 경고"""
+        if not last_id or _has_autoincrement(conn, table):
+            return
+        if (conn.execute(f'SELECT MAX(id) FROM {table}').fetchone()[0] or 0) < last_id:
+            logger.warning(
+                f"{table} ID가 집계 위치({last_id})보다 작습니다. "
+                f"`python -m database.migrate_schema`로 AUTOINCREMENT를 적용하세요."
+            )
+
+    @staticmethod
+    def _frontier(conn: sqlite3.Connection, game: str, table: str):
+        """지금 집계해도 되는 마지막 ID (진행 중인 게임이 있으면 그 직전까지)"""
+        if game != 'slot':
+            pending = conn.execute(
+                f"SELECT MIN(id) FROM {table} WHERE status NOT IN {ENDED_STATUSES}"
+            ).fetchone()[0]
+            if pending is not None:
+                return pending - 1
+        return conn.execute(f'SELECT MAX(id) FROM {table}').fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        # 트랜잭션은 직접 관리 (BEGIN IMMEDIATE)
+        return sqlite3.connect(self.db_manager.sqlite_path(), timeout=30, isolation_level=None)
+
+
+async def guild_report(session: AsyncSession, guild_id: int, since: date) -> Dict:
+    """
+    기간 동안의 서버 카지노 통계 (집계 테이블만 읽음)
+
+    Returns:
+        {'games': {게임: {'rounds', 'entries', 'wagered', 'paid_out', 'players'}},
+         'daily': [(날짜, 게임, 판 수)], 'players': 기간 중 활동한 플레이어 수}
+    """
+    stmt = select(
+        GuildDailyStats.game,
+        func.sum(GuildDailyStats.rounds),
+        func.sum(GuildDailyStats.entries),
+        func.sum(GuildDailyStats.wagered),
+        func.sum(GuildDailyStats.paid_out),
+    ).where(
+        GuildDailyStats.guild_id == guild_id, GuildDailyStats.day >= since
+    ).group_by(GuildDailyStats.game)
+    games = {
+        game: {'rounds': rounds, 'entries': entries, 'wagered': wagered, 'paid_out': paid_out, 'players': 0}
+        for game, rounds, entries, wagered, paid_out in (await session.execute(stmt)).all()
+    }
+
+    stmt = select(
+        GuildDailyPlayer.game, func.count(distinct(GuildDailyPlayer.discord_id))
+    ).where(
+        GuildDailyPlayer.guild_id == guild_id, GuildDailyPlayer.day >= since
+    ).group_by(GuildDailyPlayer.game)
+    for game, players in (await session.execute(stmt)).all():
+        if game in games:
+            games[game]['players'] = players
+
+    stmt = select(func.count(distinct(GuildDailyPlayer.discord_id))).where(
+        GuildDailyPlayer.guild_id == guild_id, GuildDailyPlayer.day >= since
+    )
+    players = (await session.execute(stmt)).scalar_one()
+
+    stmt = select(GuildDailyStats.day, GuildDailyStats.game, GuildDailyStats.rounds).where(
+        GuildDailyStats.guild_id == guild_id, GuildDailyStats.day >= since
+    ).order_by(GuildDailyStats.day)
+    daily: List = (await session.execute(stmt)).all()
+
+    return {'games': games, 'daily': daily, 'players': players}
@@ -0,0 +1,221 @@
+"""
+DB 유지보수 스케줄러
+
+봇과 함께 시작되어 1분마다 깨어나서 밀린 유지보수 작업을 실행합니다.
+
+    checkpoint  PASSIVE 체크포인트 - 잠금을 기다리지 않으므로 항상 실행
+    optimize    쿼리 플래너 통계 갱신 (PRAGMA optimize / ANALYZE)
+    vacuum      삭제로 생긴 빈 페이지를 incremental_vacuum으로 조금씩 반환
+    truncate    TRUNCATE 체크포인트 - WAL 파일을 0바이트로 줄임
+
+checkpoint 외의 작업은 최근 명령어 처리량(command.responses)이 기준
+이하인 한가한 시간에만 실행하고, 주기의 두 배가 지나도록 한가한 시간이
+없으면 그냥 실행합니다. 작업마다 소요 시간과 페이지 수를 기록합니다.
+
+사용 예시:
+    bot.db_maintenance = DatabaseMaintenance()
+    bot.db_maintenance.start()
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from typing import Dict, Optional
+from config import Config
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 통계를 쓰지 않던 연결에서도 모든 테이블을 검사하는 optimize 옵션 (SQLite 3.46+)
+OPTIMIZE_ALL_TABLES = 0x10002
+
+
+class DatabaseMaintenance:
+    """주기적인 ANALYZE, incremental_vacuum, WAL 체크포인트"""
+
+    def __init__(self, db_path: str = None, tick: float = 60.0, idle_rate: float = None, intervals: Dict[str, float] = None,
+                 step_pages: int = None, pause: float = 0.02):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본: Config.DATABASE_URL)
+            tick: 스케줄 확인 간격 (초)
+            idle_rate: 분당 명령어 수가 이 이하면 한가한 시간
+            intervals: 작업별 실행 주기 (초)
+            step_pages: incremental_vacuum 한 번에 반환할 페이지 수
+            pause: vacuum 단계 사이 대기 (초)
+        """
+        # DatabaseManager.sqlite_path()와 같은 변환 (SQLAlchemy 임포트 없이 봇 시작 시 생성)
+        self.db_path = db_path or Config.DATABASE_URL.replace('sqlite:///', '')
+        self.tick = tick
+        self.idle_rate = Config.DB_IDLE_COMMANDS_PER_MINUTE if idle_rate is None else idle_rate
+        self.intervals = intervals or {
+            'checkpoint': Config.DB_CHECKPOINT_MINUTES * 60,
+            'optimize': Config.DB_OPTIMIZE_HOURS * 3600,
+            'vacuum': Config.DB_VACUUM_HOURS * 3600,
+            'truncate': Config.DB_TRUNCATE_HOURS * 3600,
+        }
+        self.step_pages = step_pages or Config.VACUUM_STEP_PAGES
+        self.pause = pause
+        self.last_run: Dict[str, float] = {}
+        self.command_rate = 0.0
+        self._last_commands: Optional[int] = None
+        self._last_sampled = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    # === 실행 ===
+
+    def start(self):
+        """스케줄러 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            now = time.monotonic()
+            # 시작 직후 재시작이 반복될 때 무거운 작업이 몰리지 않도록 주기를 새로 시작
+            self.last_run = {name: now for name in self.intervals}
+            self._task = asyncio.create_task(self._run(), name='db-maintenance')
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.tick)
+            try:
+                await self.run_due()
+            except Exception as e:
+                metrics.inc('db.maintenance_failed')
+                logger.error(f"DB 유지보수 오류: {e}", exc_info=True)
+
+    async def run_due(self) -> Dict[str, Dict]:
+        """주기가 된 작업 실행 (한가한 시간이거나 주기의 두 배가 지난 경우)"""
+        now = time.monotonic()
+        idle = self._sample_command_rate(now) <= self.idle_rate
+
+        results = {}
+        for name, interval in self.intervals.items():
+            elapsed = now - self.last_run.get(name, now)
+            if elapsed < interval:
+                continue
+            if name != 'checkpoint' and not idle and elapsed < interval * 2:
+                continue
+            results[name] = await self.run(name)
+            self.last_run[name] = time.monotonic()
+        return results
+
+    async def run(self, name: str) -> Dict:
+        """작업 하나를 스레드에서 실행하고 결과 기록"""
+        return await asyncio.to_thread(self._run_task, name)
+
+    def _sample_command_rate(self, now: float) -> float:
+        """지난 확인 이후 분당 명령어 응답 수"""
+        counters = metrics.snapshot('command.responses')['counters']
+        total = sum(counters.values())
+        if self._last_commands is not None and now > self._last_sampled:
+            self.command_rate = (total - self._last_commands) * 60 / (now - self._last_sampled)
+        self._last_commands, self._last_sampled = total, now
+        metrics.set_gauge('db.maintenance_command_rate', self.command_rate)
+        return self.command_rate
+
+    # === 작업 ===
+
+    def _run_task(self, name: str) -> Dict:
+        conn = self._connect()
+        try:
+            before = self._page_stats(conn)
+            started = time.perf_counter()
+            if name == 'checkpoint':
+                result = self._checkpoint(conn, 'PASSIVE')
+            elif name == 'truncate':
+                result = self._checkpoint(conn, 'TRUNCATE')
+            elif name == 'optimize':
+                result = self._optimize(conn)
+            elif name == 'vacuum':
+                result = self._incremental_vacuum(conn)
+            else:
+                raise ValueError(f"알 수 없는 유지보수 작업: {name}")
+            duration = time.perf_counter() - started
+            after = self._page_stats(conn)
+        finally:
+            conn.close()
+
+        metrics.observe('db.maintenance_seconds', duration, labels={'task': name})
+        metrics.set_gauge('db.page_count', after['page_count'])
+        metrics.set_gauge('db.freelist_pages', after['freelist'])
+
+        result.update(
+            duration_ms=round(duration * 1000, 1),
+            page_count=after['page_count'],
+            freelist=after['freelist'],
+        )
+        message = (
+            f"DB 유지보수 {name}: {result['duration_ms']}ms, "
+            f"페이지 {before['page_count']} → {after['page_count']}, "
+            f"빈 페이지 {before['freelist']} → {after['freelist']}"
+        )
+        if 'wal_frames' in result:
+            message += f", WAL 프레임 {result['wal_frames']} (반영 {result['checkpointed']})"
+        # PASSIVE 체크포인트는 자주 돌므로 디버그 로그로
+        logger.log(logging.DEBUG if name == 'checkpoint' else logging.INFO, message)
+        return result
+
+    @staticmethod
+    def _page_stats(conn: sqlite3.Connection) -> Dict[str, int]:
+        return {
+            'page_count': conn.execute('PRAGMA page_count').fetchone()[0],
+            'freelist': conn.execute('PRAGMA freelist_count').fetchone()[0],
+        }
+
+    @staticmethod
+    def _checkpoint(conn: sqlite3.Connection, mode: str) -> Dict:
+        """WAL 체크포인트 (WAL 모드가 아니면 프레임 수가 -1)"""
+        busy, wal_frames, checkpointed = conn.execute(f'PRAGMA wal_checkpoint({mode})').fetchone()
+        if wal_frames >= 0:
+            metrics.set_gauge('db.wal_frames', wal_frames - checkpointed)
+        if busy:
+            metrics.inc('db.checkpoint_busy', labels={'mode': mode.lower()})
+        return {'busy': bool(busy), 'wal_frames': wal_frames, 'checkpointed': checkpointed}
+
+    @staticmethod
+    def _optimize(conn: sqlite3.Connection) -> Dict:
+        """
+        플래너 통계 갱신
+
+        3.46 이전의 PRAGMA optimize는 같은 연결에서 쿼리한 테이블만 보므로
+        방금 연 연결에서는 아무것도 하지 않습니다. 그 경우 행 수 상한을 둔
+        ANALYZE로 대신합니다.
+        """
+        # 인덱스마다 최대 이만큼의 행만 읽어 통계를 근사 (큰 테이블에서도 짧게)
+        conn.execute('PRAGMA analysis_limit = 1000')
+        if sqlite3.sqlite_version_info >= (3, 46, 0):
+            conn.execute(f'PRAGMA optimize = {OPTIMIZE_ALL_TABLES}')
+            return {'method': 'optimize'}
+        conn.execute('ANALYZE')
+        return {'method': 'analyze'}
+
+    def _incremental_vacuum(self, conn: sqlite3.Connection) -> Dict:
+        """빈 페이지를 step_pages씩 반환 (단계 사이에 쓰기 잠금을 놓음)"""
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+            # 기존 DB는 auto_vacuum = INCREMENTAL 설정 후 VACUUM을 한 번 해야 적용됨
+            logger.debug("auto_vacuum이 INCREMENTAL이 아니어서 incremental_vacuum을 건너뜁니다.")
+            return {'freed': 0}
+
+        freed = 0
+        while True:
+            before = conn.execute('PRAGMA freelist_count').fetchone()[0]
+            if before == 0:
+                break
+            # execute()는 문장을 한 번만 실행해 한 페이지만 반환함 - executescript는 끝까지 실행
+            conn.executescript(f'PRAGMA incremental_vacuum({self.step_pages});')
+            after = conn.execute('PRAGMA freelist_count').fetchone()[0]
+            freed += before - after
+            if after >= before:
+                break
+            time.sleep(self.pause)
+        return {'freed': freed}
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
@@ -0,0 +1,176 @@
+"""
+모델과 달라진 테이블을 온라인으로 재구성하는 마이그레이션
+
+ALTER TABLE로 할 수 없는 변경(컬럼 타입 변경, 컬럼 삭제, NOT NULL 해제, AUTOINCREMENT)이 있는
+테이블을 찾아 봇을 멈추지 않고 옮깁니다. 테이블마다 새 스키마의 테이블을 만들어
+배치 단위로 복사한 뒤 짧은 트랜잭션에서 교체합니다
+(database.migrations.TableRebuild). 전후로 테이블/인덱스 크기와 조회
+지연 시간을 측정해 출력합니다.
+
+지금까지의 변경:
+    - Discord ID(snowflake) 컬럼: 문자열 → 64비트 정수
+    - 게임/플레이 기록의 username 컬럼: NOT NULL 해제 (이름은 users에만 저장)
+    - 서버별 집계 원본(slot_plays, blackjack_games, roulette_games): AUTOINCREMENT
+      (아카이브로 비워진 뒤 ID를 재사용하면 집계 위치보다 작은 ID가 누락됨)
+
+username 컬럼은 배포 순서와 관계없이 게임 기록 INSERT가 실패하는 구간이
+없도록 두 릴리스에 걸쳐 없앱니다.
+
+    1. 이번 릴리스: 모델에 NULL 허용 + 기본값 ''으로 남기고 새 코드는 이름을
+       넣지 않습니다. 이전 버전(이름을 씀)과 새 버전(기본값 '') 모두 재구성
+       전후의 테이블에 쓸 수 있으므로 배포 전후 언제 실행해도 됩니다.
+    2. 다음 릴리스: 모델에서 컬럼을 삭제합니다. 1의 재구성으로 NOT NULL이
+       풀린 상태에서 새 버전을 배포하고, 컬럼을 쓰는 이전 버전이 모두
+       내려간 뒤에 실행해 컬럼을 삭제합니다.
+
+실행:
+    python -m database.migrate_schema [--batch-size 2000] [--pause 0.05] [--dry-run]
+
+교체 후 남는 빈 페이지는 파일 크기에 바로 반영되지 않습니다
+(auto_vacuum/incremental_vacuum 또는 VACUUM 필요).
+"""
+import argparse
+import logging
+import random
+import sqlite3
+import statistics
+import time
+from typing import Dict, List
+from database.db_manager import DatabaseManager
+from database.guild_stats import reserve_rollup_ids  # noqa: F401 - 집계 원본 교체 훅 등록
+from database.migrations import TableRebuild
+from database.models import Base
+
+logger = logging.getLogger(__name__)
+
+# 재구성 후보 (외래 키는 이름으로 참조하므로 순서와 무관)
+TABLES = Base.metadata.sorted_tables
+
+# 지연 시간을 잴 조회 (테이블, discord_id 인덱스를 쓰는 쿼리)
+LOOKUPS = {
+    'users': 'SELECT * FROM users WHERE discord_id = ?',
+    'slot_plays': 'SELECT COUNT(*) FROM slot_plays WHERE discord_id = ?',
+}
+LOOKUP_SAMPLES = 500
+
+
+def measure(conn: sqlite3.Connection) -> Dict:
+    """
+    테이블/인덱스 크기와 조회 지연 시간 측정
+
+    Returns:
+        {'objects': {이름: {'pages', 'bytes', 'depth'}}, 'lookups': {테이블: {'cold_us', 'warm_us'}},
+         'page_size', 'freelist'}
+    """
+    names = [t.name for t in TABLES] + [i.name for t in TABLES for i in t.indexes]
+    objects = {}
+    try:
+        # depth = 루트부터 리프까지 페이지 수 (캐시가 비었을 때 조회 한 번에 읽는 페이지)
+        rows = conn.execute(
+            "SELECT name, COUNT(*), SUM(pgsize), "
+            "MAX(length(path) - length(replace(path, '/', ''))) "
+            "FROM dbstat WHERE pagetype != 'overflow' GROUP BY name"
+        ).fetchall()
+        objects = {
+            name: {'pages': pages, 'bytes': size, 'depth': depth}
+            for name, pages, size, depth in rows if name in names
+        }
+    except sqlite3.OperationalError:
+        logger.warning("dbstat을 사용할 수 없어 크기 측정을 건너뜁니다.")
+
+    return {
+        'objects': objects,
+        'lookups': {table: _measure_lookup(conn, table, sql) for table, sql in LOOKUPS.items()},
+        'page_size': conn.execute('PRAGMA page_size').fetchone()[0],
+        'freelist': conn.execute('PRAGMA freelist_count').fetchone()[0],
+    }
+
+
+def _measure_lookup(conn: sqlite3.Connection, table: str, sql: str) -> Dict:
+    """discord_id 조회 지연 시간 중앙값 (마이크로초, 새 연결의 첫 조회 = cold)"""
+    ids = [row[0] for row in conn.execute(
+        f'SELECT discord_id FROM {table} ORDER BY random() LIMIT ?', (LOOKUP_SAMPLES,)
+    )]
+    if not ids:
+        return {}
+
+    path = conn.execute('PRAGMA database_list').fetchone()[2]
+    probe = sqlite3.connect(path)
+    try:
+        # 페이지 캐시가 비어 있는 상태 - 연결마다 캐시를 새로 시작
+        probe.execute('PRAGMA cache_size = 0')
+        cold = _time_queries(probe, sql, ids)
+        probe.execute('PRAGMA cache_size = -2000')
+        _time_queries(probe, sql, ids)
+        warm = _time_queries(probe, sql, ids)
+    finally:
+        probe.close()
+    return {'cold_us': cold, 'warm_us': warm}
+
+
+def _time_queries(conn: sqlite3.Connection, sql: str, ids: List) -> float:
+    samples = []
+    for discord_id in random.sample(ids, len(ids)):
+        started = time.perf_counter()
+        conn.execute(sql, (discord_id,)).fetchall()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(samples)
+
+
+def print_report(before: Dict, after: Dict):
+    print(f"\n{'객체':<32}{'페이지 전':>10}{'후':>10}{'바이트 전':>14}{'후':>14}{'깊이 전':>8}{'후':>6}")
+    for name in sorted(set(before['objects']) | set(after['objects'])):
+        b = before['objects'].get(name, {})
+        a = after['objects'].get(name, {})
+        print(
+            f"{name:<32}{b.get('pages', '-'):>10}{a.get('pages', '-'):>10}"
+            f"{b.get('bytes', '-'):>14}{a.get('bytes', '-'):>14}{b.get('depth', '-'):>8}{a.get('depth', '-'):>6}"
+        )
+
+    print(f"\n{'조회 (중앙값, µs)':<32}{'cold 전':>10}{'cold 후':>10}{'warm 전':>10}{'warm 후':>10}")
+    for table in LOOKUPS:
+        b = before['lookups'].get(table) or {}
+        a = after['lookups'].get(table) or {}
+        print(
+            f"{table:<32}{b.get('cold_us', 0):>10.1f}{a.get('cold_us', 0):>10.1f}"
+            f"{b.get('warm_us', 0):>10.1f}{a.get('warm_us', 0):>10.1f}"
+        )
+
+    print(f"\n빈 페이지: {before['freelist']} → {after['freelist']} (페이지 크기 {after['page_size']}B)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델과 달라진 테이블 재구성")
+    parser.add_argument('--batch-size', type=int, default=2000, help="한 트랜잭션에 복사할 행 수")
+    parser.add_argument('--pause', type=float, default=0.05, help="배치 사이 대기 (초)")
+    parser.add_argument('--dry-run', action='store_true', help="측정만 하고 변경하지 않음")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+
+    conn = sqlite3.connect(DatabaseManager.sqlite_path(), timeout=30, isolation_level=None)
+    try:
+        rebuilds = [TableRebuild(conn, table, args.batch_size, args.pause) for table in TABLES]
+        pending = [rebuild for rebuild in rebuilds if rebuild.pending()]
+        print(f"마이그레이션 대상: {', '.join(r.name for r in pending) or '없음'}")
+
+        before = measure(conn)
+        if args.dry_run or not pending:
+            print_report(before, before)
+            return
+
+        for rebuild in pending:
+            stats = rebuild.run()
+            print(
+                f"  {rebuild.name}: {stats['rows']}행 / 배치 {stats['batches']}개, "
+                f"복사 {stats['copy_seconds']:.2f}s, 교체 잠금 {stats['swap_seconds'] * 1000:.1f}ms"
+            )
+        conn.execute('ANALYZE')
+
+        print_report(before, measure(conn))
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+"""
+온라인 테이블 재구성 도우미
+
+SQLite는 컬럼 타입 변경/삭제, NOT NULL 해제, AUTOINCREMENT 추가를 ALTER TABLE로 할 수
+없어 테이블을 새로 만들어 옮겨야 합니다. 한 번에 옮기면 그동안 DB 전체가 잠기므로:
+
+1. 모델 스키마로 `<테이블>__new`를 만들고
+2. 원본 테이블에 미러 트리거를 걸어 복사 중에 생기는 INSERT/UPDATE/DELETE를
+   새 테이블에도 반영하면서
+3. 기본 키 순서로 배치 단위 복사 (배치마다 짧은 트랜잭션 + 잠시 대기)
+4. 짧은 트랜잭션에서 이름을 바꿔 교체하고 인덱스를 원래 이름으로 다시 생성
+5. 이전 테이블 삭제
+
+테이블 교체로 사라지는 트리거 등은 register_swap_hook()으로 등록해 두면
+교체 트랜잭션 안에서 다시 만듭니다 (시즌 교체도 같은 훅을 사용).
+
+사용 예시:
+    conn = sqlite3.connect(path, isolation_level=None)
+    rebuild = TableRebuild(conn, SlotPlay.__table__, batch_size=2000)
+    if rebuild.pending():
+        stats = rebuild.run()
+"""
+import logging
+import sqlite3
+import time
+from typing import Callable, Dict, List
+from sqlalchemy import Integer, MetaData, Table
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+logger = logging.getLogger(__name__)
+
+# 테이블 이름 → 교체 직후 실행할 함수 목록 (sqlite3 연결을 받음)
+_swap_hooks: Dict[str, List[Callable[[sqlite3.Connection], None]]] = {}
+
+
+def register_swap_hook(table_name: str, hook: Callable[[sqlite3.Connection], None]):
+    """테이블이 새 테이블로 교체될 때 (같은 트랜잭션 안에서) 실행할 함수 등록"""
+    _swap_hooks.setdefault(table_name, []).append(hook)
+
+
+def run_swap_hooks(table_name: str, conn: sqlite3.Connection):
+    for hook in _swap_hooks.get(table_name, ()):
+        hook(conn)
+
+
+class TableRebuild:
+    """모델 스키마에 맞춰 테이블 하나를 온라인으로 재구성"""
+
+    def __init__(self, conn: sqlite3.Connection, table: Table, batch_size: int = 1000, pause: float = 0.05):
+        """
+        Args:
+            conn: isolation_level=None으로 연 sqlite3 연결 (트랜잭션 직접 관리)
+            table: 목표 스키마 (SQLAlchemy Table, 기본 키는 정수 id)
+            batch_size: 한 트랜잭션에 복사할 행 수
+            pause: 배치 사이 대기 (초, 다른 쓰기 작업에 양보)
+        """
+        self.conn = conn
+        self.table = table
+        self.batch_size = batch_size
+        self.pause = pause
+        self.name = table.name
+        self.new_name = f'{table.name}__new'
+        self.old_name = f'{table.name}__old'
+        self.dialect = sqlite.dialect()
+
+    # === 스키마 비교 ===
+
+    def current_columns(self) -> Dict[str, str]:
+        """현재 테이블의 컬럼 → 선언 타입"""
+        return {row[1]: (row[2] or '').upper() for row in self.conn.execute(f'PRAGMA table_info({self.name})')}
+
+    def relaxed_columns(self) -> List[str]:
+        """현재 테이블에서는 NOT NULL이지만 모델은 NULL을 허용하는 컬럼"""
+        not_null = {row[1] for row in self.conn.execute(f'PRAGMA table_info({self.name})') if row[3]}
+        return [c.name for c in self.table.columns if c.nullable and c.name in not_null]
+
+    def missing_autoincrement(self) -> bool:
+        """모델은 AUTOINCREMENT(ID 재사용 안 함)인데 현재 테이블은 아닌지"""
+        if not self.table.dialect_options['sqlite']['autoincrement']:
+            return False
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (self.name,)
+        ).fetchone()
+        return row is not None and 'AUTOINCREMENT' not in row[0].upper()
+
+    def pending(self) -> bool:
+        """모델과 컬럼 구성/타입/NOT NULL 제약/AUTOINCREMENT가 달라 재구성이 필요한지"""
+        current = self.current_columns()
+        if not current:
+            return False
+        target = {c.name for c in self.table.columns}
+        if set(current) - target or self.relaxed_columns() or self.missing_autoincrement():
+            return True
+        return any(
+            self._needs_cast(column, current[column.name])
+            for column in self.table.columns if column.name in current
+        )
+
+    @staticmethod
+    def _needs_cast(column, declared: str) -> bool:
+        # 정수 컬럼인데 기존 선언이 문자열이면 CAST로 변환
+        return isinstance(column.type, Integer) and 'INT' not in declared
+
+    # === 재구성 ===
+
+    def run(self) -> Dict:
+        """
+        재구성 실행
+
+        Returns:
+            {'rows', 'batches', 'copy_seconds', 'swap_seconds'}
+        """
+        current = self.current_columns()
+        columns = [c for c in self.table.columns if c.name in current]
+        names = ', '.join(c.name for c in columns)
+        exprs = ', '.join(
+            f'CAST({c.name} AS INTEGER)' if self._needs_cast(c, current[c.name]) else c.name
+            for c in columns
+        )
+        new_exprs = ', '.join(
+            f'CAST(new.{c.name} AS INTEGER)' if self._needs_cast(c, current[c.name]) else f'new.{c.name}'
+            for c in columns
+        )
+
+        # 이전 시도에서 남은 것 정리 후 새 테이블 생성
+        self._drop_mirror_triggers()
+        self.conn.execute(f'DROP TABLE IF EXISTS {self.new_name}')
+        self.conn.execute(self._create_table_sql())
+
+        # 복사 중 변경 사항을 새 테이블에도 반영
+        self.conn.execute(
+            f'CREATE TRIGGER {self.name}__mirror_insert AFTER INSERT ON {self.name} BEGIN '
+            f'INSERT OR REPLACE INTO {self.new_name} ({names}) VALUES ({new_exprs}); END'
+        )
+        self.conn.execute(
+            f'CREATE TRIGGER {self.name}__mirror_update AFTER UPDATE ON {self.name} BEGIN '
+            f'INSERT OR REPLACE INTO {self.new_name} ({names}) VALUES ({new_exprs}); END'
+        )
+        self.conn.execute(
+            f'CREATE TRIGGER {self.name}__mirror_delete AFTER DELETE ON {self.name} BEGIN '
+            f'DELETE FROM {self.new_name} WHERE id = old.id; END'
+        )
+
+        # 기본 키 순서로 배치 복사
+        copy_started = time.perf_counter()
+        last_id, rows, batches = 0, 0, 0
+        while True:
+            self.conn.execute('BEGIN IMMEDIATE')
+            upper = self.conn.execute(
+                f'SELECT MAX(id) FROM (SELECT id FROM {self.name} WHERE id > ? ORDER BY id LIMIT ?)',
+                (last_id, self.batch_size)
+            ).fetchone()[0]
+            if upper is None:
+                self.conn.execute('COMMIT')
+                break
+            cursor = self.conn.execute(
+                f'INSERT OR IGNORE INTO {self.new_name} ({names}) '
+                f'SELECT {exprs} FROM {self.name} WHERE id > ? AND id <= ?',
+                (last_id, upper)
+            )
+            self.conn.execute('COMMIT')
+            rows += max(cursor.rowcount, 0)
+            batches += 1
+            last_id = upper
+            if self.pause:
+                time.sleep(self.pause)
+        copy_seconds = time.perf_counter() - copy_started
+
+        # 교체 - 자식 테이블의 외래 키가 이전 테이블을 가리키지 않도록 이름 참조는 그대로 둠
+        swap_started = time.perf_counter()
+        self.conn.execute('PRAGMA legacy_alter_table = ON')
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._drop_mirror_triggers()
+            for (index_name,) in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                (self.name,)
+            ).fetchall():
+                self.conn.execute(f'DROP INDEX {index_name}')
+            self.conn.execute(f'ALTER TABLE {self.name} RENAME TO {self.old_name}')
+            self.conn.execute(f'ALTER TABLE {self.new_name} RENAME TO {self.name}')
+            for index in self.table.indexes:
+                self.conn.execute(str(CreateIndex(index).compile(dialect=self.dialect)))
+            run_swap_hooks(self.name, self.conn)
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        finally:
+            self.conn.execute('PRAGMA legacy_alter_table = OFF')
+        swap_seconds = time.perf_counter() - swap_started
+
+        self.conn.execute(f'DROP TABLE {self.old_name}')
+
+        logger.info(
+            f"테이블 재구성 완료: {self.name} {rows}행, 배치 {batches}개, "
+            f"복사 {copy_seconds:.2f}s, 교체 잠금 {swap_seconds * 1000:.1f}ms"
+        )
+        return {'rows': rows, 'batches': batches, 'copy_seconds': copy_seconds, 'swap_seconds': swap_seconds}
+
+    def _create_table_sql(self) -> str:
+        metadata = MetaData()
+        # 외래 키가 참조하는 테이블도 있어야 DDL을 만들 수 있음
+        for foreign_key in self.table.foreign_keys:
+            foreign_key.column.table.to_metadata(metadata)
+        new_table = self.table.to_metadata(metadata, name=self.new_name)
+        # 인덱스는 교체 후 원래 이름으로 생성
+        new_table.indexes.clear()
+        return str(CreateTable(new_table).compile(dialect=self.dialect))
+
+    def _drop_mirror_triggers(self):
+        for suffix in ('insert', 'update', 'delete'):
+            self.conn.execute(f'DROP TRIGGER IF EXISTS {self.name}__mirror_{suffix}')
@@ -1,7 +1,7 @@
 """
 데이터베이스 모델 정의
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Date, DateTime, Boolean, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -14,7 +14,7 @@ class User(Base):
     __tablename__ = 'users'
     
     id = Column(Integer, primary_key=True)
-    discord_id = Column(String, unique=True, nullable=False, index=True)
+    discord_id = Column(BigInteger, unique=True, nullable=False, index=True)
     username = Column(String, nullable=False)
     coins = Column(Integer, default=5000)  # 기본 코인 5000개
     games_played = Column(Integer, default=0)
@@ -32,16 +32,24 @@ class RouletteGame(Base):
     __tablename__ = 'roulette_games'
     
     id = Column(Integer, primary_key=True)
-    guild_id = Column(String, nullable=False, index=True)
-    channel_id = Column(String, nullable=False)
-    host_id = Column(String, nullable=False)  # 게임 생성자
+    guild_id = Column(BigInteger, nullable=False, index=True)
+    channel_id = Column(BigInteger, nullable=False)
+    host_id = Column(BigInteger, nullable=False)  # 게임 생성자
     bet_amount = Column(Integer, default=100)  # 판돈
     max_players = Column(Integer, default=6)
     current_turn = Column(Integer, default=1)  # 현재 턴 (join_order 기준)
-    status = Column(String, default='waiting')  # waiting, playing, finished
+    status = Column(String, default='waiting')  # waiting, playing, finished, cancelled
     created_at = Column(DateTime, default=datetime.utcnow)
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
+    # 마지막 상태 변경 시각 (방치 게임 정리 기준)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow,
+                        info={'backfill_from': 'created_at'})
+    
+    __table_args__ = (
+        Index('ix_roulette_games_status_updated', 'status', 'updated_at'),
+        {'sqlite_autoincrement': True},  # ID 재사용 방지 (SlotPlay 참고)
+    )
     
     def __repr__(self):
         return f"<RouletteGame(id={self.id}, status={self.status}, players={self.max_players})>"
@@ -53,13 +61,33 @@ class RoulettePlayer(Base):
     
     id = Column(Integer, primary_key=True)
     game_id = Column(Integer, ForeignKey('roulette_games.id'), nullable=False)
-    discord_id = Column(String, nullable=False)
-    username = Column(String, nullable=False)
+    discord_id = Column(BigInteger, nullable=False)
+    # 사용 중지 (이름은 users에만 저장, 새 코드는 이름을 넣지 않고 기본값 '')
+    # 이전 버전이 NOT NULL로 쓰는 동안 남겨 두고 다음 릴리스에서 삭제 - database.migrate_schema 참고
+    legacy_username = Column('username', String, nullable=True, default='')
     join_order = Column(Integer, nullable=False)  # 참가 순서
     is_alive = Column(Boolean, default=True)
     is_winner = Column(Boolean, default=False)
     joined_at = Column(DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        # 유저별 최신순 기록 조회 (키셋 페이지네이션)
+        Index('ix_roulette_players_player_joined', 'discord_id', 'joined_at'),
+    )
+    
+    # 이름은 users에 한 번만 저장하고 조회 시 함께 로드
+    user = relationship(
+        'User',
+        primaryjoin='foreign(RoulettePlayer.discord_id) == User.discord_id',
+        viewonly=True,
+        lazy='joined'
+    )
+    
+    @property
+    def username(self) -> str:
+        """표시 이름 (유저 기록이 없으면 Discord ID)"""
+        return self.user.username if self.user else str(self.discord_id)
+    
     def __repr__(self):
         return f"<RoulettePlayer(discord_id={self.discord_id}, game_id={self.game_id})>"
 
@@ -69,16 +97,25 @@ class BlackjackGame(Base):
     __tablename__ = 'blackjack_games'
     
     id = Column(Integer, primary_key=True)
-    guild_id = Column(String, nullable=False, index=True)
-    channel_id = Column(String, nullable=False)
-    host_id = Column(String, nullable=False)
+    guild_id = Column(BigInteger, nullable=False, index=True)
+    channel_id = Column(BigInteger, nullable=False)
+    host_id = Column(BigInteger, nullable=False)
     current_turn = Column(Integer, default=1)  # 현재 턴 (join_order 기준)
     dealer_cards = Column(String, default='')  # JSON 문자열로 저장
     deck = Column(String, default='')  # 남은 덱 (JSON)
-    status = Column(String, default='waiting')  # waiting, playing, dealer_turn, finished
+    table_message_id = Column(BigInteger, nullable=True)  # 실시간 테이블 메시지 ID
+    status = Column(String, default='waiting')  # waiting, playing, dealer_turn, finished, cancelled
     created_at = Column(DateTime, default=datetime.utcnow)
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
+    # 마지막 상태 변경 시각 (방치 게임 정리 기준)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow,
+                        info={'backfill_from': 'created_at'})
+    
+    __table_args__ = (
+        Index('ix_blackjack_games_status_updated', 'status', 'updated_at'),
+        {'sqlite_autoincrement': True},  # ID 재사용 방지 (SlotPlay 참고)
+    )
     
     def __repr__(self):
         return f"<BlackjackGame(id={self.id}, status={self.status})>"
@@ -90,8 +127,8 @@ class BlackjackPlayer(Base):
     
     id = Column(Integer, primary_key=True)
     game_id = Column(Integer, ForeignKey('blackjack_games.id'), nullable=False)
-    discord_id = Column(String, nullable=False)
-    username = Column(String, nullable=False)
+    discord_id = Column(BigInteger, nullable=False)
+    legacy_username = Column('username', String, nullable=True, default='')  # 사용 중지 (RoulettePlayer 참고)
     join_order = Column(Integer, nullable=False)
     bet_amount = Column(Integer, nullable=False)
     cards = Column(String, default='')  # JSON 문자열로 저장
@@ -107,6 +144,24 @@ class BlackjackPlayer(Base):
     current_hand = Column(Integer, default=1)  # 현재 플레이 중인 핸드 (1 or 2)
     joined_at = Column(DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        # 유저별 최신순 기록 조회 (키셋 페이지네이션)
+        Index('ix_blackjack_players_player_joined', 'discord_id', 'joined_at'),
+    )
+    
+    # 이름은 users에 한 번만 저장하고 조회 시 함께 로드
+    user = relationship(
+        'User',
+        primaryjoin='foreign(BlackjackPlayer.discord_id) == User.discord_id',
+        viewonly=True,
+        lazy='joined'
+    )
+    
+    @property
+    def username(self) -> str:
+        """표시 이름 (유저 기록이 없으면 Discord ID)"""
+        return self.user.username if self.user else str(self.discord_id)
+    
     def __repr__(self):
         return f"<BlackjackPlayer(discord_id={self.discord_id}, bet={self.bet_amount})>"
 
@@ -116,8 +171,8 @@ class SlotPlay(Base):
     __tablename__ = 'slot_plays'
     
     id = Column(Integer, primary_key=True)
-    discord_id = Column(String, nullable=False, index=True)
-    username = Column(String, nullable=False)
+    discord_id = Column(BigInteger, nullable=False)
+    legacy_username = Column('username', String, nullable=True, default='')  # 사용 중지 (RoulettePlayer 참고)
     bet_amount = Column(Integer, nullable=False)
     reel1 = Column(String, nullable=False)
     reel2 = Column(String, nullable=False)
@@ -125,7 +180,169 @@ class SlotPlay(Base):
     is_win = Column(Boolean, default=False)
     payout = Column(Integer, default=0)
     multiplier = Column(Integer, default=0)
+    guild_id = Column(BigInteger, nullable=True)  # 플레이한 서버 (DM이거나 기록 전 행은 None)
     played_at = Column(DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        # 유저별 최신순 기록 조회 (키셋 페이지네이션)
+        Index('ix_slot_plays_player_played', 'discord_id', 'played_at'),
+        # 서버별 집계가 마지막 ID부터 이어 가므로, 아카이브로 테이블이 비워져도 ID를 재사용하지 않음
+        {'sqlite_autoincrement': True},
+    )
+    
+    def __repr__(self):
+        return f"<SlotPlay(discord_id={self.discord_id}, result={self.reel1}{self.reel2}{self.reel3})>"
+
+
+class SlotDailySummary(Base):
+    """오래된 슬롯 플레이 기록의 유저별 일간 요약 (원본 행은 요약 후 삭제)"""
+    __tablename__ = 'slot_daily_summary'
+    
+    id = Column(Integer, primary_key=True)
+    discord_id = Column(BigInteger, nullable=False)
+    day = Column(Date, nullable=False)
+    plays = Column(Integer, default=0)
+    wins = Column(Integer, default=0)
+    total_bet = Column(Integer, default=0)
+    total_payout = Column(Integer, default=0)
+    best_multiplier = Column(Integer, default=0)
+    best_symbol = Column(String, nullable=True)  # 최고 배당 당첨 심볼 (당첨이 없으면 None)
+    
+    __table_args__ = (
+        UniqueConstraint('discord_id', 'day', name='uq_slot_daily_summary'),
+    )
+    
+    def __repr__(self):
+        return f"<SlotDailySummary(discord_id={self.discord_id}, day={self.day}, plays={self.plays})>"
+
+
+class PlayerGameStats(Base):
+    """유저별 게임 누적 전적 (게임 결과와 같은 트랜잭션에서 증가, 기록이 아카이브되어도 유지)"""
+    __tablename__ = 'player_game_stats'
+    
+    id = Column(Integer, primary_key=True)
+    discord_id = Column(BigInteger, nullable=False)
+    game = Column(String, nullable=False)  # slot, blackjack, roulette
+    plays = Column(Integer, default=0)
+    wins = Column(Integer, default=0)  # 룰렛은 생존
+    losses = Column(Integer, default=0)
+    pushes = Column(Integer, default=0)  # 블랙잭 무승부
+    blackjacks = Column(Integer, default=0)  # 블랙잭으로 이긴 횟수 (wins에 포함)
+    wagered = Column(Integer, default=0)
+    paid_out = Column(Integer, default=0)
+    
+    __table_args__ = (
+        UniqueConstraint('discord_id', 'game', name='uq_player_game_stats'),
+    )
+    
+    def __repr__(self):
+        return f"<PlayerGameStats(discord_id={self.discord_id}, game={self.game}, plays={self.plays})>"
+
+
+class GuildDailyStats(Base):
+    """서버별 일간 게임 집계 (database.guild_stats가 증분으로 갱신)"""
+    __tablename__ = 'guild_daily_stats'
+    
+    id = Column(Integer, primary_key=True)
+    guild_id = Column(BigInteger, nullable=False)
+    day = Column(Date, nullable=False)
+    game = Column(String, nullable=False)  # slot, blackjack, roulette
+    rounds = Column(Integer, default=0)  # 스핀 수 또는 끝난 게임 수
+    entries = Column(Integer, default=0)  # 플레이어별 참가 수 (슬롯은 스핀 수와 같음)
+    wagered = Column(Integer, default=0)  # 배팅액 합계
+    paid_out = Column(Integer, default=0)  # 지급액 합계 (하우스 수익 = wagered - paid_out)
+    
+    __table_args__ = (
+        UniqueConstraint('guild_id', 'day', 'game', name='uq_guild_daily_stats'),
+    )
+    
+    def __repr__(self):
+        return f"<GuildDailyStats(guild_id={self.guild_id}, day={self.day}, game={self.game})>"
+
+
+class GuildDailyPlayer(Base):
+    """서버별 일간 활동 플레이어 (기간별 중복 없는 플레이어 수 집계용)"""
+    __tablename__ = 'guild_daily_players'
+    
+    id = Column(Integer, primary_key=True)
+    guild_id = Column(BigInteger, nullable=False)
+    day = Column(Date, nullable=False)
+    game = Column(String, nullable=False)
+    discord_id = Column(BigInteger, nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint('guild_id', 'day', 'game', 'discord_id', name='uq_guild_daily_players'),
+    )
+    
+    def __repr__(self):
+        return f"<GuildDailyPlayer(guild_id={self.guild_id}, day={self.day}, discord_id={self.discord_id})>"
+
+
+class RollupState(Base):
+    """증분 집계 작업의 처리 위치 (원본 테이블 ID 기준)"""
+    __tablename__ = 'rollup_state'
+    
+    name = Column(String, primary_key=True)
+    last_id = Column(Integer, default=0)  # 이 ID까지 집계에 반영됨
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<RollupState(name={self.name}, last_id={self.last_id})>"
+
+
+class BulkCoinJob(Base):
+    """역할/서버 전체 대상 일괄 코인 지급·차감 작업 (중단 후 이어서 실행 가능)"""
+    __tablename__ = 'bulk_coin_jobs'
+    
+    id = Column(Integer, primary_key=True)
+    guild_id = Column(BigInteger, nullable=False, index=True)
+    role_id = Column(BigInteger, nullable=True)  # 없으면 서버 전체
+    mode = Column(String, nullable=False)  # grant, revoke
+    amount = Column(Integer, nullable=False)
+    status = Column(String, default='running')  # running, done, failed
+    cursor = Column(BigInteger, default=0)  # 마지막으로 처리한 멤버 ID (멤버 목록은 ID 순)
+    scanned = Column(Integer, default=0)  # 확인한 멤버 수
+    applied = Column(Integer, default=0)  # 코인이 반영된 멤버 수
+    requested_by = Column(BigInteger, nullable=False)
+    channel_id = Column(BigInteger, nullable=False)  # 진행 상황 메시지 위치
+    message_id = Column(BigInteger, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<BulkCoinJob(id={self.id}, mode={self.mode}, status={self.status}, cursor={self.cursor})>"
+
+
+class Season(Base):
+    """종료된 시즌 기록 (순위표는 시즌별 아카이브 DB 파일에 보관)"""
+    __tablename__ = 'seasons'
+    
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    ended_at = Column(DateTime, nullable=False)
+    status = Column(String, default='archiving')  # archiving, archived
+    archive_path = Column(String, nullable=False)
+    players = Column(Integer, default=0)
+    total_coins = Column(Integer, default=0)
+    
+    def __repr__(self):
+        return f"<Season(id={self.id}, name={self.name}, status={self.status})>"
+
+
+class UserNameHistory(Base):
+    """유저가 사용한 이름 기록 (users 트리거로 채워지며 이름 검색 색인의 원본)"""
+    __tablename__ = 'user_name_history'
+    
+    id = Column(Integer, primary_key=True)
+    discord_id = Column(BigInteger, nullable=False, index=True)
+    username = Column(String, nullable=False)
+    seen_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        UniqueConstraint('discord_id', 'username', name='uq_user_name_history'),
+    )
+    
     def __repr__(self):
-        return f"<SlotPlay(discord_id={self.discord_id}, result={self.reel1}{self.reel2}{self.reel3})>"
\ No newline at end of file
+        return f"<UserNameHistory(discord_id={self.discord_id}, username={self.username})>"
@@ -0,0 +1,163 @@
+"""
+유저별 게임 누적 전적
+
+게임 결과를 저장하는 트랜잭션에서 player_game_stats의 (유저, 게임) 행을
+UPSERT로 증가시킵니다. /전적은 유저당 최대 세 행만 읽으므로 기록이 아무리
+많아도, 오래된 기록이 아카이브/요약되어도 같은 속도로 정확하게 보여 줍니다.
+
+테이블이 처음 만들어질 때(비어 있을 때) 한 번만 기존 기록으로 채웁니다.
+
+    slot        slot_plays + slot_daily_summary (요약된 원본 세그먼트는 중복이라 제외)
+    blackjack   끝난 게임 + 아카이브 세그먼트
+    roulette    〃
+
+사용 예시:
+    await record_game_stats(session, discord_id, 'blackjack', wins=1, wagered=100, paid_out=200)
+
+    async with db_manager.session() as session:
+        stats = await get_player_stats(session, discord_id)
+"""
+import logging
+from typing import Dict
+from sqlalchemy import select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import PlayerGameStats
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = ('plays', 'wins', 'losses', 'pushes', 'blackjacks', 'wagered', 'paid_out')
+
+
+async def record_game_stats(session: AsyncSession, discord_id: int, game: str, plays: int = 1, **counts):
+    """
+    유저의 게임 전적 증가 (호출한 세션의 트랜잭션에 포함)
+
+    Args:
+        discord_id: 유저 ID
+        game: 'slot', 'blackjack', 'roulette'
+        plays: 플레이 수
+        **counts: wins, losses, pushes, blackjacks, wagered, paid_out
+    """
+    values = {name: counts.get(name, 0) for name in COUNTERS}
+    values['plays'] = plays
+
+    table = PlayerGameStats.__table__
+    stmt = sqlite_insert(table).values(discord_id=discord_id, game=game, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.discord_id, table.c.game],
+        set_={name: table.c[name] + stmt.excluded[name] for name in COUNTERS}
+    )
+    await session.execute(stmt)
+
+
+async def get_player_stats(session: AsyncSession, discord_id: int) -> Dict[str, Dict[str, int]]:
+    """유저의 게임별 전적 {게임: {plays, wins, ...}}"""
+    result = await session.execute(select(PlayerGameStats).where(PlayerGameStats.discord_id == discord_id))
+    return {
+        row.game: {name: getattr(row, name) or 0 for name in COUNTERS}
+        for row in result.scalars()
+    }
+
+
+# === 최초 채우기 ===
+
+# 게임 → 유저별 합계 (discord_id, plays, wins, losses, pushes, blackjacks, wagered, paid_out)
+BACKFILL_SQL = {
+    'slot': (
+        "SELECT discord_id, SUM(plays), SUM(wins), SUM(plays) - SUM(wins), 0, 0, SUM(bet), SUM(payout) FROM ("
+        "SELECT discord_id, COUNT(*) AS plays, SUM(is_win) AS wins, "
+        "SUM(bet_amount) AS bet, SUM(payout) AS payout FROM slot_plays GROUP BY discord_id "
+        "UNION ALL "
+        "SELECT discord_id, SUM(plays), SUM(wins), SUM(total_bet), SUM(total_payout) "
+        "FROM slot_daily_summary GROUP BY discord_id"
+        ") GROUP BY discord_id"
+    ),
+    'blackjack': (
+        "SELECT p.discord_id, COUNT(*), SUM(p.result IN ('win', 'blackjack')), SUM(p.result = 'lose'), "
+        "SUM(p.result = 'push'), SUM(p.result = 'blackjack'), SUM(p.bet_amount), SUM(p.payout) "
+        "FROM blackjack_players p JOIN blackjack_games g ON g.id = p.game_id "
+        "WHERE g.status = 'finished' GROUP BY p.discord_id"
+    ),
+    'roulette': (
+        # 판돈은 게임 단위, 승리 보상은 생존자마다
+        "SELECT p.discord_id, COUNT(*), SUM(p.is_winner), SUM(NOT p.is_winner), 0, 0, "
+        "SUM(g.bet_amount), SUM(p.is_winner) * :reward "
+        "FROM roulette_players p JOIN roulette_games g ON g.id = p.game_id "
+        "WHERE g.status = 'finished' GROUP BY p.discord_id"
+    ),
+}
+
+# 아카이브 세그먼트 → 게임
+ARCHIVED_GAMES = {'blackjack_games': 'blackjack', 'roulette_games': 'roulette'}
+
+
+def backfill_player_stats(conn):
+    """
+    player_game_stats가 비어 있으면 기존 기록으로 채움 (init_database에서 run_sync로 호출)
+
+    게임 결과 처리보다 먼저(게이트웨이 연결 전) 실행되므로 새 결과와 겹치지 않습니다.
+    """
+    if conn.execute(text('SELECT 1 FROM player_game_stats LIMIT 1')).first() is not None:
+        return
+
+    # 게임 모듈이 이 모듈을 임포트하므로 여기서 (순환 임포트 방지)
+    from game.russian_roulette import RussianRouletteGame
+    reward = RussianRouletteGame.WIN_REWARD
+
+    totals: Dict = {}
+
+    def add(discord_id, game, counts):
+        row = totals.setdefault((int(discord_id), game), dict.fromkeys(COUNTERS, 0))
+        for name, value in zip(COUNTERS, counts):
+            row[name] += value or 0
+
+    for game, sql in BACKFILL_SQL.items():
+        for discord_id, *counts in conn.execute(text(sql), {'reward': reward}):
+            add(discord_id, game, counts)
+
+    archived = _backfill_archive(conn, add, reward)
+
+    if not totals:
+        return
+    conn.execute(
+        sqlite_insert(PlayerGameStats.__table__),
+        [{'discord_id': discord_id, 'game': game, **counts} for (discord_id, game), counts in totals.items()]
+    )
+    logger.info(f"게임 전적 초기화: {len(totals)}행 (아카이브 게임 {archived}개 포함)")
+
+
+def _backfill_archive(conn, add, reward: int) -> int:
+    """
+    아카이브 세그먼트의 끝난 게임 반영 (반영한 게임 수)
+
+    슬롯 세그먼트는 slot_daily_summary에 이미 요약되어 있으므로 읽지 않습니다.
+    세그먼트 기록 후 삭제 전에 중단된 게임은 핫 테이블 쪽만 셉니다.
+    """
+    from database.archive import GameArchiver
+    archiver = GameArchiver(None)
+    count = 0
+    for table, game in ARCHIVED_GAMES.items():
+        seen = set(conn.execute(text(f"SELECT id FROM {table} WHERE status = 'finished'")).scalars())
+        for path in archiver._segments(table, None, None):
+            for record in archiver._read_segment(path):
+                row = record['game']
+                if row['status'] != 'finished' or row['id'] in seen:
+                    continue
+                seen.add(row['id'])
+                count += 1
+                for player in record['players']:
+                    add(player['discord_id'], game, _archived_counts(game, row, player, reward))
+    return count
+
+
+def _archived_counts(game: str, row: Dict, player: Dict, reward: int):
+    """아카이브 플레이어 기록 → COUNTERS 순서의 값"""
+    if game == 'blackjack':
+        result = player['result']
+        return (
+            1, result in ('win', 'blackjack'), result == 'lose', result == 'push', result == 'blackjack',
+            player['bet_amount'], player['payout'],
+        )
+    winner = bool(player['is_winner'])
+    return (1, winner, not winner, 0, 0, row['bet_amount'], reward if winner else 0)
@@ -0,0 +1,238 @@
+"""
+시즌 초기화와 시즌 순위 아카이브
+
+모든 유저의 잔액/전적을 UPDATE로 초기화하면 SQLite 전체가 오래 잠기므로,
+새 시즌의 users 테이블을 옆에 미리 만들어 두고(build) 짧은 트랜잭션에서
+이름만 바꿔 교체(rename)합니다. 교체 후 이전 테이블은 시즌별 아카이브 DB
+파일의 순위표로 옮긴 뒤 삭제합니다.
+
+시즌 아카이브 구조:
+    data/seasons/season_<번호>.db
+        standings(rank, discord_id, username, coins, games_played, games_won, games_lost)
+
+사용 예시:
+    seasons = SeasonManager(db_manager)
+    season = await seasons.rollover("2025 봄 시즌")
+    rows = await seasons.get_standings(season['id'], offset=0, limit=10)
+"""
+import asyncio
+import logging
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from sqlalchemy import select
+from config import Config
+from database.migrations import run_swap_hooks
+from database.models import Season
+
+logger = logging.getLogger(__name__)
+
+# SQLAlchemy가 SQLite DateTime 컬럼에 저장하는 형식
+SQLITE_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+
+class SeasonManager:
+    """시즌 교체와 지난 시즌 순위 조회"""
+
+    NEXT_TABLE = 'users_next'
+    NEXT_INDEX = 'ix_users_next_discord_id'
+    USER_INDEX = 'ix_users_discord_id'
+
+    def __init__(self, db_manager, season_dir: str = None, start_coins: int = None):
+        self.db_manager = db_manager
+        self.season_dir = Path(season_dir or Config.SEASON_DIR)
+        self.start_coins = Config.SEASON_START_COINS if start_coins is None else start_coins
+
+    # === 시즌 교체 ===
+
+    async def rollover(self, name: str) -> Dict:
+        """
+        현재 시즌을 종료하고 새 시즌 시작
+
+        Returns:
+            종료된 시즌 정보 {'id', 'name', 'players', 'total_coins', 'switch_seconds'}
+        """
+        return await asyncio.to_thread(self._rollover, name)
+
+    def _rollover(self, name: str) -> Dict:
+        conn = self._connect()
+        try:
+            # 이전 교체가 아카이브 도중 중단되었다면 먼저 마무리
+            self._finish_pending(conn)
+
+            # 1) 새 시즌 테이블 준비 (잠금 없이)
+            self._build_next_table(conn)
+
+            # 2) 교체 - 준비 이후 새로 생긴 유저만 옮기고 이름 변경
+            switch_started = datetime.utcnow()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._copy_users(conn, only_missing=True)
+                started_at = self._season_started_at(conn)
+                cursor = conn.execute(
+                    'INSERT INTO seasons (name, started_at, ended_at, status, archive_path, players, total_coins) '
+                    "VALUES (?, ?, ?, 'archiving', '', 0, 0)",
+                    (name, started_at, switch_started.strftime(SQLITE_DATETIME_FORMAT))
+                )
+                season_id = cursor.lastrowid
+                old_table = self._old_table(season_id)
+                conn.execute(f'ALTER TABLE users RENAME TO {old_table}')
+                conn.execute(f'ALTER TABLE {self.NEXT_TABLE} RENAME TO users')
+                # 원래 이름의 인덱스는 이전 테이블에서 바로 삭제 (아카이브 전에 중단되어도
+                # 스키마 동기화가 새 users에 같은 이름으로 만들 수 있도록, 아카이브는 전체 스캔)
+                conn.execute(f'DROP INDEX IF EXISTS {self.USER_INDEX}')
+                # 이름을 바꾼 테이블에 딸려 삭제되는 트리거 등 재생성
+                run_swap_hooks('users', conn)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            switch_seconds = (datetime.utcnow() - switch_started).total_seconds()
+            logger.info(f"시즌 교체 완료: #{season_id} {name} (잠금 {switch_seconds * 1000:.1f}ms)")
+
+            # 3) 지난 시즌을 아카이브 파일로 옮기고 정리
+            summary = self._archive_season(conn, season_id)
+            summary.update({'id': season_id, 'name': name, 'switch_seconds': switch_seconds})
+            return summary
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # 트랜잭션은 직접 관리 (BEGIN IMMEDIATE)
+        return sqlite3.connect(self.db_manager.sqlite_path(), timeout=30, isolation_level=None)
+
+    def _build_next_table(self, conn: sqlite3.Connection):
+        """users와 같은 스키마의 새 테이블을 만들고 잔액/전적을 초기화한 행으로 채움"""
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'users'").fetchone()
+        if row is None:
+            raise RuntimeError("users 테이블이 없습니다.")
+        create_sql = re.sub(r'^CREATE TABLE\s+"?users"?', f'CREATE TABLE {self.NEXT_TABLE}', row[0], count=1)
+
+        conn.execute(f'DROP TABLE IF EXISTS {self.NEXT_TABLE}')
+        conn.execute(create_sql)
+        conn.execute(f'CREATE UNIQUE INDEX {self.NEXT_INDEX} ON {self.NEXT_TABLE} (discord_id)')
+        conn.execute('BEGIN')
+        self._copy_users(conn, only_missing=False)
+        conn.execute('COMMIT')
+
+    def _copy_users(self, conn: sqlite3.Connection, only_missing: bool):
+        """유저 정보(ID, 이름, 가입일)만 새 테이블로 복사하고 잔액/전적은 초기값"""
+        now = datetime.utcnow().strftime(SQLITE_DATETIME_FORMAT)
+        where = f' WHERE discord_id NOT IN (SELECT discord_id FROM {self.NEXT_TABLE})' if only_missing else ''
+        conn.execute(
+            f'INSERT INTO {self.NEXT_TABLE} '
+            f'(discord_id, username, coins, games_played, games_won, games_lost, created_at, updated_at) '
+            f'SELECT discord_id, username, ?, 0, 0, 0, created_at, ? FROM users{where}',
+            (self.start_coins, now)
+        )
+
+    @staticmethod
+    def _season_started_at(conn: sqlite3.Connection) -> Optional[str]:
+        """이번 시즌 시작 시각 (직전 시즌 종료 시각, 첫 시즌이면 가장 오래된 가입일)"""
+        row = conn.execute('SELECT MAX(ended_at) FROM seasons').fetchone()
+        if row[0] is not None:
+            return row[0]
+        return conn.execute('SELECT MIN(created_at) FROM users').fetchone()[0]
+
+    @staticmethod
+    def _old_table(season_id: int) -> str:
+        return f'users_season_{season_id}'
+
+    def _archive_path(self, season_id: int) -> Path:
+        return self.season_dir / f'season_{season_id:03d}.db'
+
+    def _archive_season(self, conn: sqlite3.Connection, season_id: int) -> Dict:
+        """이전 users 테이블을 시즌 아카이브 파일의 순위표로 옮기고 삭제"""
+        old_table = self._old_table(season_id)
+        path = self._archive_path(season_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()  # 중단된 이전 시도
+
+        conn.execute('ATTACH DATABASE ? AS season', (str(path),))
+        try:
+            conn.execute('BEGIN')
+            conn.execute(
+                'CREATE TABLE season.standings ('
+                'rank INTEGER PRIMARY KEY, discord_id INTEGER NOT NULL, username VARCHAR NOT NULL, '
+                'coins INTEGER, games_played INTEGER, games_won INTEGER, games_lost INTEGER)'
+            )
+            conn.execute(
+                'INSERT INTO season.standings '
+                'SELECT ROW_NUMBER() OVER (ORDER BY coins DESC, id), '
+                f'discord_id, username, coins, games_played, games_won, games_lost FROM {old_table}'
+            )
+            conn.execute('CREATE UNIQUE INDEX season.ix_standings_discord_id ON standings (discord_id)')
+            conn.execute('COMMIT')
+        finally:
+            conn.execute('DETACH DATABASE season')
+
+        players, total_coins = conn.execute(
+            f'SELECT COUNT(*), COALESCE(SUM(coins), 0) FROM {old_table}'
+        ).fetchone()
+
+        # 이전 테이블 삭제 후, 새 테이블 인덱스를 원래 이름으로 (스키마 동기화와 이름 일치)
+        conn.execute('BEGIN IMMEDIATE')
+        conn.execute(f'DROP TABLE {old_table}')
+        conn.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS {self.USER_INDEX} ON users (discord_id)')
+        conn.execute(f'DROP INDEX IF EXISTS {self.NEXT_INDEX}')
+        conn.execute(
+            "UPDATE seasons SET status = 'archived', archive_path = ?, players = ?, total_coins = ? WHERE id = ?",
+            (str(path), players, total_coins, season_id)
+        )
+        conn.execute('COMMIT')
+
+        logger.info(f"시즌 #{season_id} 아카이브 완료: {players}명 → {path}")
+        return {'players': players, 'total_coins': total_coins, 'archive_path': str(path)}
+
+    def _finish_pending(self, conn: sqlite3.Connection):
+        for (season_id,) in conn.execute("SELECT id FROM seasons WHERE status = 'archiving'").fetchall():
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (self._old_table(season_id),)
+            ).fetchone()
+            if exists:
+                logger.warning(f"중단된 시즌 #{season_id} 아카이브를 마무리합니다.")
+                self._archive_season(conn, season_id)
+
+    # === 조회 ===
+
+    async def list_seasons(self) -> List[Season]:
+        async with self.db_manager.session() as session:
+            result = await session.execute(
+                select(Season).where(Season.status == 'archived').order_by(Season.id.desc())
+            )
+            return result.scalars().all()
+
+    async def get_season(self, season_id: int) -> Optional[Season]:
+        async with self.db_manager.session() as session:
+            return await session.get(Season, season_id)
+
+    async def get_standings(self, season: Season, offset: int = 0, limit: int = 10) -> List[Dict]:
+        """시즌 순위표 (rank 기본 키 범위 조회)"""
+        return await asyncio.to_thread(
+            self._query, season,
+            'SELECT * FROM standings WHERE rank > ? ORDER BY rank LIMIT ?',
+            (offset, limit)
+        )
+
+    async def get_player(self, season: Season, discord_id: int) -> Optional[Dict]:
+        """시즌 순위표에서 한 유저의 기록"""
+        rows = await asyncio.to_thread(
+            self._query, season,
+            'SELECT * FROM standings WHERE discord_id = ?',
+            (discord_id,)
+        )
+        return rows[0] if rows else None
+
+    @staticmethod
+    def _query(season: Season, sql: str, params: tuple) -> List[Dict]:
+        # 아카이브 파일은 읽기 전용으로 열기
+        conn = sqlite3.connect(f'file:{season.archive_path}?mode=ro', uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            return [dict(row) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
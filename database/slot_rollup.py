@@ -0,0 +1,131 @@
+"""
+슬롯 플레이 기록 요약 (보존 정책)
+
+slot_plays는 스핀마다 한 행씩 쌓이는 가장 큰 테이블입니다. 기준일보다
+오래된 행은 유저별 일간 요약(slot_daily_summary)에 더한 뒤 삭제합니다.
+요약과 삭제는 같은 트랜잭션의 같은 ID 범위에서 일어나므로 중간에
+중단되어도 다시 실행하면 이어서 처리되고 두 번 더해지지 않습니다.
+
+배치 하나가 쓰기 잠금을 잡는 시간을 재서 목표(기본 5ms)를 넘으면 배치를
+줄이고 여유가 있으면 늘립니다. 삭제로 생긴 빈 페이지는 DB 유지보수
+스케줄러(database.maintenance)가 조금씩 반환합니다.
+
+사용 예시:
+    rollup = SlotRollup(db_manager)
+    stats = await rollup.compact(cutoff)
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from datetime import datetime
+from typing import Dict, Optional
+from config import Config
+from database.season import SQLITE_DATETIME_FORMAT
+
+logger = logging.getLogger(__name__)
+
+# 범위 안의 오래된 플레이를 (유저, 날짜)별로 요약에 더함
+# 최고 배당 심볼은 MAX()와 함께 쓴 일반 컬럼이 최댓값 행의 값을 갖는 SQLite 동작을 이용
+ROLLUP_SQL = (
+    "INSERT INTO slot_daily_summary "
+    "(discord_id, day, plays, wins, total_bet, total_payout, best_multiplier, best_symbol) "
+    "SELECT discord_id, date(played_at), COUNT(*), SUM(is_win), SUM(bet_amount), SUM(payout), "
+    "MAX(multiplier), CASE WHEN is_win THEN reel1 END "
+    "FROM slot_plays WHERE id >= :low AND id <= :high AND played_at < :cutoff "
+    "GROUP BY discord_id, date(played_at) "
+    "ON CONFLICT (discord_id, day) DO UPDATE SET "
+    "plays = plays + excluded.plays, "
+    "wins = wins + excluded.wins, "
+    "total_bet = total_bet + excluded.total_bet, "
+    "total_payout = total_payout + excluded.total_payout, "
+    "best_symbol = CASE WHEN excluded.best_multiplier > best_multiplier "
+    "THEN excluded.best_symbol ELSE best_symbol END, "
+    "best_multiplier = MAX(best_multiplier, excluded.best_multiplier)"
+)
+
+DELETE_SQL = "DELETE FROM slot_plays WHERE id >= :low AND id <= :high AND played_at < :cutoff"
+
+
+class SlotRollup:
+    """오래된 슬롯 기록을 일간 요약으로 압축"""
+
+    MIN_BATCH = 50
+    MAX_BATCH = 5000
+
+    def __init__(self, db_manager, batch_size: int = None, max_lock_ms: float = None, pause: float = None):
+        self.db_manager = db_manager
+        self.batch_size = batch_size or Config.SLOT_ROLLUP_BATCH_SIZE
+        self.max_lock_ms = Config.SLOT_ROLLUP_MAX_LOCK_MS if max_lock_ms is None else max_lock_ms
+        self.pause = Config.SLOT_ROLLUP_PAUSE if pause is None else pause
+
+    async def compact(self, cutoff: datetime, max_id: Optional[int] = None) -> Dict:
+        """
+        cutoff 이전 플레이를 요약하고 원본 삭제
+
+        Args:
+            cutoff: 이 시각 이전 플레이가 대상
+            max_id: 이 ID까지만 처리 (아카이브가 세그먼트에 기록한 범위)
+
+        Returns:
+            {'compacted', 'batches', 'max_lock_ms'}
+        """
+        return await asyncio.to_thread(self._compact, cutoff, max_id)
+
+    def _compact(self, cutoff: datetime, max_id: Optional[int]) -> Dict:
+        conn = self._connect()
+        params = {'cutoff': cutoff.strftime(SQLITE_DATETIME_FORMAT)}
+        try:
+            # 대상 범위: 가장 오래된 행부터 기준 시각 이후 첫 행 직전까지 (ID는 시간 순)
+            low = conn.execute('SELECT MIN(id) FROM slot_plays').fetchone()[0]
+            boundary = conn.execute(
+                'SELECT id FROM slot_plays WHERE played_at >= :cutoff ORDER BY id LIMIT 1', params
+            ).fetchone()
+            high = conn.execute('SELECT MAX(id) FROM slot_plays').fetchone()[0] if boundary is None else boundary[0] - 1
+            if max_id is not None and high is not None:
+                high = min(high, max_id)
+
+            compacted, batches, worst_lock = 0, 0, 0.0
+            batch_size = self.batch_size
+            while low is not None and high is not None and low <= high:
+                conn.execute('BEGIN IMMEDIATE')
+                started = time.perf_counter()
+                try:
+                    upper = conn.execute(
+                        'SELECT MAX(id) FROM (SELECT id FROM slot_plays WHERE id >= ? AND id <= ? ORDER BY id LIMIT ?)',
+                        (low, high, batch_size)
+                    ).fetchone()[0]
+                    if upper is None:
+                        conn.execute('COMMIT')
+                        break
+                    batch = {**params, 'low': low, 'high': upper}
+                    conn.execute(ROLLUP_SQL, batch)
+                    compacted += conn.execute(DELETE_SQL, batch).rowcount
+                    conn.execute('COMMIT')
+                except Exception:
+                    conn.execute('ROLLBACK')
+                    raise
+                lock_ms = (time.perf_counter() - started) * 1000
+                worst_lock = max(worst_lock, lock_ms)
+                batches += 1
+                low = upper + 1
+
+                # 잠금 시간이 목표를 넘으면 배치를 줄이고, 절반도 안 쓰면 늘림
+                if lock_ms > self.max_lock_ms:
+                    batch_size = max(self.MIN_BATCH, batch_size // 2)
+                elif lock_ms < self.max_lock_ms / 2:
+                    batch_size = min(self.MAX_BATCH, batch_size * 2)
+                time.sleep(self.pause)
+
+            if compacted:
+                logger.info(
+                    f"슬롯 기록 요약: {compacted}행 → slot_daily_summary "
+                    f"(배치 {batches}개, 최대 잠금 {worst_lock:.1f}ms)"
+                )
+            return {'compacted': compacted, 'batches': batches, 'max_lock_ms': worst_lock}
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # 트랜잭션은 직접 관리 (BEGIN IMMEDIATE)
+        return sqlite3.connect(self.db_manager.sqlite_path(), timeout=30, isolation_level=None)
@@ -0,0 +1,151 @@
+"""
+유저 이름 검색 색인 (FTS5 trigram)
+
+users의 현재 이름과 예전 이름을 user_name_history에 모으고, 그 위에
+외부 콘텐츠 FTS5 테이블(trigram 토크나이저)을 두어 부분 문자열 검색을
+색인으로 처리합니다. 기록과 색인은 트리거로 동기화됩니다.
+
+    users ──(INSERT / UPDATE OF username 트리거)──▶ user_name_history
+    user_name_history ──(INSERT / DELETE 트리거)──▶ user_name_fts
+
+trigram은 3글자 이상만 색인으로 찾을 수 있으므로 더 짧은 검색어는
+이름 기록 테이블을 직접 훑습니다.
+
+시즌 교체나 테이블 재구성으로 users/user_name_history 테이블이 바뀌면
+트리거는 이전 테이블과 함께 삭제되므로 교체 트랜잭션 안에서 새 테이블에
+다시 만듭니다.
+"""
+import logging
+from typing import Dict, List
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.migrations import register_swap_hook
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = 'user_name_fts'
+
+CREATE_FTS = (
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    "username, content='user_name_history', content_rowid='id', tokenize='trigram')"
+)
+
+# users에 딸린 트리거 (시즌 교체 후 다시 만들어야 함)
+USER_TRIGGERS = {
+    'trg_users_name_insert': (
+        "CREATE TRIGGER trg_users_name_insert AFTER INSERT ON users BEGIN "
+        "INSERT OR IGNORE INTO user_name_history (discord_id, username, seen_at) "
+        "VALUES (new.discord_id, new.username, COALESCE(new.updated_at, CURRENT_TIMESTAMP)); "
+        "END"
+    ),
+    'trg_users_name_update': (
+        "CREATE TRIGGER trg_users_name_update AFTER UPDATE OF username ON users "
+        "WHEN new.username IS NOT old.username BEGIN "
+        "INSERT OR IGNORE INTO user_name_history (discord_id, username, seen_at) "
+        "VALUES (new.discord_id, new.username, COALESCE(new.updated_at, CURRENT_TIMESTAMP)); "
+        "END"
+    ),
+}
+
+# 이름 기록 → 검색 색인 트리거
+HISTORY_TRIGGERS = {
+    'trg_name_history_insert': (
+        "CREATE TRIGGER trg_name_history_insert AFTER INSERT ON user_name_history BEGIN "
+        f"INSERT INTO {FTS_TABLE} (rowid, username) VALUES (new.id, new.username); "
+        "END"
+    ),
+    'trg_name_history_delete': (
+        "CREATE TRIGGER trg_name_history_delete AFTER DELETE ON user_name_history BEGIN "
+        f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, username) VALUES ('delete', old.id, old.username); "
+        "END"
+    ),
+}
+
+
+def _recreate_triggers(execute, triggers: Dict[str, str]):
+    # 같은 이름의 트리거가 이전 테이블에 남아 있을 수 있음
+    for name, ddl in triggers.items():
+        execute(f'DROP TRIGGER IF EXISTS {name}')
+        execute(ddl)
+
+
+def create_user_triggers(execute):
+    """users 트리거를 (다시) 생성"""
+    _recreate_triggers(execute, USER_TRIGGERS)
+
+
+def ensure_search_schema(conn):
+    """
+    검색 색인, 트리거 생성 및 최초 1회 백필 (init_database의 run_sync에서 호출)
+
+    Args:
+        conn: 동기 SQLAlchemy 연결
+    """
+    execute = conn.exec_driver_sql
+    exists = execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)
+    ).fetchone()
+
+    if not exists:
+        execute(CREATE_FTS)
+        # 기존 유저 이름을 기록으로 옮기고 색인 재구성
+        execute(
+            "INSERT OR IGNORE INTO user_name_history (discord_id, username, seen_at) "
+            "SELECT discord_id, username, COALESCE(updated_at, CURRENT_TIMESTAMP) FROM users"
+        )
+        execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('rebuild')")
+        logger.info("유저 이름 검색 색인 생성 완료")
+
+    for name, ddl in HISTORY_TRIGGERS.items():
+        if not execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,)).fetchone():
+            execute(ddl)
+    create_user_triggers(execute)
+
+
+# 테이블 교체 트랜잭션 안에서 새 테이블에 트리거 재생성 (sqlite3 연결)
+register_swap_hook('users', lambda conn: create_user_triggers(conn.execute))
+register_swap_hook('user_name_history', lambda conn: _recreate_triggers(conn.execute, HISTORY_TRIGGERS))
+
+
+class UserSearch:
+    """이름(예전 이름 포함)으로 유저 찾기"""
+
+    MIN_TRIGRAM_LENGTH = 3
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search(self, query: str, offset: int = 0, limit: int = 10) -> List[Dict]:
+        """
+        부분 일치하는 이름을 가진 유저 검색
+
+        Returns:
+            유저별 결과 [{'discord_id', 'current_name', 'coins', 'matched_names'}]
+            (discord_id 순, 한 유저의 여러 이름은 합쳐서 반환)
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        if len(query) >= self.MIN_TRIGRAM_LENGTH:
+            # 검색어를 하나의 구문으로 (FTS 문법 문자 무시)
+            phrase = '"' + query.replace('"', '""') + '"'
+            matches = (
+                f"SELECT h.discord_id, h.username FROM {FTS_TABLE} f "
+                "JOIN user_name_history h ON h.id = f.rowid "
+                f"WHERE {FTS_TABLE} MATCH :query"
+            )
+            params = {'query': phrase}
+        else:
+            # trigram으로 찾을 수 없는 짧은 검색어
+            matches = "SELECT discord_id, username FROM user_name_history WHERE instr(username, :query) > 0"
+            params = {'query': query}
+
+        stmt = text(
+            f"SELECT m.discord_id, u.username AS current_name, u.coins, "
+            f"group_concat(m.username, ', ') AS matched_names "
+            f"FROM ({matches}) m LEFT JOIN users u ON u.discord_id = m.discord_id "
+            f"GROUP BY m.discord_id ORDER BY m.discord_id LIMIT :limit OFFSET :offset"
+        )
+        result = await self.session.execute(stmt, {**params, 'limit': limit, 'offset': offset})
+        return [dict(row._mapping) for row in result]
@@ -8,6 +8,7 @@ from datetime import datetime
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from database.models import BlackjackGame, BlackjackPlayer, User
+from database.player_stats import record_game_stats
 
 
 class Card:
@@ -174,7 +175,7 @@ class BlackjackGameManager:
         # 진행 중인 게임 확인
         stmt = select(BlackjackGame).where(
             and_(
-                BlackjackGame.channel_id == str(channel_id),
+                BlackjackGame.channel_id == channel_id,
                 BlackjackGame.status.in_(['waiting', 'playing', 'dealer_turn'])
             )
         )
@@ -192,9 +193,9 @@ class BlackjackGameManager:
         
         # 게임 생성
         game = BlackjackGame(
-            guild_id=str(guild_id),
-            channel_id=str(channel_id),
-            host_id=str(host_id),
+            guild_id=guild_id,
+            channel_id=channel_id,
+            host_id=host_id,
             deck=deck.to_json(),
             status='waiting'
         )
@@ -214,7 +215,7 @@ class BlackjackGameManager:
         # 대기 중인 게임 찾기
         stmt = select(BlackjackGame).where(
             and_(
-                BlackjackGame.channel_id == str(channel_id),
+                BlackjackGame.channel_id == channel_id,
                 BlackjackGame.status == 'waiting'
             )
         )
@@ -232,7 +233,7 @@ class BlackjackGameManager:
         stmt = select(BlackjackPlayer).where(
             and_(
                 BlackjackPlayer.game_id == game.id,
-                BlackjackPlayer.discord_id == str(player_id)
+                BlackjackPlayer.discord_id == player_id
             )
         )
         result = await self.session.execute(stmt)
@@ -258,8 +259,8 @@ class BlackjackGameManager:
         # 참가
         player = BlackjackPlayer(
             game_id=game.id,
-            discord_id=str(player_id),
-            username=player_name,
+            discord_id=player_id,
+            user=user,
             join_order=len(current_players) + 1,
             bet_amount=bet_amount
         )
@@ -277,7 +278,7 @@ class BlackjackGameManager:
         # 대기 중인 게임 찾기
         stmt = select(BlackjackGame).where(
             and_(
-                BlackjackGame.channel_id == str(channel_id),
+                BlackjackGame.channel_id == channel_id,
                 BlackjackGame.status == 'waiting'
             )
         )
@@ -288,7 +289,7 @@ class BlackjackGameManager:
             return None
         
         # 호스트 확인
-        if str(starter_id) != game.host_id:
+        if starter_id != game.host_id:
             raise ValueError("게임 호스트만 시작할 수 있습니다.")
         
         # 플레이어 확인
@@ -337,24 +338,27 @@ class BlackjackGameManager:
     # 헬퍼 메서드들
     async def _get_or_create_user(self, discord_id: int, username: str) -> User:
         """유저 가져오기 또는 생성"""
-        stmt = select(User).where(User.discord_id == str(discord_id))
+        stmt = select(User).where(User.discord_id == discord_id)
         result = await self.session.execute(stmt)
         user = result.scalar_one_or_none()
         
         if not user:
             user = User(
-                discord_id=str(discord_id),
+                discord_id=discord_id,
                 username=username,
                 coins=1000
             )
             self.session.add(user)
             await self.session.flush()
+        elif user.username != username:
+            # 이름은 users에만 저장 - 바뀌었을 때만 갱신
+            user.username = username
         
         return user
     
     async def _get_user(self, discord_id: int) -> User:
         """유저 가져오기"""
-        stmt = select(User).where(User.discord_id == str(discord_id))
+        stmt = select(User).where(User.discord_id == discord_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
@@ -362,13 +366,23 @@ class BlackjackGameManager:
         """현재 게임 가져오기"""
         stmt = select(BlackjackGame).where(
             and_(
-                BlackjackGame.channel_id == str(channel_id),
+                BlackjackGame.channel_id == channel_id,
                 BlackjackGame.status.in_(['waiting', 'playing', 'dealer_turn'])
             )
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def get_game(self, game_id: int) -> Optional[BlackjackGame]:
+        """게임 ID로 가져오기"""
+        return await self.session.get(BlackjackGame, game_id)
+    
+    async def _resolve_game(self, channel_id: Optional[int], game_id: Optional[int]) -> Optional[BlackjackGame]:
+        """게임 ID가 있으면 기본키로, 없으면 채널의 활성 게임으로 조회"""
+        if game_id is not None:
+            return await self.get_game(game_id)
+        return await self.get_current_game(channel_id)
+    
     async def get_players(self, game_id: int) -> List[BlackjackPlayer]:
         """게임 플레이어 목록"""
         stmt = select(BlackjackPlayer).where(
@@ -395,15 +409,15 @@ class BlackjackGameManager:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
-    async def hit(self, channel_id: int, player_id: int) -> Dict:
+    async def hit(self, channel_id: Optional[int], player_id: int, game_id: Optional[int] = None) -> Dict:
         """히트 - 카드 한 장 더 받기"""
-        game = await self.get_current_game(channel_id)
+        game = await self._resolve_game(channel_id, game_id)
         if not game or game.status != 'playing':
             raise ValueError("진행 중인 게임이 없습니다.")
         
         # 현재 턴 플레이어 확인
         current_player = await self.get_current_turn_player(game.id)
-        if not current_player or str(player_id) != current_player.discord_id:
+        if not current_player or player_id != current_player.discord_id:
             if current_player:
                 raise ValueError(f"당신의 차례가 아닙니다! 현재 **{current_player.username}**님의 차례입니다.")
             raise ValueError("잘못된 요청입니다.")
@@ -505,14 +519,14 @@ class BlackjackGameManager:
                 'auto_switch': False
             }
     
-    async def stand(self, channel_id: int, player_id: int) -> Dict:
+    async def stand(self, channel_id: Optional[int], player_id: int, game_id: Optional[int] = None) -> Dict:
         """스탠드 - 카드 받기 중단"""
-        game = await self.get_current_game(channel_id)
+        game = await self._resolve_game(channel_id, game_id)
         if not game or game.status != 'playing':
             raise ValueError("진행 중인 게임이 없습니다.")
         
         current_player = await self.get_current_turn_player(game.id)
-        if not current_player or str(player_id) != current_player.discord_id:
+        if not current_player or player_id != current_player.discord_id:
             if current_player:
                 raise ValueError(f"당신의 차례가 아닙니다! 현재 **{current_player.username}**님의 차례입니다.")
             raise ValueError("잘못된 요청입니다.")
@@ -568,14 +582,14 @@ class BlackjackGameManager:
                 'switch_to_hand2': False
             }
     
-    async def double_down(self, channel_id: int, player_id: int) -> Dict:
+    async def double_down(self, channel_id: Optional[int], player_id: int, game_id: Optional[int] = None) -> Dict:
         """더블다운 - 배팅 2배, 카드 1장만 더 받고 스탠드"""
-        game = await self.get_current_game(channel_id)
+        game = await self._resolve_game(channel_id, game_id)
         if not game or game.status != 'playing':
             raise ValueError("진행 중인 게임이 없습니다.")
         
         current_player = await self.get_current_turn_player(game.id)
-        if not current_player or str(player_id) != current_player.discord_id:
+        if not current_player or player_id != current_player.discord_id:
             if current_player:
                 raise ValueError(f"당신의 차례가 아닙니다!")
             raise ValueError("잘못된 요청입니다.")
@@ -619,9 +633,9 @@ class BlackjackGameManager:
             'player': current_player
         }
     
-    async def insurance(self, channel_id: int, player_id: int) -> Dict:
+    async def insurance(self, channel_id: Optional[int], player_id: int, game_id: Optional[int] = None) -> Dict:
         """인슈어런스 - 딜러가 블랙잭일 경우 보험"""
-        game = await self.get_current_game(channel_id)
+        game = await self._resolve_game(channel_id, game_id)
         if not game or game.status != 'playing':
             raise ValueError("진행 중인 게임이 없습니다.")
         
@@ -634,7 +648,7 @@ class BlackjackGameManager:
         stmt = select(BlackjackPlayer).where(
             and_(
                 BlackjackPlayer.game_id == game.id,
-                BlackjackPlayer.discord_id == str(player_id)
+                BlackjackPlayer.discord_id == player_id
             )
         )
         result = await self.session.execute(stmt)
@@ -675,14 +689,14 @@ class BlackjackGameManager:
             'player': player
         }
     
-    async def split(self, channel_id: int, player_id: int) -> Dict:
+    async def split(self, channel_id: Optional[int], player_id: int, game_id: Optional[int] = None) -> Dict:
         """스플릿 - 같은 숫자 2장을 분리해서 2개 핸드로"""
-        game = await self.get_current_game(channel_id)
+        game = await self._resolve_game(channel_id, game_id)
         if not game or game.status != 'playing':
             raise ValueError("진행 중인 게임이 없습니다.")
         
         current_player = await self.get_current_turn_player(game.id)
-        if not current_player or str(player_id) != current_player.discord_id:
+        if not current_player or player_id != current_player.discord_id:
             if current_player:
                 raise ValueError(f"당신의 차례가 아닙니다!")
             raise ValueError("잘못된 요청입니다.")
@@ -736,6 +750,52 @@ class BlackjackGameManager:
         }
 
     
+    async def auto_stand(self, game_id: int, turn: Tuple[int, int]) -> Optional[Dict]:
+        """
+        턴 시간 초과 - 현재 핸드 자동 스탠드
+        
+        Args:
+            game_id: 게임 ID
+            turn: 타이머 등록 시점의 (current_turn, current_hand)
+        
+        Returns:
+            stand() 결과 또는 None (이미 턴이 넘어간 경우)
+        """
+        game = await self.get_game(game_id)
+        if not game or game.status != 'playing':
+            return None
+        
+        player = await self.get_current_turn_player(game.id)
+        if not player or (game.current_turn, player.current_hand) != tuple(turn):
+            return None
+        
+        return await self.stand(game.channel_id, player.discord_id, game_id=game.id)
+    
+    async def cancel_lobby(self, game_id: int) -> Optional[List[BlackjackPlayer]]:
+        """
+        대기 중인 게임 취소 및 배팅 환불
+        
+        Returns:
+            환불받은 플레이어 목록 또는 None (대기 중인 게임이 아닌 경우)
+        """
+        game = await self.get_game(game_id)
+        if not game or game.status != 'waiting':
+            return None
+        
+        players = await self.get_players(game.id)
+        for player in players:
+            user = await self._get_user(player.discord_id)
+            user.coins += player.bet_amount
+            player.result = 'refund'
+            player.payout = player.bet_amount
+        
+        game.status = 'cancelled'
+        game.finished_at = datetime.utcnow()
+        
+        await self.session.commit()
+        
+        return players
+    
     async def _advance_turn(self, game: BlackjackGame) -> Optional[BlackjackPlayer]:
         """다음 턴으로 진행"""
         players = await self.get_players(game.id)
@@ -773,6 +833,14 @@ class BlackjackGameManager:
         if not game or game.status != 'dealer_turn':
             raise ValueError("딜러 턴이 아닙니다.")
         
+        dealer_result = await self._run_dealer(game)
+        
+        await self.session.commit()
+        
+        return dealer_result
+    
+    async def _run_dealer(self, game: BlackjackGame) -> Dict:
+        """딜러 카드 진행 및 정산 (커밋은 호출자가 담당)"""
         deck = Deck.from_json(game.deck)
         dealer_hand = Hand.from_json(game.dealer_cards)
         
@@ -792,8 +860,6 @@ class BlackjackGameManager:
         # 결과 계산
         await self._calculate_results(game, dealer_hand)
         
-        await self.session.commit()
-        
         return {
             'dealer_hand': dealer_hand,
             'drawn_cards': drawn_cards,
@@ -814,7 +880,7 @@ class BlackjackGameManager:
             player_blackjack = hand.is_blackjack()
             player_bust = hand.is_bust()
             
-            user = await self._get_user(int(player.discord_id))
+            user = await self._get_user(player.discord_id)
             
             # 인슈어런스 처리
             if player.has_insurance:
@@ -886,6 +952,16 @@ class BlackjackGameManager:
             user.games_played += 1
             if player.result == 'lose':
                 user.games_lost += 1
+            
+            # 인슈어런스는 별도 사이드 베팅이라 전적에서 제외
+            await record_game_stats(
+                self.session, player.discord_id, 'blackjack',
+                wins=int(player.result in ('win', 'blackjack')),
+                losses=int(player.result == 'lose'),
+                pushes=int(player.result == 'push'),
+                blackjacks=int(player.result == 'blackjack'),
+                wagered=player.bet_amount, paid_out=total_payout
+            )
     
     def _calculate_hand_result(
         self,
@@ -0,0 +1,130 @@
+"""
+일괄 코인 지급/차감 로직
+"""
+from typing import List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import select, update, func, bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import BulkCoinJob, User
+
+
+class BulkCoinManager:
+    """역할/서버 전체 멤버에게 코인을 청크 단위로 반영하는 클래스"""
+
+    MODE_GRANT = 'grant'
+    MODE_REVOKE = 'revoke'
+    START_COINS = 1000  # 새로 만드는 유저의 기본 코인 (다른 게임과 동일)
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create_job(
+        self,
+        guild_id: int,
+        role_id: Optional[int],
+        mode: str,
+        amount: int,
+        requested_by: int,
+        channel_id: int
+    ) -> BulkCoinJob:
+        """
+        일괄 작업 생성
+
+        Raises:
+            ValueError: 금액이 잘못되었거나 서버에 진행 중인 작업이 있을 때
+        """
+        if mode not in (self.MODE_GRANT, self.MODE_REVOKE):
+            raise ValueError(f"알 수 없는 작업 종류입니다: {mode}")
+        if amount <= 0:
+            raise ValueError("양수만 입력 가능합니다!")
+
+        running = await self.get_running_job(guild_id)
+        if running:
+            raise ValueError(
+                f"이미 진행 중인 일괄 작업(#{running.id})이 있습니다. "
+                f"`/일괄작업재개`로 이어서 실행하세요."
+            )
+
+        job = BulkCoinJob(
+            guild_id=guild_id,
+            role_id=role_id,
+            mode=mode,
+            amount=amount,
+            requested_by=requested_by,
+            channel_id=channel_id
+        )
+        self.session.add(job)
+        await self.session.flush()
+        return job
+
+    async def get_job(self, job_id: int) -> Optional[BulkCoinJob]:
+        return await self.session.get(BulkCoinJob, job_id)
+
+    async def get_running_job(self, guild_id: int) -> Optional[BulkCoinJob]:
+        stmt = select(BulkCoinJob).where(
+            BulkCoinJob.guild_id == guild_id,
+            BulkCoinJob.status == 'running'
+        ).limit(1)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def apply_chunk(
+        self,
+        job: BulkCoinJob,
+        members: List[Tuple[int, str]],
+        cursor: int,
+        scanned: int
+    ) -> int:
+        """
+        멤버 한 청크에 코인을 반영하고 작업 커서를 같은 트랜잭션에서 전진
+
+        커서와 코인이 함께 커밋되므로 중단 후 재개해도 같은 멤버에게
+        두 번 반영되지 않습니다.
+
+        Args:
+            job: 진행 중인 작업
+            members: 대상 멤버 [(discord_id, 표시 이름)]
+            cursor: 이 청크에서 확인한 마지막 멤버 ID
+            scanned: 이 청크에서 확인한 멤버 수 (대상이 아닌 멤버 포함)
+
+        Returns:
+            코인이 반영된 멤버 수
+        """
+        applied = 0
+        users = User.__table__
+
+        if members and job.mode == self.MODE_GRANT:
+            # 없는 유저는 만들고, 있는 유저는 코인 증가 + 이름 갱신 (한 번의 executemany)
+            stmt = sqlite_insert(users).values(
+                discord_id=bindparam('uid'),
+                username=bindparam('name'),
+                coins=self.START_COINS + job.amount
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[users.c.discord_id],
+                set_={
+                    'coins': users.c.coins + job.amount,
+                    'username': stmt.excluded.username,
+                    'updated_at': datetime.utcnow()
+                }
+            )
+            await self.session.execute(stmt, [{'uid': uid, 'name': name} for uid, name in members])
+            applied = len(members)
+        elif members:
+            # 기록이 있는 유저만 차감 (음수 방지)
+            stmt = update(users).where(
+                users.c.discord_id == bindparam('uid')
+            ).values(coins=func.max(users.c.coins - job.amount, 0), updated_at=datetime.utcnow())
+            result = await self.session.execute(stmt, [{'uid': uid} for uid, _ in members])
+            applied = max(result.rowcount, 0)
+
+        job.cursor = cursor
+        job.scanned += scanned
+        job.applied += applied
+        return applied
+
+    async def finish(self, job: BulkCoinJob, status: str = 'done'):
+        """작업 종료 처리"""
+        job.status = status
+        job.finished_at = datetime.utcnow()
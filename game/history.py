@@ -0,0 +1,142 @@
+"""
+플레이 기록 조회 (키셋 페이지네이션)
+
+슬롯 플레이, 룰렛 게임, 블랙잭 게임 기록을 최신순으로 한 줄에 합쳐
+보여줍니다. 페이지 위치는 OFFSET 대신 마지막으로 보여준 기록의
+(시각, 종류, ID) 커서로 기억하므로, 아무리 뒤 페이지로 가도 게임마다
+(discord_id, 시각) 인덱스에서 페이지 크기만큼만 읽습니다.
+
+    SlotPlay        (discord_id, played_at, id)
+    RoulettePlayer  (discord_id, joined_at, id)  + 끝난(종료/취소) 게임만
+    BlackjackPlayer (discord_id, joined_at, id)  + 끝난(종료/취소) 게임만
+
+세 흐름을 각각 페이지 크기 + 1개씩 읽어 병합하고, 다음 페이지가 있는지는
+남는 1개로 판단합니다.
+"""
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
+from database.models import BlackjackGame, BlackjackPlayer, RouletteGame, RoulettePlayer, SlotPlay
+
+# (시각, 종류, ID) - 최신순 정렬 기준이자 다음 페이지 커서
+Cursor = Tuple[datetime, str, int]
+
+KIND_SLOT = 's'
+KIND_ROULETTE = 'r'
+KIND_BLACKJACK = 'b'
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """커서를 custom_id에 넣을 문자열로 (시각은 마이크로초 정수)"""
+    ts, kind, row_id = cursor
+    return f'{(ts - EPOCH) // timedelta(microseconds=1)}:{kind}:{row_id}'
+
+
+def decode_cursor(ts: str, kind: str, row_id: str) -> Cursor:
+    return EPOCH + timedelta(microseconds=int(ts)), kind, int(row_id)
+
+
+class PlayHistory:
+    """유저 한 명의 게임 기록 페이지 조회"""
+
+    ENDED_STATUSES = ('finished', 'cancelled')
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def page(self, discord_id: int, after: Optional[Cursor] = None, limit: int = 10) -> Tuple[List[Dict], Optional[Cursor]]:
+        """
+        커서 다음(더 오래된) 기록 한 페이지
+
+        Args:
+            discord_id: 유저 ID
+            after: 이전 페이지의 마지막 커서 (없으면 첫 페이지)
+            limit: 페이지 크기
+
+        Returns:
+            (기록 목록 [{'kind', 'ts', 'id', ...}], 다음 페이지 커서 또는 None)
+        """
+        streams = [
+            await self._slot_plays(discord_id, after, limit + 1),
+            await self._game_players(RouletteGame, RoulettePlayer, KIND_ROULETTE, discord_id, after, limit + 1),
+            await self._game_players(BlackjackGame, BlackjackPlayer, KIND_BLACKJACK, discord_id, after, limit + 1),
+        ]
+
+        entries = []
+        for entry in heapq.merge(*streams, key=self._key, reverse=True):
+            entries.append(entry)
+            if len(entries) > limit:
+                break
+
+        if len(entries) > limit:
+            entries = entries[:limit]
+            return entries, self._key(entries[-1])
+        return entries, None
+
+    @staticmethod
+    def _key(entry: Dict) -> Cursor:
+        return entry['ts'], entry['kind'], entry['id']
+
+    @staticmethod
+    def _before(ts_column, id_column, kind: str, cursor: Optional[Cursor]):
+        """(시각, 종류, ID) < 커서 조건을 이 흐름의 (시각, ID) 범위로"""
+        if cursor is None:
+            return None
+        ts, cursor_kind, row_id = cursor
+        if kind == cursor_kind:
+            return tuple_(ts_column, id_column) < (ts, row_id)
+        if kind < cursor_kind:
+            return ts_column <= ts
+        return ts_column < ts
+
+    def _where(self, discord_id_column, ts_column, id_column, kind: str, discord_id: int, cursor: Optional[Cursor]):
+        conditions = [discord_id_column == discord_id]
+        before = self._before(ts_column, id_column, kind, cursor)
+        if before is not None:
+            conditions.append(before)
+        return conditions
+
+    async def _slot_plays(self, discord_id: int, cursor: Optional[Cursor], limit: int) -> List[Dict]:
+        stmt = select(SlotPlay).where(
+            *self._where(SlotPlay.discord_id, SlotPlay.played_at, SlotPlay.id, KIND_SLOT, discord_id, cursor)
+        ).order_by(SlotPlay.played_at.desc(), SlotPlay.id.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return [
+            {
+                'kind': KIND_SLOT,
+                'ts': play.played_at,
+                'id': play.id,
+                'reels': f'{play.reel1}{play.reel2}{play.reel3}',
+                'bet': play.bet_amount,
+                'payout': play.payout,
+            }
+            for play in result.scalars()
+        ]
+
+    async def _game_players(self, game_model, player_model, kind: str, discord_id: int,
+                            cursor: Optional[Cursor], limit: int) -> List[Dict]:
+        # 진행 중인 게임은 유저당 몇 개뿐이라 인덱스 범위를 크게 벗어나지 않음
+        stmt = select(player_model, game_model).join(
+            game_model, game_model.id == player_model.game_id
+        ).where(
+            *self._where(player_model.discord_id, player_model.joined_at, player_model.id, kind, discord_id, cursor),
+            game_model.status.in_(self.ENDED_STATUSES)
+        ).order_by(
+            player_model.joined_at.desc(), player_model.id.desc()
+        ).options(noload(player_model.user)).limit(limit)
+        result = await self.session.execute(stmt)
+
+        entries = []
+        for player, game in result.all():
+            entry = {'kind': kind, 'ts': player.joined_at, 'id': player.id, 'game_id': game.id, 'status': game.status}
+            if kind == KIND_BLACKJACK:
+                entry.update(result=player.result, bet=player.bet_amount, payout=player.payout)
+            else:
+                entry.update(result='win' if player.is_winner else ('alive' if player.is_alive else 'dead'))
+            entries.append(entry)
+        return entries
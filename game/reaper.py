@@ -0,0 +1,160 @@
+"""
+방치된 게임 정리 로직
+"""
+from typing import List, Dict
+from datetime import datetime, timedelta
+from sqlalchemy import select, update, and_, or_, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import (
+    RouletteGame,
+    BlackjackGame, BlackjackPlayer,
+    User,
+)
+from game.blackjack import BlackjackGameManager
+
+
+class StaleGameReaper:
+    """일정 시간 동안 진행이 없는 게임을 찾아 일괄 정리하는 클래스"""
+
+    MODE_SETTLE = 'settle'  # 자동 스탠드 후 딜러 진행
+    MODE_REFUND = 'refund'  # 배팅 금액 환불
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_expired(
+        self,
+        game_model,
+        active_statuses: List[str],
+        lobby_timeout: timedelta,
+        game_timeout: timedelta,
+        limit: int
+    ) -> List:
+        """
+        만료된 활성 게임 조회 (status, updated_at 인덱스 사용)
+
+        Args:
+            game_model: RouletteGame 또는 BlackjackGame
+            active_statuses: 대기(waiting)를 제외한 진행 중 상태 목록
+            lobby_timeout: 대기 중인 게임의 만료 시간
+            game_timeout: 진행 중인 게임의 만료 시간
+            limit: 최대 조회 개수 (배치 크기)
+        """
+        now = datetime.utcnow()
+        stmt = select(game_model).where(
+            or_(
+                and_(
+                    game_model.status == 'waiting',
+                    game_model.updated_at < now - lobby_timeout
+                ),
+                and_(
+                    game_model.status.in_(active_statuses),
+                    game_model.updated_at < now - game_timeout
+                )
+            )
+        ).order_by(game_model.id).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def reap_roulette(
+        self,
+        lobby_timeout: timedelta,
+        game_timeout: timedelta,
+        limit: int
+    ) -> List[Dict]:
+        """
+        방치된 러시안 룰렛 게임 취소 (판돈이 없으므로 환불 없음)
+
+        Returns:
+            정리된 게임 목록 [{'game_id', 'channel_id', 'action'}]
+        """
+        games = await self.find_expired(
+            RouletteGame, ['playing'], lobby_timeout, game_timeout, limit
+        )
+
+        now = datetime.utcnow()
+        reaped = []
+        for game in games:
+            reaped.append({
+                'game_id': game.id,
+                'channel_id': game.channel_id,
+                'action': 'cancel' if game.status == 'waiting' else 'abandon'
+            })
+            game.status = 'cancelled'
+            game.finished_at = now
+
+        return reaped
+
+    async def reap_blackjack(
+        self,
+        lobby_timeout: timedelta,
+        game_timeout: timedelta,
+        limit: int,
+        mode: str = MODE_SETTLE
+    ) -> List[Dict]:
+        """
+        방치된 블랙잭 게임 정리
+
+        - 대기 중: 게임 취소 및 배팅 환불
+        - 진행 중: mode에 따라 자동 스탠드 후 딜러 진행, 또는 배팅 환불
+
+        Returns:
+            정리된 게임 목록 [{'game_id', 'channel_id', 'action'}]
+        """
+        games = await self.find_expired(
+            BlackjackGame, ['playing', 'dealer_turn'], lobby_timeout, game_timeout, limit
+        )
+        if not games:
+            return []
+
+        # 게임별 플레이어 한 번에 조회
+        stmt = select(BlackjackPlayer).where(
+            BlackjackPlayer.game_id.in_([g.id for g in games])
+        ).order_by(BlackjackPlayer.join_order)
+        result = await self.session.execute(stmt)
+        players_by_game = {}
+        for player in result.scalars().all():
+            players_by_game.setdefault(player.game_id, []).append(player)
+
+        game_manager = BlackjackGameManager(self.session)
+        now = datetime.utcnow()
+        refunds = []
+        reaped = []
+
+        for game in games:
+            players = players_by_game.get(game.id, [])
+
+            if game.status == 'waiting' or mode == self.MODE_REFUND:
+                for player in players:
+                    refund = player.bet_amount + (player.insurance_amount or 0)
+                    refunds.append({'uid': player.discord_id, 'amount': refund})
+                    player.result = 'refund'
+                    player.payout = refund
+                game.status = 'cancelled'
+                game.finished_at = now
+                action = 'refund'
+            else:
+                # 남은 핸드 자동 스탠드 후 딜러 진행
+                for player in players:
+                    if player.status == 'playing':
+                        player.status = 'stand'
+                    if player.is_split and player.split_status == 'playing':
+                        player.split_status = 'stand'
+                game.status = 'dealer_turn'
+                await game_manager._run_dealer(game)
+                action = 'settle'
+
+            reaped.append({
+                'game_id': game.id,
+                'channel_id': game.channel_id,
+                'action': action
+            })
+
+        # 환불은 한 번의 executemany로 처리
+        if refunds:
+            stmt = update(User.__table__).where(
+                User.__table__.c.discord_id == bindparam('uid')
+            ).values(coins=User.__table__.c.coins + bindparam('amount'))
+            await self.session.execute(stmt, refunds)
+
+        return reaped
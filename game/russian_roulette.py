@@ -7,6 +7,7 @@ from datetime import datetime
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from database.models import RouletteGame, RoulettePlayer, User
+from database.player_stats import record_game_stats
 
 
 class RussianRouletteGame:
@@ -53,7 +54,7 @@ class RussianRouletteGame:
         # 해당 채널에 진행 중인 게임이 있는지 확인
         stmt = select(RouletteGame).where(
             and_(
-                RouletteGame.channel_id == str(channel_id),
+                RouletteGame.channel_id == channel_id,
                 RouletteGame.status.in_(['waiting', 'playing'])
             )
         )
@@ -64,13 +65,13 @@ class RussianRouletteGame:
             return None
         
         # 호스트 유저 확인/생성
-        await self._get_or_create_user(host_id, host_name)
+        host = await self._get_or_create_user(host_id, host_name)
         
         # 새 게임 생성
         game = RouletteGame(
-            guild_id=str(guild_id),
-            channel_id=str(channel_id),
-            host_id=str(host_id),
+            guild_id=guild_id,
+            channel_id=channel_id,
+            host_id=host_id,
             bet_amount=0,  # 판돈 없음
             max_players=max_players,
             status='waiting'
@@ -81,8 +82,8 @@ class RussianRouletteGame:
         # 호스트를 첫 번째 플레이어로 추가
         player = RoulettePlayer(
             game_id=game.id,
-            discord_id=str(host_id),
-            username=host_name,
+            discord_id=host_id,
+            user=host,
             join_order=1
         )
         self.session.add(player)
@@ -111,7 +112,7 @@ class RussianRouletteGame:
         # 대기 중인 게임 찾기
         stmt = select(RouletteGame).where(
             and_(
-                RouletteGame.channel_id == str(channel_id),
+                RouletteGame.channel_id == channel_id,
                 RouletteGame.status == 'waiting'
             )
         )
@@ -125,7 +126,7 @@ class RussianRouletteGame:
         stmt = select(RoulettePlayer).where(
             and_(
                 RoulettePlayer.game_id == game.id,
-                RoulettePlayer.discord_id == str(player_id)
+                RoulettePlayer.discord_id == player_id
             )
         )
         result = await self.session.execute(stmt)
@@ -143,13 +144,13 @@ class RussianRouletteGame:
             raise ValueError("게임이 가득 찼습니다.")
         
         # 플레이어 유저 확인/생성
-        await self._get_or_create_user(player_id, player_name)
+        user = await self._get_or_create_user(player_id, player_name)
         
         # 플레이어 추가
         player = RoulettePlayer(
             game_id=game.id,
-            discord_id=str(player_id),
-            username=player_name,
+            discord_id=player_id,
+            user=user,
             join_order=len(current_players) + 1
         )
         self.session.add(player)
@@ -172,7 +173,7 @@ class RussianRouletteGame:
         # 대기 중인 게임 찾기
         stmt = select(RouletteGame).where(
             and_(
-                RouletteGame.channel_id == str(channel_id),
+                RouletteGame.channel_id == channel_id,
                 RouletteGame.status == 'waiting'
             )
         )
@@ -183,7 +184,7 @@ class RussianRouletteGame:
             return None
         
         # 호스트만 시작 가능
-        if str(starter_id) != game.host_id:
+        if starter_id != game.host_id:
             raise ValueError("게임 호스트만 시작할 수 있습니다.")
         
         # 최소 2명 이상 필요
@@ -204,8 +205,9 @@ class RussianRouletteGame:
     
     async def shoot(
         self,
-        channel_id: int,
-        shooter_id: int
+        channel_id: Optional[int],
+        shooter_id: int,
+        game_id: Optional[int] = None
     ) -> Dict:
         """
         방아쇠 당기기
@@ -213,6 +215,7 @@ class RussianRouletteGame:
         Args:
             channel_id: 채널 ID
             shooter_id: 쏘는 플레이어 ID
+            game_id: 게임 ID (있으면 채널 조회 없이 기본키로 조회)
         
         Returns:
             결과 딕셔너리 {
@@ -225,23 +228,26 @@ class RussianRouletteGame:
             }
         """
         # 진행 중인 게임 찾기
-        stmt = select(RouletteGame).where(
-            and_(
-                RouletteGame.channel_id == str(channel_id),
-                RouletteGame.status == 'playing'
+        if game_id is not None:
+            game = await self.get_game(game_id)
+        else:
+            stmt = select(RouletteGame).where(
+                and_(
+                    RouletteGame.channel_id == channel_id,
+                    RouletteGame.status == 'playing'
+                )
             )
-        )
-        result = await self.session.execute(stmt)
-        game = result.scalar_one_or_none()
+            result = await self.session.execute(stmt)
+            game = result.scalar_one_or_none()
         
-        if not game:
+        if not game or game.status != 'playing':
             raise ValueError("진행 중인 게임이 없습니다.")
         
         # 플레이어 확인
         stmt = select(RoulettePlayer).where(
             and_(
                 RoulettePlayer.game_id == game.id,
-                RoulettePlayer.discord_id == str(shooter_id),
+                RoulettePlayer.discord_id == shooter_id,
                 RoulettePlayer.is_alive == True
             )
         )
@@ -293,6 +299,7 @@ class RussianRouletteGame:
             loser_user = await self._get_user(shooter_id)
             loser_user.games_played += 1
             loser_user.games_lost += 1
+            await record_game_stats(self.session, shooter_id, 'roulette', losses=1, wagered=game.bet_amount)
             
             # 모든 생존자를 승자로 설정
             stmt = select(RoulettePlayer).where(
@@ -308,10 +315,14 @@ class RussianRouletteGame:
             for survivor in survivors:
                 survivor.is_winner = True
                 
-                winner_user = await self._get_user(int(survivor.discord_id))
+                winner_user = await self._get_user(survivor.discord_id)
                 winner_user.coins += self.WIN_REWARD
                 winner_user.games_played += 1
                 winner_user.games_won += 1
+                await record_game_stats(
+                    self.session, survivor.discord_id, 'roulette',
+                    wins=1, wagered=game.bet_amount, paid_out=self.WIN_REWARD
+                )
             
             result_data['winners'] = survivors
             result_data['reward'] = self.WIN_REWARD
@@ -328,11 +339,38 @@ class RussianRouletteGame:
         
         return result_data
     
+    async def auto_pull(self, game_id: int, turn: int) -> Optional[Dict]:
+        """
+        턴 시간 초과 - 현재 차례 플레이어 대신 방아쇠 당기기
+        
+        Args:
+            game_id: 게임 ID
+            turn: 타이머 등록 시점의 current_turn
+        
+        Returns:
+            shoot() 결과 + 'shooter' 또는 None (이미 턴이 넘어간 경우)
+        """
+        game = await self.get_game(game_id)
+        if not game or game.status != 'playing' or game.current_turn != turn:
+            return None
+        
+        shooter = await self.get_current_turn_player(game.id)
+        if not shooter:
+            return None
+        
+        result = await self.shoot(game.channel_id, shooter.discord_id, game_id=game.id)
+        result['shooter'] = shooter
+        return result
+    
+    async def get_game(self, game_id: int) -> Optional[RouletteGame]:
+        """게임 ID로 가져오기"""
+        return await self.session.get(RouletteGame, game_id)
+    
     async def get_current_game(self, channel_id: int) -> Optional[RouletteGame]:
         """현재 채널의 활성 게임 가져오기"""
         stmt = select(RouletteGame).where(
             and_(
-                RouletteGame.channel_id == str(channel_id),
+                RouletteGame.channel_id == channel_id,
                 RouletteGame.status.in_(['waiting', 'playing'])
             )
         )
@@ -372,7 +410,7 @@ class RussianRouletteGame:
         # 대기 중인 게임 찾기
         stmt = select(RouletteGame).where(
             and_(
-                RouletteGame.channel_id == str(channel_id),
+                RouletteGame.channel_id == channel_id,
                 RouletteGame.status == 'waiting'
             )
         )
@@ -383,11 +421,12 @@ class RussianRouletteGame:
             return False
         
         # 호스트만 취소 가능
-        if str(canceller_id) != game.host_id:
+        if canceller_id != game.host_id:
             raise ValueError("게임 호스트만 취소할 수 있습니다.")
         
         # 게임 취소
         game.status = 'cancelled'
+        game.finished_at = datetime.utcnow()
         
         await self.session.commit()
         
@@ -399,18 +438,21 @@ class RussianRouletteGame:
         """유저 가져오기 또는 생성"""
         from database.models import User
         
-        stmt = select(User).where(User.discord_id == str(discord_id))
+        stmt = select(User).where(User.discord_id == discord_id)
         result = await self.session.execute(stmt)
         user = result.scalar_one_or_none()
         
         if not user:
             user = User(
-                discord_id=str(discord_id),
+                discord_id=discord_id,
                 username=username,
                 coins=5000  # 신규 유저 기본 코인
             )
             self.session.add(user)
             await self.session.flush()
+        elif user.username != username:
+            # 이름은 users에만 저장 - 바뀌었을 때만 갱신
+            user.username = username
         
         return user
     
@@ -418,7 +460,7 @@ class RussianRouletteGame:
         """유저 가져오기"""
         from database.models import User
         
-        stmt = select(User).where(User.discord_id == str(discord_id))
+        stmt = select(User).where(User.discord_id == discord_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
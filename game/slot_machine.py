@@ -2,11 +2,12 @@
 슬롯머신 게임 로직
 """
 import random
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import select, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
-from database.models import SlotPlay, User
+from database.models import SlotPlay, SlotDailySummary, User
+from database.player_stats import record_game_stats
 
 
 class SlotMachine:
@@ -96,7 +97,8 @@ class SlotMachineManager:
         self,
         player_id: int,
         player_name: str,
-        bet_amount: int
+        bet_amount: int,
+        guild_id: Optional[int] = None
     ) -> Dict:
         """슬롯머신 플레이"""
         # 최소 배팅 확인
@@ -132,17 +134,22 @@ class SlotMachineManager:
         
         # 플레이 기록 저장
         play_record = SlotPlay(
-            discord_id=str(player_id),
-            username=player_name,
+            discord_id=player_id,
             bet_amount=bet_amount,
             reel1=reel1,
             reel2=reel2,
             reel3=reel3,
             is_win=result['win'],
             payout=payout,
-            multiplier=result['multiplier']
+            multiplier=result['multiplier'],
+            guild_id=guild_id
         )
         self.session.add(play_record)
+        await record_game_stats(
+            self.session, player_id, 'slot',
+            wins=int(result['win']), losses=int(not result['win']),
+            wagered=bet_amount, paid_out=payout
+        )
         
         await self.session.commit()
         
@@ -163,39 +170,65 @@ class SlotMachineManager:
     
     async def _get_or_create_user(self, discord_id: int, username: str) -> User:
         """유저 가져오기 또는 생성"""
-        stmt = select(User).where(User.discord_id == str(discord_id))
+        stmt = select(User).where(User.discord_id == discord_id)
         result = await self.session.execute(stmt)
         user = result.scalar_one_or_none()
         
         if not user:
             user = User(
-                discord_id=str(discord_id),
+                discord_id=discord_id,
                 username=username,
                 coins=1000
             )
             self.session.add(user)
             await self.session.flush()
+        elif user.username != username:
+            # 이름은 users에만 저장 - 바뀌었을 때만 갱신
+            user.username = username
         
         return user
     
     async def get_stats(self, player_id: int) -> Dict:
-        """플레이어 슬롯머신 통계"""
-        stmt = select(SlotPlay).where(
-            SlotPlay.discord_id == str(player_id)
-        )
-        result = await self.session.execute(stmt)
-        plays = result.scalars().all()
-        
-        if not plays:
+        """
+        플레이어 슬롯머신 통계
+        
+        최근 기록(slot_plays)과 요약된 오래된 기록(slot_daily_summary)을
+        각각 SQL로 집계해 합칩니다.
+        """
+        # 최고 배당 심볼: MAX()와 함께 쓴 일반 컬럼은 최댓값 행의 값 (SQLite)
+        stmt = select(
+            func.count(SlotPlay.id),
+            func.coalesce(func.sum(case((SlotPlay.is_win, 1), else_=0)), 0),
+            func.coalesce(func.sum(SlotPlay.bet_amount), 0),
+            func.coalesce(func.sum(SlotPlay.payout), 0),
+            func.max(SlotPlay.multiplier),
+            case((SlotPlay.is_win, SlotPlay.reel1))
+        ).where(SlotPlay.discord_id == player_id)
+        recent = (await self.session.execute(stmt)).one()
+        
+        stmt = select(
+            func.coalesce(func.sum(SlotDailySummary.plays), 0),
+            func.coalesce(func.sum(SlotDailySummary.wins), 0),
+            func.coalesce(func.sum(SlotDailySummary.total_bet), 0),
+            func.coalesce(func.sum(SlotDailySummary.total_payout), 0),
+            func.max(SlotDailySummary.best_multiplier),
+            SlotDailySummary.best_symbol
+        ).where(SlotDailySummary.discord_id == player_id)
+        summary = (await self.session.execute(stmt)).one()
+        
+        total_plays = recent[0] + summary[0]
+        if not total_plays:
             return None
         
-        total_plays = len(plays)
-        total_wins = sum(1 for p in plays if p.is_win)
-        total_bet = sum(p.bet_amount for p in plays)
-        total_payout = sum(p.payout for p in plays)
+        total_wins = recent[1] + summary[1]
+        total_bet = recent[2] + summary[2]
+        total_payout = recent[3] + summary[3]
         
-        # 최고 배당
-        best_play = max(plays, key=lambda p: p.multiplier)
+        # 최고 배당 (같으면 최근 기록 우선)
+        best_multiplier, best_symbol = max(
+            ((recent[4] or 0, recent[5]), (summary[4] or 0, summary[5])),
+            key=lambda best: best[0]
+        )
         
         return {
             'total_plays': total_plays,
@@ -204,6 +237,6 @@ class SlotMachineManager:
             'total_bet': total_bet,
             'total_payout': total_payout,
             'net_profit': total_payout - total_bet,
-            'best_multiplier': best_play.multiplier,
-            'best_symbol': best_play.reel1 if best_play.is_win else None
+            'best_multiplier': best_multiplier,
+            'best_symbol': best_symbol if best_multiplier > 0 else None
         }
\ No newline at end of file
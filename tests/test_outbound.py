@@ -0,0 +1,48 @@
+"""
+OutboundScheduler 레이트 리밋 대기 테스트
+"""
+import asyncio
+import unittest
+from unittest import mock
+from utils import outbound
+from utils.outbound import OutboundScheduler
+
+
+class _FakeMessage:
+    def __init__(self, message_id: int, channel_id: int = 1):
+        self.id = message_id
+        self.channel = mock.Mock(id=channel_id)
+        self.edits = 0
+
+    async def edit(self, **kwargs):
+        self.edits += 1
+        return self
+
+
+class OutboundWaitTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_waits_only_on_buckets_with_queued_jobs(self):
+        """편집만 대기 중이고 편집 버킷이 비었을 때 바쁜 대기 없이 토큰을 기다림"""
+        real_sleep = asyncio.sleep
+        wakeups = 0
+
+        async def counting_sleep(delay, *args, **kwargs):
+            nonlocal wakeups
+            wakeups += 1
+            return await real_sleep(delay, *args, **kwargs)
+
+        scheduler = OutboundScheduler(rate=1, per=0.2)
+        messages = [_FakeMessage(i) for i in range(3)]
+
+        with mock.patch.object(outbound.asyncio, 'sleep', counting_sleep):
+            futures = [scheduler.edit(message, content='x') for message in messages]
+            results = await asyncio.wait_for(asyncio.gather(*futures), timeout=5)
+
+        self.assertEqual(results, messages)
+        self.assertTrue(all(message.edits == 1 for message in messages))
+        # 토큰이 찰 때마다 한 번씩 깨어나면 충분 (바쁜 대기면 수만 번)
+        self.assertLessEqual(wakeups, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
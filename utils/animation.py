@@ -0,0 +1,198 @@
+"""
+공용 애니메이션 틱커
+
+슬롯머신처럼 "연출 화면 → 결과 화면" 순서로 보여주는 메시지를 위해
+요청마다 asyncio.sleep 코루틴을 띄우는 대신, 공개할 결과를 한곳에 모아
+일정한 틱마다 한 번에 전송 스케줄러로 넘깁니다. 틱은 레이트 리밋
+창에 맞춰 정렬되므로 같은 창 안의 편집이 한 번에 처리됩니다.
+
+서버에 처리 중인 연출이 많으면 그 서버는 즉시 모드로 전환되어
+연출 화면 없이 결과만 바로 보냅니다.
+
+사용 예시:
+    ticker = AnimationTicker(outbound, tick=1.0, instant_threshold=5)
+    ticker.start()
+    ticker.play(interaction.followup, channel_id, guild_id, frame={'embed': spin}, result={'embed': result})
+"""
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, List, Optional
+from utils.metrics import metrics
+from utils.outbound import OutboundScheduler, PRIORITY_RESULT, PRIORITY_DECORATION
+
+logger = logging.getLogger(__name__)
+
+# 한 틱에 공개된 결과 수 히스토그램 구간
+BATCH_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250)
+
+
+class _Reveal:
+    """공개를 기다리는 결과 하나"""
+    __slots__ = ('destination', 'channel_id', 'guild_id', 'frame', 'result', 'due', 'created_at')
+
+    def __init__(self, destination, channel_id, guild_id, frame, result, due):
+        self.destination = destination
+        self.channel_id = channel_id
+        self.guild_id = guild_id
+        self.frame = frame
+        self.result = result
+        self.due = due
+        self.created_at = time.monotonic()
+
+
+class AnimationTicker:
+    """연출 프레임 → 결과 공개를 틱 단위로 모아 처리하는 스케줄러"""
+
+    def __init__(
+        self,
+        outbound: OutboundScheduler,
+        tick: float = 1.0,
+        instant_threshold: int = 5,
+        channel_backlog: int = 5
+    ):
+        """
+        Args:
+            outbound: 실제 전송을 맡을 전송 스케줄러
+            tick: 틱 간격 (초), 연출 화면이 보이는 최소 시간
+            instant_threshold: 서버의 대기 중인 연출이 이 수 이상이면 즉시 모드
+            channel_backlog: 채널 전송 대기열이 이 수 이상이면 연출 생략
+        """
+        self.outbound = outbound
+        self.tick = tick
+        self.instant_threshold = instant_threshold
+        self.channel_backlog = channel_backlog
+        self._pending: List[_Reveal] = []
+        self._per_guild: Dict[int, int] = {}
+        self._origin = time.monotonic()
+        self._current_tick = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def is_instant(self, guild_id: Optional[int], channel_id: Optional[int] = None) -> bool:
+        """연출 없이 결과만 보낼 상황인지 (서버 부하 또는 채널 대기열 적체)"""
+        if guild_id is not None and self._per_guild.get(guild_id, 0) >= self.instant_threshold:
+            return True
+        if channel_id is not None and self.outbound.depth(channel_id) >= self.channel_backlog:
+            return True
+        return False
+
+    def play(
+        self,
+        destination,
+        channel_id: int,
+        guild_id: Optional[int],
+        frame: Dict,
+        result: Dict,
+        frames: int = 1
+    ):
+        """
+        연출 화면을 보내고 frames틱 뒤에 결과로 편집하도록 등록
+
+        Args:
+            destination: send()를 가진 대상 (채널 또는 interaction.followup)
+            channel_id: 전송 대기열을 나눌 채널 ID
+            guild_id: 즉시 모드 판단에 쓸 서버 ID
+            frame: 연출 화면 메시지 인자
+            result: 결과 화면 메시지 인자
+            frames: 연출 화면을 보여줄 최소 틱 수
+        """
+        if self.is_instant(guild_id, channel_id):
+            metrics.inc('animation.instant')
+            self.outbound.send(destination, channel_id=channel_id, priority=PRIORITY_RESULT, **result)
+            return
+
+        frame_future = self.outbound.send(
+            destination,
+            channel_id=channel_id,
+            priority=PRIORITY_DECORATION,
+            wait=True,
+            **frame
+        )
+        # 연출 화면이 최소 frames틱 동안 보이도록 그 이후 첫 틱 경계에 공개
+        due = math.ceil((time.monotonic() + frames * self.tick - self._origin) / self.tick)
+        self._pending.append(
+            _Reveal(destination, channel_id, guild_id, frame_future, result, due)
+        )
+        if guild_id is not None:
+            self._per_guild[guild_id] = self._per_guild.get(guild_id, 0) + 1
+        metrics.set_gauge('animation.pending', len(self._pending))
+
+    # === 실행 ===
+
+    def start(self):
+        """틱 태스크 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name='animation-ticker')
+
+    async def stop(self):
+        """틱 태스크 중지 (남은 결과는 즉시 공개)"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._flush(force=True)
+
+    async def _run(self):
+        """틱 경계마다 만기된 결과를 한 번에 공개"""
+        while True:
+            next_tick_at = self._origin + (self._current_tick + 1) * self.tick
+            delay = next_tick_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            self._current_tick = int((time.monotonic() - self._origin) / self.tick)
+            try:
+                self._flush()
+            except Exception as e:
+                logger.error(f"애니메이션 틱 처리 오류: {e}", exc_info=True)
+
+    def _flush(self, force: bool = False):
+        """만기된 결과 공개 (연출 화면이 아직 대기열에 있으면 다음 틱으로 미룸)"""
+        if not self._pending:
+            return
+
+        remaining = []
+        revealed = 0
+        now = time.monotonic()
+
+        for reveal in self._pending:
+            if not force and (reveal.due > self._current_tick or not reveal.frame.done()):
+                if reveal.due <= self._current_tick:
+                    metrics.inc('animation.deferred')
+                remaining.append(reveal)
+                continue
+
+            message = reveal.frame.result() if reveal.frame.done() else None
+            if message is not None:
+                self.outbound.edit(message, priority=PRIORITY_RESULT, **reveal.result)
+            else:
+                # 연출 화면이 버려졌거나 아직 못 보냄 - 결과를 새 메시지로
+                self.outbound.send(
+                    reveal.destination,
+                    channel_id=reveal.channel_id,
+                    priority=PRIORITY_RESULT,
+                    **reveal.result
+                )
+
+            if reveal.guild_id is not None:
+                count = self._per_guild.get(reveal.guild_id, 1) - 1
+                if count > 0:
+                    self._per_guild[reveal.guild_id] = count
+                else:
+                    self._per_guild.pop(reveal.guild_id, None)
+
+            metrics.observe('animation.reveal_delay_seconds', now - reveal.created_at)
+            revealed += 1
+
+        self._pending = remaining
+        if revealed:
+            metrics.inc('animation.revealed', revealed)
+            metrics.observe('animation.batch_size', revealed, buckets=BATCH_BUCKETS)
+        metrics.set_gauge('animation.pending', len(self._pending))
@@ -0,0 +1,112 @@
+"""
+관리자 권한 확인
+
+봇 소유자, 개발자 팀 멤버, 설정된 관리자 역할 ID를 시작 시 한 번 불러와
+메모리의 집합으로 보관하고 주기적으로 갱신합니다. 명령어 실행 시의
+권한 확인은 집합 조회만 하므로 네트워크 호출이 없습니다.
+
+사용 예시:
+    bot.authorization = Authorization(bot, admin_role_ids={1234}, refresh_interval=1800)
+    await bot.authorization.refresh()
+    bot.authorization.start()
+
+    @app_commands.command(name="코인지급")
+    @admin_only()
+    async def give_coins(self, interaction, ...):
+        ...
+"""
+import asyncio
+import logging
+from typing import Iterable, Optional, Set
+import discord
+from discord import app_commands
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class NotAdmin(app_commands.CheckFailure):
+    """관리자가 아닌 유저가 관리자 명령어를 실행함"""
+
+    def __init__(self):
+        super().__init__("❌ 봇 관리자만 사용할 수 있는 명령어입니다!")
+
+
+class Authorization:
+    """관리자 유저/역할 집합과 주기적 갱신"""
+
+    def __init__(self, client: discord.Client, admin_role_ids: Iterable[int] = (), refresh_interval: float = 1800.0):
+        """
+        Args:
+            client: 애플리케이션 정보를 조회할 봇
+            admin_role_ids: 관리자로 인정할 역할 ID
+            refresh_interval: 소유자/팀 멤버 갱신 주기 (초)
+        """
+        self.client = client
+        self.admin_role_ids: Set[int] = set(admin_role_ids)
+        self.refresh_interval = refresh_interval
+        self.user_ids: Set[int] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def is_admin(self, user) -> bool:
+        """소유자/팀 멤버이거나 관리자 역할을 가진 멤버인지 (네트워크 호출 없음)"""
+        if user.id in self.user_ids:
+            return True
+        if self.admin_role_ids and isinstance(user, discord.Member):
+            return any(role.id in self.admin_role_ids for role in user.roles)
+        return False
+
+    async def refresh(self):
+        """애플리케이션 정보에서 소유자와 팀 멤버를 다시 불러옴"""
+        app_info = await self.client.application_info()
+
+        user_ids = {app_info.owner.id}
+        if app_info.team is not None:
+            user_ids.update(
+                member.id for member in app_info.team.members
+                if member.membership_state == discord.TeamMembershipState.accepted
+            )
+
+        if user_ids != self.user_ids:
+            logger.info(f"관리자 목록 갱신: 유저 {len(user_ids)}명, 역할 {len(self.admin_role_ids)}개")
+        self.user_ids = user_ids
+        metrics.inc('authorization.refreshed')
+        metrics.set_gauge('authorization.admin_users', len(user_ids))
+
+    # === 실행 ===
+
+    def start(self):
+        """주기적 갱신 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name='authorization-refresh')
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            # 아직 한 번도 불러오지 못했다면 짧은 간격으로 재시도
+            await asyncio.sleep(self.refresh_interval if self.user_ids else min(self.refresh_interval, 60.0))
+            try:
+                await self.refresh()
+            except Exception as e:
+                # 갱신에 실패하면 이전 목록을 그대로 사용
+                metrics.inc('authorization.refresh_failed')
+                logger.warning(f"관리자 목록 갱신 실패: {e}")
+
+
+def admin_only():
+    """관리자만 실행할 수 있는 슬래시 명령어 체크 (실패 시 NotAdmin)"""
+    async def predicate(interaction: discord.Interaction) -> bool:
+        if interaction.client.authorization.is_admin(interaction.user):
+            return True
+        metrics.inc('authorization.denied')
+        raise NotAdmin()
+
+    return app_commands.check(predicate)
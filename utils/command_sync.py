@@ -0,0 +1,101 @@
+"""
+슬래시 명령어 동기화 관리
+
+tree.sync()는 레이트 리밋이 빡빡한 전역 HTTP 호출이라 재연결마다 부르면
+동기화 한도를 낭비하고 준비 완료도 늦어집니다. 등록된 명령어 트리
+(이름, 설명, 인자)로 안정적인 해시를 만들어 파일에 저장해 두고, 해시가
+바뀌었거나 관리자가 강제로 요청한 경우에만 동기화합니다.
+
+개발 중에는 특정 서버에만 동기화하면 전역 전파 지연 없이 바로 반영됩니다.
+
+사용 예시:
+    syncer = CommandSyncer(bot.tree, 'data/command_sync.json')
+    synced = await syncer.sync()                  # 바뀐 경우만
+    synced = await syncer.sync(guild=guild, force=True)
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+import discord
+from discord import app_commands
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class CommandSyncer:
+    """명령어 트리 해시를 비교해 필요한 경우에만 동기화"""
+
+    def __init__(self, tree: app_commands.CommandTree, state_path: str):
+        """
+        Args:
+            tree: 동기화할 명령어 트리
+            state_path: 마지막으로 동기화한 해시를 저장할 파일 경로
+        """
+        self.tree = tree
+        self.state_path = state_path
+
+    def signature(self, guild: Optional[discord.abc.Snowflake] = None) -> str:
+        """명령어 트리의 안정적인 해시 (이름 순 정렬, 키 순서 고정)"""
+        payload = sorted(
+            (command.to_dict(self.tree) for command in self.tree.get_commands(guild=guild)),
+            key=lambda c: (c.get('type', 1), c['name'])
+        )
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    async def sync(
+        self,
+        guild: Optional[discord.abc.Snowflake] = None,
+        force: bool = False
+    ) -> Optional[List[app_commands.AppCommand]]:
+        """
+        해시가 바뀌었거나 force이면 동기화
+
+        Args:
+            guild: 지정하면 해당 서버에만 동기화 (개발용)
+            force: 해시와 관계없이 동기화
+
+        Returns:
+            동기화된 명령어 목록, 건너뛰었으면 None
+        """
+        key = self._state_key(guild)
+        digest = self.signature(guild)
+        state = self._load_state()
+
+        if not force and state.get(key) == digest:
+            metrics.inc('command_sync.skipped')
+            logger.info(f"명령어 트리 변경 없음 - 동기화 생략 ({key})")
+            return None
+
+        synced = await self.tree.sync(guild=guild)
+        state[key] = digest
+        self._save_state(state)
+        metrics.inc('command_sync.synced', labels={'forced': str(force).lower()})
+        return synced
+
+    def _state_key(self, guild) -> str:
+        # 봇(애플리케이션)이 바뀌면 다시 동기화하도록 애플리케이션 ID 포함
+        scope = f'guild:{guild.id}' if guild is not None else 'global'
+        return f'{self.tree.client.application_id}:{scope}'
+
+    def _load_state(self) -> Dict[str, str]:
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"명령어 동기화 상태 파일을 읽지 못함 (다시 동기화): {e}")
+            return {}
+
+    def _save_state(self, state: Dict[str, str]):
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{self.state_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,89 @@
+"""
+지연 멤버 조회 (LRU 캐시)
+
+members 인텐트와 멤버 캐시 없이 동작할 때, 멤버 객체가 꼭 필요한 경우
+(타임아웃 적용 등)에만 HTTP로 가져오고 최근 조회한 멤버를 크기가 제한된
+LRU 캐시에 보관합니다. 단순 멘션은 조회 없이 `<@id>` 형식을 그대로 씁니다.
+
+상호작용에 포함된 멤버 정보는 remember()로 미리 넣어 두면 이후 조회가
+HTTP 호출 없이 끝납니다.
+
+사용 예시:
+    lookup = MemberLookup(maxsize=1024, ttl=600)
+    lookup.remember(interaction.user)
+    member = await lookup.get(guild, user_id)
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+import discord
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class MemberLookup:
+    """(서버 ID, 유저 ID) → 멤버 LRU 캐시와 지연 조회"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 600.0):
+        """
+        Args:
+            maxsize: 캐시에 보관할 최대 멤버 수
+            ttl: 캐시 유효 시간 (초, 역할 변경 등을 반영하기 위해 만료)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache: 'OrderedDict[Tuple[int, int], Tuple[discord.Member, float]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def remember(self, member):
+        """이미 가진 멤버 객체를 캐시에 넣음 (멤버가 아니면 무시)"""
+        if not isinstance(member, discord.Member):
+            return
+        key = (member.guild.id, member.id)
+        self._cache[key] = (member, time.monotonic())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+            metrics.inc('member_lookup.evicted')
+        metrics.set_gauge('member_lookup.size', len(self._cache))
+
+    def invalidate(self, guild_id: int, user_id: Optional[int] = None):
+        """멤버 하나 또는 서버 전체 캐시 삭제"""
+        if user_id is not None:
+            self._cache.pop((guild_id, user_id), None)
+        else:
+            for key in [k for k in self._cache if k[0] == guild_id]:
+                del self._cache[key]
+        metrics.set_gauge('member_lookup.size', len(self._cache))
+
+    async def get(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        """
+        멤버 조회 (캐시 → 라이브러리 캐시 → HTTP 순서)
+
+        Returns:
+            멤버 객체, 서버에 없으면 None
+        """
+        key = (guild.id, user_id)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[1] < self.ttl:
+            self._cache.move_to_end(key)
+            metrics.inc('member_lookup.hit')
+            return cached[0]
+
+        member = guild.get_member(user_id)
+        if member is None:
+            metrics.inc('member_lookup.fetch')
+            try:
+                member = await guild.fetch_member(user_id)
+            except discord.NotFound:
+                self._cache.pop(key, None)
+                return None
+        else:
+            metrics.inc('member_lookup.hit')
+
+        self.remember(member)
+        return member
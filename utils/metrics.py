@@ -0,0 +1,102 @@
+"""
+프로세스 내부 지표 수집 모듈
+
+카운터, 게이지, 히스토그램을 이름(과 라벨)별로 모아 두고
+관리자 명령어나 로그에서 스냅샷으로 조회합니다.
+
+사용 예시:
+    from utils.metrics import metrics
+    metrics.inc('timer_wheel.fired')
+    metrics.set_gauge('timer_wheel.depth', 12)
+    metrics.observe('timer_wheel.lateness_seconds', 0.03)
+"""
+import bisect
+from typing import Dict, Optional, Tuple
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """누적 구간 히스토그램"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """구간 경계로 근사한 분위수"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'avg': self.total / self.count if self.count else 0.0,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'max': self.max,
+        }
+
+
+class MetricsRegistry:
+    """지표 저장소"""
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Optional[Dict] = None) -> str:
+        if not labels:
+            return name
+        label_text = ','.join(f'{k}={v}' for k, v in sorted(labels.items()))
+        return f'{name}{{{label_text}}}'
+
+    def inc(self, name: str, value: int = 1, labels: Dict = None):
+        """카운터 증가"""
+        key = self._key(name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, labels: Dict = None):
+        """게이지 값 설정"""
+        self.gauges[self._key(name, labels)] = value
+
+    def observe(self, name: str, value: float, labels: Dict = None, buckets: Tuple[float, ...] = None):
+        """히스토그램에 값 기록"""
+        key = self._key(name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(buckets or DEFAULT_BUCKETS)
+        histogram.observe(value)
+
+    def snapshot(self, prefix: str = '') -> Dict:
+        """현재 지표 스냅샷 (prefix로 시작하는 이름만)"""
+        return {
+            'counters': {k: v for k, v in self.counters.items() if k.startswith(prefix)},
+            'gauges': {k: v for k, v in self.gauges.items() if k.startswith(prefix)},
+            'histograms': {
+                k: h.summary() for k, h in self.histograms.items() if k.startswith(prefix)
+            },
+        }
+
+
+# 전역 지표 저장소
+metrics = MetricsRegistry()
@@ -0,0 +1,296 @@
+"""
+채널별 메시지 전송 스케줄러
+
+핸들러가 Discord HTTP 호출을 직접 기다리지 않도록 전송/편집 요청을
+채널별 큐에 넣고 바로 돌아갑니다. 채널마다 워커 하나가 우선순위 순서로
+요청을 처리하며, 레이트 리밋 버킷을 미리 지켜 429 대기가 핸들러에서
+일어나지 않게 합니다.
+
+- 우선순위: 결과(RESULT) > 일반(NORMAL) > 연출(DECORATION)
+- 같은 메시지에 대한 편집이 큐에 남아 있으면 하나로 병합
+- 큐가 가득 차면 연출 메시지부터 버림
+- 큐 대기 시간/요청 시간을 지표로 기록
+
+사용 예시:
+    outbound = OutboundScheduler(rate=5, per=5.0)
+    outbound.send(channel, priority=PRIORITY_RESULT, embed=embed)
+    message = await outbound.send(interaction.followup, channel_id=interaction.channel_id, wait=True, embed=embed)
+    outbound.edit(message, embed=new_embed)
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Dict, List, Optional
+import discord
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_RESULT = 0
+PRIORITY_NORMAL = 1
+PRIORITY_DECORATION = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_RESULT: 'result',
+    PRIORITY_NORMAL: 'normal',
+    PRIORITY_DECORATION: 'decoration',
+}
+
+
+class _Bucket:
+    """토큰 버킷 (per초 동안 rate회)"""
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def delay(self) -> float:
+        """다음 요청까지 기다려야 하는 시간 (초)"""
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+        self.updated = now
+
+        wait = max(self.blocked_until - now, 0.0)
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) * self.per / self.rate)
+        return wait
+
+    def consume(self):
+        self.tokens -= 1
+
+    def penalize(self, retry_after: float):
+        """429 응답을 받으면 retry_after 동안 버킷 잠금"""
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.blocked_until = self.updated + retry_after
+
+
+class _Job:
+    """큐에 들어간 전송/편집 요청 하나"""
+    __slots__ = ('priority', 'seq', 'kind', 'target', 'kwargs', 'future', 'enqueued_at', 'merge_key', 'dead')
+
+    def __init__(self, priority, seq, kind, target, kwargs, future, merge_key=None):
+        self.priority = priority
+        self.seq = seq
+        self.kind = kind
+        self.target = target
+        self.kwargs = kwargs
+        self.future = future
+        self.enqueued_at = time.monotonic()
+        self.merge_key = merge_key
+        self.dead = False
+
+    def __lt__(self, other: '_Job') -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class _ChannelQueue:
+    """채널 하나의 대기열과 버킷"""
+
+    def __init__(self, rate: int, per: float):
+        self.heap: List[_Job] = []
+        self.edits: Dict[Any, _Job] = {}
+        self.buckets = {
+            'send': _Bucket(rate, per),
+            'edit': _Bucket(rate, per),
+        }
+        self.size = 0
+        self.task: Optional[asyncio.Task] = None
+
+
+class OutboundScheduler:
+    """채널별 우선순위 큐 기반 메시지 전송기"""
+
+    def __init__(self, rate: int = 5, per: float = 5.0, max_queue: int = 100):
+        self.rate = rate
+        self.per = per
+        self.max_queue = max_queue
+        self._queues: Dict[int, _ChannelQueue] = {}
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return sum(q.size for q in self._queues.values())
+
+    def depth(self, channel_id: int) -> int:
+        """채널 대기열에 남은 요청 수"""
+        queue = self._queues.get(channel_id)
+        return queue.size if queue else 0
+
+    # === 등록 ===
+
+    def send(
+        self,
+        destination,
+        *,
+        channel_id: Optional[int] = None,
+        priority: int = PRIORITY_NORMAL,
+        **kwargs
+    ) -> asyncio.Future:
+        """
+        메시지 전송 요청
+
+        Args:
+            destination: send()를 가진 대상 (채널 또는 interaction.followup)
+            channel_id: 큐를 나눌 채널 ID (없으면 destination.id)
+            priority: PRIORITY_RESULT / PRIORITY_NORMAL / PRIORITY_DECORATION
+            **kwargs: destination.send()에 전달할 인자
+
+        Returns:
+            전송된 메시지로 완료되는 Future (실패하거나 버려지면 None)
+        """
+        if channel_id is None:
+            channel_id = destination.id
+        return self._enqueue(channel_id, 'send', destination, kwargs, priority)
+
+    def edit(self, message, *, priority: int = PRIORITY_NORMAL, **kwargs) -> asyncio.Future:
+        """
+        메시지 편집 요청 (같은 메시지의 대기 중인 편집과 병합)
+
+        Args:
+            message: 편집할 메시지 (Message, PartialMessage, WebhookMessage)
+            priority: 우선순위 (병합되면 더 높은 쪽을 따름)
+            **kwargs: message.edit()에 전달할 인자 (나중 요청이 덮어씀)
+        """
+        queue = self._queues.get(message.channel.id)
+        job = queue.edits.get(message.id) if queue else None
+
+        if job is not None:
+            metrics.inc('outbound.merged')
+            job.kwargs.update(kwargs)
+            if priority < job.priority:
+                # 더 급한 요청이면 같은 Future를 가진 새 항목으로 다시 넣음
+                job.dead = True
+                queue.size -= 1
+                return self._enqueue(
+                    message.channel.id, 'edit', message, job.kwargs, priority,
+                    merge_key=message.id, future=job.future
+                )
+            return job.future
+
+        return self._enqueue(message.channel.id, 'edit', message, kwargs, priority, merge_key=message.id)
+
+    def _enqueue(self, channel_id, kind, target, kwargs, priority, merge_key=None, future=None) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = future or loop.create_future()
+
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            self._prune()
+            queue = self._queues[channel_id] = _ChannelQueue(self.rate, self.per)
+
+        if queue.size >= self.max_queue and not self._make_room(queue, priority):
+            metrics.inc('outbound.dropped', labels={'priority': PRIORITY_NAMES[priority]})
+            future.set_result(None)
+            return future
+
+        job = _Job(priority, next(self._seq), kind, target, kwargs, future, merge_key)
+        heapq.heappush(queue.heap, job)
+        queue.size += 1
+        if merge_key is not None:
+            queue.edits[merge_key] = job
+        metrics.set_gauge('outbound.queue_depth', len(self))
+
+        if queue.task is None or queue.task.done():
+            queue.task = asyncio.create_task(self._worker(queue), name=f'outbound-{channel_id}')
+        return future
+
+    def _make_room(self, queue: _ChannelQueue, priority: int) -> bool:
+        """큐가 가득 찼을 때 더 낮은 우선순위 요청 하나를 버림"""
+        victims = [j for j in queue.heap if not j.dead and j.priority > priority]
+        if not victims:
+            return False
+
+        victim = max(victims)
+        victim.dead = True
+        queue.size -= 1
+        if victim.merge_key is not None and queue.edits.get(victim.merge_key) is victim:
+            del queue.edits[victim.merge_key]
+        metrics.inc('outbound.dropped', labels={'priority': PRIORITY_NAMES[victim.priority]})
+        if not victim.future.done():
+            victim.future.set_result(None)
+        return True
+
+    # === 처리 ===
+
+    async def _worker(self, queue: _ChannelQueue):
+        """채널 큐를 우선순위 순서로 비움 (비면 종료)"""
+        try:
+            while queue.heap:
+                while queue.heap and queue.heap[0].dead:
+                    heapq.heappop(queue.heap)
+                if not queue.heap:
+                    break
+
+                # 버킷이 비어 있는 종류의 요청이 다른 종류를 막지 않도록
+                # 지금 보낼 수 있는 요청 중 가장 급한 것을 고름
+                live = [j for j in queue.heap if not j.dead]
+                delays = {kind: queue.buckets[kind].delay() for kind in {j.kind for j in live}}
+                ready = [j for j in live if delays[j.kind] == 0]
+                if not ready:
+                    # 대기 중인 요청이 있는 버킷만 기준으로 (빈 종류의 버킷은 지연 0이라 바쁜 대기가 됨)
+                    # 기다리는 동안 더 급한 요청이 들어올 수 있으므로 다시 확인
+                    await asyncio.sleep(min(delays.values()))
+                    continue
+
+                job = min(ready)
+                job.dead = True
+                queue.size -= 1
+                if job.merge_key is not None and queue.edits.get(job.merge_key) is job:
+                    del queue.edits[job.merge_key]
+
+                bucket = queue.buckets[job.kind]
+                bucket.consume()
+                await self._execute(job, bucket, queue)
+        finally:
+            metrics.set_gauge('outbound.queue_depth', len(self))
+
+    def _prune(self):
+        """버킷이 다 찬 유휴 채널 큐 정리 (버킷 상태를 잃어도 안전한 경우만)"""
+        now = time.monotonic()
+        idle = [
+            channel_id for channel_id, queue in self._queues.items()
+            if not queue.heap and all(now - b.updated > b.per and now > b.blocked_until for b in queue.buckets.values())
+        ]
+        for channel_id in idle:
+            del self._queues[channel_id]
+
+    async def _execute(self, job: _Job, bucket: _Bucket, queue: _ChannelQueue):
+        """요청 하나 실행 및 지표 기록"""
+        labels = {'kind': job.kind, 'priority': PRIORITY_NAMES[job.priority]}
+        started = time.monotonic()
+        metrics.observe('outbound.queue_latency_seconds', started - job.enqueued_at, labels=labels)
+
+        result = None
+        try:
+            if job.kind == 'send':
+                result = await job.target.send(**job.kwargs)
+            else:
+                result = await job.target.edit(**job.kwargs)
+            metrics.inc('outbound.sent', labels=labels)
+        except discord.RateLimited as e:
+            # 버킷을 잠그고 다시 대기 상태로 (항목은 아직 힙에 남아 있음)
+            metrics.inc('outbound.rate_limited', labels={'kind': job.kind})
+            bucket.penalize(e.retry_after)
+            job.dead = False
+            queue.size += 1
+            if job.merge_key is not None:
+                queue.edits.setdefault(job.merge_key, job)
+            return
+        except discord.NotFound:
+            # 메시지/채널이 삭제됨
+            metrics.inc('outbound.not_found', labels={'kind': job.kind})
+        except discord.HTTPException as e:
+            metrics.inc('outbound.errors', labels={'kind': job.kind})
+            logger.warning(f"메시지 {job.kind} 실패: {e}")
+        except Exception as e:
+            metrics.inc('outbound.errors', labels={'kind': job.kind})
+            logger.error(f"메시지 {job.kind} 오류: {e}", exc_info=True)
+
+        metrics.observe('outbound.request_seconds', time.monotonic() - started, labels={'kind': job.kind})
+        if not job.future.done():
+            job.future.set_result(result)
@@ -0,0 +1,135 @@
+"""
+적응형 상호작용 응답
+
+모든 명령어가 먼저 defer()하고 followup을 보내면 빠른 조회 명령어도
+HTTP 호출이 두 번 필요합니다. AdaptiveResponder는 작업이 예산 시간 안에
+끝나 첫 응답이 준비되면 response.send_message로 바로 답하고, 예산을
+넘기면 그때 defer()한 뒤 이후 응답을 followup으로 보냅니다.
+
+send()는 응답 여부를 알아서 판단하므로 전송 스케줄러의 대상으로도 쓸 수 있습니다.
+
+사용 예시:
+    reply = AdaptiveResponder.start(interaction)
+    ...
+    await reply.send(embed=embed)
+    bot.outbound.send(reply, channel_id=reply.channel_id, embed=embed)
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+import discord
+from config import Config
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 명령어 응답 시간 히스토그램 구간 (초)
+RESPONSE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+
+
+class AdaptiveResponder:
+    """예산 시간 안이면 바로 응답하고, 넘기면 defer 후 followup"""
+
+    def __init__(self, interaction: discord.Interaction, budget: float, ephemeral: bool = False):
+        """
+        Args:
+            interaction: 응답할 상호작용
+            budget: 바로 응답을 기다려 줄 시간 (초, Discord 제한 3초보다 작아야 함)
+            ephemeral: defer할 때 '생각 중' 메시지를 본인에게만 보일지
+        """
+        self.interaction = interaction
+        self.budget = budget
+        self.ephemeral = ephemeral
+        self.path: Optional[str] = None
+        self._started = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+
+    @classmethod
+    def start(
+        cls,
+        interaction: discord.Interaction,
+        ephemeral: bool = False,
+        budget: Optional[float] = None
+    ) -> 'AdaptiveResponder':
+        """응답기를 만들고 예산 타이머 시작"""
+        responder = cls(
+            interaction,
+            Config.RESPONSE_BUDGET_SECONDS if budget is None else budget,
+            ephemeral=ephemeral
+        )
+        responder._timer = asyncio.create_task(responder._defer_after_budget())
+        return responder
+
+    @property
+    def channel_id(self) -> Optional[int]:
+        return self.interaction.channel_id
+
+    @property
+    def command_name(self) -> str:
+        """지표 라벨용 명령어 이름 (버튼은 custom_id 앞부분)"""
+        command = self.interaction.command
+        if command is not None:
+            return command.qualified_name
+        custom_id = (self.interaction.data or {}).get('custom_id', '')
+        return custom_id.split(':', 1)[0] or 'unknown'
+
+    async def send(self, content=None, *, wait: bool = False, **kwargs):
+        """
+        응답 전송 (아직 응답 전이면 바로 응답, 아니면 followup)
+
+        Args:
+            content: 메시지 내용
+            wait: 보낸 메시지를 반환받을지
+            **kwargs: send_message()/followup.send()에 전달할 인자
+        """
+        # 뷰가 없으면 인자 자체를 빼야 함 (send_message/followup.send 모두 view=None을 거부)
+        if kwargs.get('view') is None:
+            kwargs.pop('view', None)
+
+        async with self._lock:
+            response = self.interaction.response
+            if not response.is_done():
+                self._cancel_timer()
+                callback = await response.send_message(content, **kwargs)
+                self._record('direct')
+                return callback.resource if wait else None
+
+        return await self.interaction.followup.send(content, wait=wait, **kwargs)
+
+    async def defer(self):
+        """예산과 관계없이 바로 defer (오래 걸리는 작업을 시작하기 전)"""
+        async with self._lock:
+            if not self.interaction.response.is_done():
+                self._cancel_timer()
+                await self.interaction.response.defer(ephemeral=self.ephemeral)
+                self._record('deferred')
+
+    async def _defer_after_budget(self):
+        await asyncio.sleep(self.budget)
+        async with self._lock:
+            if self.interaction.response.is_done():
+                return
+            try:
+                await self.interaction.response.defer(ephemeral=self.ephemeral)
+                self._record('deferred')
+            except discord.HTTPException as e:
+                logger.warning(f"응답 지연 처리 실패 ({self.command_name}): {e}")
+
+    def _cancel_timer(self):
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+
+    def _record(self, path: str):
+        """첫 응답까지 걸린 시간을 명령어/경로별로 기록"""
+        self.path = path
+        labels = {'command': self.command_name, 'path': path}
+        metrics.inc('command.responses', labels=labels)
+        metrics.observe(
+            'command.first_response_seconds',
+            time.monotonic() - self._started,
+            labels=labels,
+            buckets=RESPONSE_BUCKETS
+        )
@@ -0,0 +1,200 @@
+"""
+응답 이후 부수 작업 실행기
+
+타임아웃 적용처럼 실패해도 게임 진행에 지장이 없는 Discord 호출을
+응답 메시지가 전달된 뒤에 백그라운드 워커에서 실행합니다.
+
+- 크기가 제한된 대기열 (가득 차면 새 작업을 버림)
+- 일시적 오류(5xx, 레이트 리밋)는 지수 백오프로 재시도
+- 서버별 권한 캐시: Forbidden을 받은 작업 종류는 역할/권한 변경 이벤트로
+  캐시가 무효화될 때까지 다시 시도하지 않음
+
+사용 예시:
+    executor = SideEffectExecutor(maxsize=500, workers=2)
+    executor.start()
+    executor.submit(
+        'timeout', lambda: member.timeout(delta),
+        guild_id=guild.id, capability='moderate_members', after=response_future
+    )
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional
+import discord
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class CapabilityCache:
+    """서버별로 봇이 할 수 있는/없는 작업 기록"""
+
+    def __init__(self):
+        self._denied: Dict[int, set] = {}
+
+    def allowed(self, guild_id: Optional[int], capability: Optional[str]) -> bool:
+        """거부된 적이 없으면 True (모르는 경우도 시도해 봄)"""
+        if guild_id is None or capability is None:
+            return True
+        return capability not in self._denied.get(guild_id, ())
+
+    def deny(self, guild_id: int, capability: str):
+        self._denied.setdefault(guild_id, set()).add(capability)
+        metrics.set_gauge('side_effects.denied_guilds', len(self._denied))
+
+    def invalidate(self, guild_id: int):
+        """역할/권한이 바뀌면 해당 서버 기록 삭제"""
+        if self._denied.pop(guild_id, None) is not None:
+            metrics.inc('side_effects.cache_invalidated')
+            metrics.set_gauge('side_effects.denied_guilds', len(self._denied))
+
+
+class _Effect:
+    """대기열에 들어간 부수 작업 하나"""
+    __slots__ = ('name', 'factory', 'guild_id', 'capability', 'after', 'enqueued_at')
+
+    def __init__(self, name, factory, guild_id, capability, after):
+        self.name = name
+        self.factory = factory
+        self.guild_id = guild_id
+        self.capability = capability
+        self.after = after
+        self.enqueued_at = time.monotonic()
+
+
+class SideEffectExecutor:
+    """제한된 대기열과 재시도를 갖춘 부수 작업 실행기"""
+
+    def __init__(
+        self,
+        maxsize: int = 500,
+        workers: int = 2,
+        max_retries: int = 3,
+        retry_base: float = 1.0,
+        after_timeout: float = 30.0
+    ):
+        """
+        Args:
+            maxsize: 대기열 최대 크기
+            workers: 동시에 실행할 워커 수
+            max_retries: 일시적 오류 재시도 횟수
+            retry_base: 재시도 대기 기본값 (초, 시도마다 2배)
+            after_timeout: 선행 응답을 기다리는 최대 시간 (초)
+        """
+        self.capabilities = CapabilityCache()
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+        self.after_timeout = after_timeout
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._tasks = []
+
+    def submit(
+        self,
+        name: str,
+        factory: Callable[[], Awaitable],
+        guild_id: Optional[int] = None,
+        capability: Optional[str] = None,
+        after: Optional[Awaitable] = None
+    ) -> bool:
+        """
+        부수 작업 등록
+
+        Args:
+            name: 지표용 작업 이름
+            factory: 실행할 코루틴을 만드는 함수 (재시도마다 다시 호출)
+            guild_id: 권한 캐시를 적용할 서버 ID
+            capability: 필요한 권한 이름 (예: 'moderate_members')
+            after: 이 작업보다 먼저 끝나야 하는 응답 (예: 전송 대기열 Future)
+
+        Returns:
+            등록되었으면 True, 권한 없음이 캐시되어 있거나 대기열이 가득 차면 False
+        """
+        if not self.capabilities.allowed(guild_id, capability):
+            metrics.inc('side_effects.skipped', labels={'name': name})
+            return False
+
+        try:
+            self._queue.put_nowait(_Effect(name, factory, guild_id, capability, after))
+        except asyncio.QueueFull:
+            metrics.inc('side_effects.dropped', labels={'name': name})
+            logger.warning(f"부수 작업 대기열이 가득 차 버림: {name}")
+            return False
+
+        metrics.set_gauge('side_effects.queue_depth', self._queue.qsize())
+        return True
+
+    # === 실행 ===
+
+    def start(self):
+        """워커 시작 (실행 중인 이벤트 루프 필요)"""
+        self._tasks = [t for t in self._tasks if not t.done()]
+        while len(self._tasks) < self.workers:
+            self._tasks.append(
+                asyncio.create_task(self._worker(), name=f'side-effects-{len(self._tasks)}')
+            )
+
+    async def stop(self):
+        """워커 중지 (남은 작업은 버림)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self):
+        while True:
+            effect = await self._queue.get()
+            metrics.set_gauge('side_effects.queue_depth', self._queue.qsize())
+            try:
+                await self._run(effect)
+            except Exception as e:
+                metrics.inc('side_effects.failed', labels={'name': effect.name})
+                logger.error(f"부수 작업 오류 ({effect.name}): {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, effect: _Effect):
+        """선행 응답을 기다린 뒤 재시도 정책에 따라 실행"""
+        if effect.after is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(effect.after), self.after_timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        labels = {'name': effect.name}
+        metrics.observe('side_effects.queue_latency_seconds', time.monotonic() - effect.enqueued_at, labels=labels)
+
+        for attempt in range(self.max_retries + 1):
+            # 대기하는 동안 다른 작업이 권한 없음을 확인했을 수 있음
+            if not self.capabilities.allowed(effect.guild_id, effect.capability):
+                metrics.inc('side_effects.skipped', labels=labels)
+                return
+
+            try:
+                await effect.factory()
+                metrics.inc('side_effects.succeeded', labels=labels)
+                return
+            except discord.Forbidden:
+                if effect.guild_id is not None and effect.capability is not None:
+                    self.capabilities.deny(effect.guild_id, effect.capability)
+                metrics.inc('side_effects.forbidden', labels=labels)
+                return
+            except discord.NotFound:
+                metrics.inc('side_effects.not_found', labels=labels)
+                return
+            except discord.RateLimited as e:
+                delay = e.retry_after
+            except discord.HTTPException as e:
+                if e.status < 500:
+                    metrics.inc('side_effects.failed', labels=labels)
+                    logger.warning(f"부수 작업 실패 ({effect.name}): {e}")
+                    return
+                delay = self.retry_base * (2 ** attempt)
+
+            if attempt < self.max_retries:
+                metrics.inc('side_effects.retried', labels=labels)
+                await asyncio.sleep(delay)
+
+        metrics.inc('side_effects.failed', labels=labels)
+        logger.warning(f"부수 작업 재시도 초과 ({effect.name})")
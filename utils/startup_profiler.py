@@ -0,0 +1,83 @@
+"""
+시작 시간 프로파일러
+
+봇 시작 단계(모듈 임포트, DB 준비, 로그인, 확장 로드, 게이트웨이 연결)별
+소요 시간과 프로세스 시작부터 준비 완료까지의 시간을 기록합니다.
+단계들은 겹쳐서 실행될 수 있으므로 각 단계의 시작/끝 시각을 모두 남깁니다.
+
+준비 완료 시간이 예산을 넘으면 경고를 남기며, `python bot.py --startup-check`로
+실행하면 준비 직후 종료하면서 예산 초과 여부를 종료 코드로 알려 줍니다.
+
+사용 예시:
+    profiler = StartupProfiler(budget=10.0)
+    await profiler.track('db_init', db_manager.init_database())
+    with profiler.phase('imports'):
+        import heavy_module
+    profiler.mark_ready()
+"""
+import logging
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Dict, Optional, Tuple
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    """시작 단계별 소요 시간 기록"""
+
+    def __init__(self, budget: float, origin: Optional[float] = None):
+        """
+        Args:
+            budget: 준비 완료까지 허용할 시간 (초)
+            origin: 측정 기준 시각 (time.perf_counter 값, 기본은 생성 시각)
+        """
+        self.budget = budget
+        self.origin = time.perf_counter() if origin is None else origin
+        self.phases: Dict[str, Tuple[float, float]] = {}
+        self.time_to_ready: Optional[float] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """동기 구간 측정"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started)
+
+    async def track(self, name: str, awaitable: Awaitable):
+        """비동기 작업 측정 (결과를 그대로 반환)"""
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.record(name, started)
+
+    def record(self, name: str, started: float):
+        """started(time.perf_counter 값)부터 지금까지를 한 단계로 기록"""
+        ended = time.perf_counter()
+        self.phases[name] = (started - self.origin, ended - self.origin)
+        metrics.set_gauge('startup.phase_seconds', ended - started, labels={'phase': name})
+
+    @property
+    def over_budget(self) -> bool:
+        return self.time_to_ready is not None and self.time_to_ready > self.budget
+
+    def mark_ready(self) -> Optional[float]:
+        """준비 완료 기록 (재연결 시에는 무시)"""
+        if self.time_to_ready is not None:
+            return None
+
+        self.time_to_ready = time.perf_counter() - self.origin
+        metrics.set_gauge('startup.time_to_ready_seconds', self.time_to_ready)
+
+        for name, (start, end) in sorted(self.phases.items(), key=lambda item: item[1][0]):
+            logger.info(f"  시작 단계 {name}: {start:6.3f}s → {end:6.3f}s ({end - start:.3f}s)")
+
+        if self.over_budget:
+            logger.warning(f"준비 완료까지 {self.time_to_ready:.2f}초 (예산 {self.budget:.2f}초 초과)")
+        else:
+            logger.info(f"준비 완료까지 {self.time_to_ready:.2f}초 (예산 {self.budget:.2f}초)")
+        return self.time_to_ready
@@ -0,0 +1,211 @@
+"""
+계층형 타이머 휠
+
+게임별 마감 시각(턴 타임아웃, 대기실 만료 등)을 하나의 백그라운드 태스크로 관리합니다.
+게임마다 asyncio.sleep 태스크를 띄우는 대신, 틱 단위 슬롯에 타이머를 넣고
+매 틱마다 해당 슬롯만 처리합니다. 등록/취소는 O(1)입니다.
+
+구조:
+    레벨 0: 슬롯 1개 = 1틱
+    레벨 1: 슬롯 1개 = SLOTS틱
+    레벨 N: 슬롯 1개 = SLOTS^N틱
+    상위 레벨 슬롯은 차례가 오면 하위 레벨로 다시 배치(cascade)됩니다.
+
+사용 예시:
+    wheel = TimerWheel(tick=0.5)
+    wheel.start()
+    wheel.arm(('blackjack', game_id), 60, on_turn_timeout, data=turn)
+    wheel.cancel(('blackjack', game_id))
+"""
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+TimerCallback = Callable[[Hashable, Any], Awaitable[None]]
+
+
+class _Timer:
+    """휠에 등록된 타이머 하나"""
+    __slots__ = ('key', 'tick', 'deadline', 'callback', 'data', 'slot')
+
+    def __init__(self, key, tick, deadline, callback, data):
+        self.key = key
+        self.tick = tick
+        self.deadline = deadline
+        self.callback = callback
+        self.data = data
+        self.slot: Optional[Dict] = None
+
+
+class TimerWheel:
+    """계층형 타이머 휠 스케줄러"""
+
+    SLOTS = 64
+    LEVELS = 4  # 0.5초 틱 기준 최대 약 97일
+
+    def __init__(self, tick: float = 0.5):
+        self.tick = tick
+        self._wheels: List[List[Dict[Hashable, _Timer]]] = [
+            [{} for _ in range(self.SLOTS)] for _ in range(self.LEVELS)
+        ]
+        self._timers: Dict[Hashable, _Timer] = {}
+        self._origin = time.monotonic()
+        self._current_tick = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    # === 등록 / 취소 ===
+
+    def arm(self, key: Hashable, delay: float, callback: TimerCallback, data: Any = None):
+        """
+        타이머 등록 (같은 키가 있으면 교체)
+
+        Args:
+            key: 타이머 식별자 (예: ('blackjack', game_id))
+            delay: 만료까지 남은 시간 (초)
+            callback: 만료 시 호출할 코루틴 함수 callback(key, data)
+            data: 콜백에 전달할 값
+        """
+        self.cancel(key, _record=False)
+
+        deadline = time.monotonic() + max(delay, 0)
+        tick = math.ceil((deadline - self._origin) / self.tick)
+        timer = _Timer(key, tick, deadline, callback, data)
+        self._timers[key] = timer
+        self._place(timer)
+
+        metrics.inc('timer_wheel.armed')
+        metrics.set_gauge('timer_wheel.depth', len(self._timers))
+
+    def cancel(self, key: Hashable, _record: bool = True) -> bool:
+        """타이머 취소 (등록되어 있었으면 True)"""
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+
+        del timer.slot[key]
+        timer.slot = None
+
+        if _record:
+            metrics.inc('timer_wheel.cancelled')
+            metrics.set_gauge('timer_wheel.depth', len(self._timers))
+        return True
+
+    def remaining(self, key: Hashable) -> Optional[float]:
+        """만료까지 남은 시간 (초), 없으면 None"""
+        timer = self._timers.get(key)
+        if timer is None:
+            return None
+        return max(timer.deadline - time.monotonic(), 0.0)
+
+    def _place(self, timer: _Timer, earliest: Optional[int] = None):
+        """
+        남은 틱 수에 맞는 레벨/슬롯에 배치
+
+        Args:
+            earliest: 아직 처리되지 않은 가장 이른 틱 (기본: 다음 틱 - 현재 틱 슬롯은 이미 처리됨)
+        """
+        if earliest is None:
+            earliest = self._current_tick + 1
+        ticks_left = timer.tick - self._current_tick
+
+        if ticks_left < self.SLOTS:
+            # 이미 지난 타이머는 다음에 처리될 슬롯에 배치 (처리된 슬롯에 두면 한 바퀴 늦게 만료)
+            slot = self._wheels[0][max(timer.tick, earliest) % self.SLOTS]
+        else:
+            level = 1
+            while level < self.LEVELS - 1 and ticks_left >= self.SLOTS ** (level + 1):
+                level += 1
+
+            span = self.SLOTS ** level
+            if ticks_left >= span * self.SLOTS:
+                # 휠 범위를 넘는 타이머는 최상위 레벨의 가장 먼 슬롯에 두고 재배치 때 다시 계산
+                index = (self._current_tick // span - 1) % self.SLOTS
+            else:
+                index = (timer.tick // span) % self.SLOTS
+            slot = self._wheels[level][index]
+
+        slot[timer.key] = timer
+        timer.slot = slot
+
+    # === 실행 ===
+
+    def start(self):
+        """틱 태스크 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name='timer-wheel')
+
+    async def stop(self):
+        """틱 태스크 중지"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        """틱마다 만료 슬롯 처리 (지연되면 밀린 틱을 몰아서 처리)"""
+        while True:
+            next_tick_at = self._origin + (self._current_tick + 1) * self.tick
+            delay = next_tick_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            target_tick = int((time.monotonic() - self._origin) / self.tick)
+            while self._current_tick < target_tick:
+                self._current_tick += 1
+                self._advance()
+
+    def _advance(self):
+        """현재 틱 처리: 상위 레벨 재배치 후 레벨 0 슬롯 만료"""
+        for level in range(1, self.LEVELS):
+            span = self.SLOTS ** level
+            if self._current_tick % span:
+                break
+            slot = self._wheels[level][(self._current_tick // span) % self.SLOTS]
+            if slot:
+                timers = list(slot.values())
+                slot.clear()
+                for timer in timers:
+                    # 레벨 0의 현재 틱 슬롯은 재배치 직후에 처리
+                    self._place(timer, earliest=self._current_tick)
+
+        slot = self._wheels[0][self._current_tick % self.SLOTS]
+        if not slot:
+            return
+
+        expired = []
+        for timer in list(slot.values()):
+            if timer.tick <= self._current_tick:
+                del slot[timer.key]
+                del self._timers[timer.key]
+                timer.slot = None
+                expired.append(timer)
+
+        now = time.monotonic()
+        for timer in expired:
+            metrics.inc('timer_wheel.fired')
+            metrics.observe('timer_wheel.lateness_seconds', max(now - timer.deadline, 0.0))
+            asyncio.create_task(self._invoke(timer))
+
+        metrics.set_gauge('timer_wheel.depth', len(self._timers))
+
+    async def _invoke(self, timer: _Timer):
+        """만료 콜백 실행 (예외는 로그만 남김)"""
+        try:
+            await timer.callback(timer.key, timer.data)
+        except Exception as e:
+            metrics.inc('timer_wheel.callback_errors')
+            logger.error(f"타이머 콜백 오류 ({timer.key}): {e}", exc_info=True)